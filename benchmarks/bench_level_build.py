@@ -0,0 +1,54 @@
+"""
+Benchmark building large random levels with the LevelGenerator.
+
+Builds random levels of N rooms, on square levels with a side of --cell tiles
+per room along each side unless --side is given, and reports the time taken
+to build each, with the rooms and hallways checked for overlaps as when a level
+is first loaded, and without as when it is built from the compiled level
+cache, to check building a level stays linear in its number of tiles.
+
+Usage: python -m benchmarks.bench_level_build [--rooms 256 1024 4096] [--cell 16] [--side N]
+"""
+import argparse
+import math
+import time
+
+from src.Game.level_generator import LevelGenerator
+from benchmarks.levels import random_level_json
+
+def build_ms(level_json, validate):
+	"""
+	Build the level with the given validation
+
+	Returns
+	-------
+	float
+		Milliseconds taken to build the level
+	"""
+	start = time.perf_counter()
+	LevelGenerator(level_json, compact=True, validate=validate)
+	return (time.perf_counter() - start) * 1000
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--rooms', type=int, nargs='+', default=[256, 1024, 4096])
+	parser.add_argument('--cell', type=int, default=16)
+	parser.add_argument('--side', type=int, default=None)
+	parser.add_argument('--seed', type=int, default=0)
+	args = parser.parse_args()
+
+	print(f"{'rooms':>6} {'side':>6} {'level tiles':>12} {'validated ms':>13} {'us/tile':>8} "
+		f"{'unvalidated ms':>15}")
+	for num_rooms in args.rooms:
+		side = args.side or math.ceil(math.sqrt(num_rooms)) * args.cell
+		level_json = random_level_json(num_rooms, side, side, seed=args.seed)
+		tiles = sum(room['bounds']['rows'] * room['bounds']['columns'] for room in level_json['rooms'])
+		tiles += sum(abs(hallway['to'][0] - hallway['from'][0]) + abs(hallway['to'][1] - hallway['from'][1])
+			for hallway in level_json['hallways'])
+		validated = build_ms(level_json, validate=True)
+		unvalidated = build_ms(level_json, validate=False)
+		print(f"{num_rooms:>6} {side:>6} {tiles:>12} {validated:>13.1f} "
+			f"{validated * 1000 / tiles:>8.2f} {unvalidated:>15.1f}")
+
+if __name__ == '__main__':
+	main()
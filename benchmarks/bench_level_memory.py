@@ -0,0 +1,51 @@
+"""
+Benchmark the memory used by the tiles of a large generated level.
+
+Builds square grids of rooms spread far apart, so most of the level is empty
+walls, and measures the memory allocated building each Level with
+tracemalloc, for the nested list of tiles and for the compact TileGrid. Also
+measures the memory each further game on the level holds, playing on the
+level's shared template.
+
+Usage: python -m benchmarks.bench_level_memory [--sizes 8 16] [--gap 12]
+"""
+import argparse
+import tracemalloc
+
+from src.Game.level import Level, LevelTemplate
+from benchmarks.levels import grid_level_json
+
+def level_memory(level_json, compact):
+	"""
+	Build a level and measure the memory it holds once built
+
+	Returns
+	-------
+	(Level, int)
+		The level and the bytes allocated building it that are still in use
+	"""
+	tracemalloc.start()
+	level = Level(level_json, compact)
+	used, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	return level, used
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--sizes', type=int, nargs='+', default=[8, 16])
+	parser.add_argument('--gap', type=int, default=12)
+	args = parser.parse_args()
+
+	print(f"{'rooms':>6} {'tiles':>8} {'nested MB':>10} {'bytes/tile':>11} {'compact MB':>11} "
+		f"{'bytes/tile':>11} {'per game KB':>12}")
+	for size in args.sizes:
+		level_json = grid_level_json(size, gap=args.gap)
+		level, nested = level_memory(level_json, compact=False)
+		_, compact = level_memory(level_json, compact=True)
+		_, per_game = level_memory(LevelTemplate(level_json), compact=False)
+		tiles = len(level.get_all_tiles()) * len(level.get_all_tiles()[0])
+		print(f"{size * size:>6} {tiles:>8} {nested / 1e6:>10.2f} {nested / tiles:>11.1f} "
+			f"{compact / 1e6:>11.2f} {compact / tiles:>11.1f} {per_game / 1e3:>12.1f}")
+
+if __name__ == '__main__':
+	main()
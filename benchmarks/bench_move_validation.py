@@ -0,0 +1,74 @@
+"""
+Benchmark the cost of validating moves as levels grow.
+
+Builds random levels of N by N rooms, 16 tiles per room along each side, and
+times the RuleChecker validating zombie moves and actor placements, and
+choosing a random free tile for a teleporting ghost. The "scan" column times the tile_in_room lookup
+as it was implemented before the region index, searching each room's tiles,
+for comparison.
+
+Usage: python -m benchmarks.bench_move_validation [--sizes 2 4 8 12]
+"""
+import argparse
+import random
+import time
+
+from src.Adversary.local_zombie import LocalZombie
+from src.Game.level import Level
+from src.Game.rule_checker import RuleChecker
+from benchmarks.levels import random_level_json
+
+def time_per_call(func, args_list, repeat=3):
+	"""
+	Time the best average cost of calling func with each of the arguments
+
+	Returns
+	-------
+	float
+		Microseconds per call
+	"""
+	best = None
+	for _ in range(repeat):
+		start = time.perf_counter()
+		for args in args_list:
+			func(*args)
+		elapsed = time.perf_counter() - start
+		best = elapsed if best is None else min(best, elapsed)
+	return best / len(args_list) * 1e6
+
+def scan_tile_in_room(level, row, col):
+	tile = level.get_tile(row, col)
+	for room in level._rooms:
+		if tile in room.get_tiles():
+			return room
+	return None
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--sizes', type=int, nargs='+', default=[2, 4, 8, 12])
+	parser.add_argument('--seed', type=int, default=0)
+	args = parser.parse_args()
+
+	print(f"{'rooms':>6} {'tiles':>8} {'adversary move us':>18} {'placement us':>13} "
+		f"{'teleport us':>12} {'scan us':>9}")
+	for size in args.sizes:
+		level = Level(random_level_json(size * size, size * 16, size * 16, seed=args.seed), compact=True)
+		rule_checker = RuleChecker(level)
+		rand = random.Random(0)
+		zombie = LocalZombie('zombie')
+		row, col = level.get_random_free_position(rand)
+		zombie.update_position(row, col)
+		# Every tile next to the zombie, and the placeable tiles of the first rooms
+		moves = [(zombie, row + d_row, col + d_col) for d_row, d_col in ((1, 0), (-1, 0), (0, 1), (0, -1))]
+		positions = [(pos,) for pos in sorted(level.get_template().get_placeable()[1])[:200]]
+
+		move_us = time_per_call(rule_checker.adversary_move_result, moves * 50)
+		place_us = time_per_call(rule_checker.allowed_actor_placement, positions)
+		teleport_us = time_per_call(level.get_random_free_position, [(rand,)] * 1000)
+		scan_us = time_per_call(lambda pos: scan_tile_in_room(level, pos[0], pos[1]), positions[:20], repeat=1)
+		height, width = level.get_dimensions()
+		print(f"{size * size:>6} {height * width:>8} {move_us:>18.2f} {place_us:>13.2f} "
+			f"{teleport_us:>12.2f} {scan_us:>9.1f}")
+
+if __name__ == '__main__':
+	main()
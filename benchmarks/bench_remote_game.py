@@ -0,0 +1,109 @@
+"""
+Benchmark a headless game of Snarl played over localhost sockets.
+
+Starts a server with the given engine and connects scripted clients that make
+random single tile moves, then reports how many turns per second the server
+plays. Server output is suppressed.
+
+Usage: python -m benchmarks.bench_remote_game [--engine asyncio] [--players 2]
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import socket
+import threading
+import time
+
+from src.Remote.server import Server
+from src.Remote.transport import FramedSocket
+from src.utils import parse_levels
+
+def scripted_client(name, port, seed, moves):
+	"""
+	Play as a remote player, moving to a random walkable tile next to the
+	player on each move request
+
+	Parameters
+	----------
+	name : str
+		Name to register with
+	port : int
+		Port the server listens on
+	seed : int
+		Seed for the client's moves
+	moves : List[int]
+		Single item list the number of moves requested is added to
+	"""
+	rand = random.Random(seed)
+	conn = FramedSocket(socket.create_connection(('127.0.0.1', port)))
+	update = None
+
+	while True:
+		try:
+			req = json.loads(conn.receive())
+		except ConnectionError:
+			return
+
+		if req == 'identify':
+			conn.send(json.dumps('player'))
+		elif req == 'name':
+			conn.send(json.dumps(name))
+		elif req == 'move':
+			moves[0] += 1
+			row, col = update['position']
+			# Walkable neighbours in the 5x5 layout centered on the player
+			options = [(row + d_row, col + d_col) 
+				for d_row, d_col in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1))
+				if update['layout'][2 + d_row][2 + d_col] != 0]
+			conn.send(json.dumps({"type": "move", "to": rand.choice(options)}))
+		elif isinstance(req, dict) and req.get('type') == 'player-update':
+			update = req
+
+def run(levels, engine, players, port, seed):
+	"""
+	Run one game and return the elapsed time and moves requested per player
+
+	Returns
+	-------
+	(float, List[int])
+		Seconds the game took and moves requested from each player
+	"""
+	server = Server('127.0.0.1', port, levels, max_players=players, timeout=5,
+		engine=engine)
+	server_thread = threading.Thread(target=server.run)
+	moves = [[0] for _ in range(players)]
+	clients = [threading.Thread(target=scripted_client, 
+		args=(f'bench{i}', port, seed + i, moves[i])) for i in range(players)]
+
+	with contextlib.redirect_stdout(io.StringIO()):
+		server_thread.start()
+		time.sleep(0.2)
+		start = time.perf_counter()
+		for client in clients:
+			client.start()
+		server_thread.join()
+		elapsed = time.perf_counter() - start
+		for client in clients:
+			client.join()
+
+	return elapsed, [m[0] for m in moves]
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(allow_abbrev=False)
+	parser.add_argument("--levels", type=str, default='resources/snarl.levels')
+	parser.add_argument("--engine", type=str, choices=["thread", "asyncio"],
+						default="thread")
+	parser.add_argument("--players", type=int, choices=[1, 2, 3, 4], default=2)
+	parser.add_argument("--port", type=int, default=45700)
+	parser.add_argument("--seed", type=int, default=0)
+	args = parser.parse_args()
+
+	elapsed, moves = run(parse_levels(args.levels), args.engine, args.players,
+		args.port, args.seed)
+	# Every player is asked for a move once per turn while they are active
+	turns = max(moves)
+	print(f'engine={args.engine} players={args.players} turns={turns} '
+		f'moves={sum(moves)} seconds={elapsed:.3f} '
+		f'turns/sec={turns / elapsed:.1f}')
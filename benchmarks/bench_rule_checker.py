@@ -0,0 +1,81 @@
+"""
+Benchmark how many moves the RuleChecker validates per second.
+
+Validates every move in reach of a player and a zombie placed in a level, with
+one rule checker kept for the level as the GameManager does, in batches of
+every tile in reach with player_move_results and adversary_move_results, and
+with a new rule checker created for every move for comparison.
+
+Usage: python -m benchmarks.bench_rule_checker [--rooms-per-side 4] [--moves 200000]
+"""
+import argparse
+import time
+
+from src.Adversary.local_zombie import LocalZombie
+from src.Game.level import Level
+from src.Game.rule_checker import RuleChecker
+from src.Player.test_player import TestPlayer
+from benchmarks.levels import grid_level_json
+
+def moves_per_sec(validate, moves):
+	"""
+	Validate each of the moves with the given function
+
+	Returns
+	-------
+	float
+		Moves validated per second
+	"""
+	start = time.perf_counter()
+	for actor, row, col in moves:
+		validate(actor, row, col)
+	return len(moves) / (time.perf_counter() - start)
+
+def batch_moves_per_sec(validate, actor, candidates, num_moves):
+	"""
+	Validate the candidates in batches with the given function, until num_moves are validated
+
+	Returns
+	-------
+	float
+		Moves validated per second
+	"""
+	batches = num_moves // len(candidates) + 1
+	start = time.perf_counter()
+	for _ in range(batches):
+		validate(actor, candidates)
+	return batches * len(candidates) / (time.perf_counter() - start)
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--rooms-per-side', type=int, default=4)
+	parser.add_argument('--moves', type=int, default=200000)
+	args = parser.parse_args()
+
+	level = Level(grid_level_json(args.rooms_per_side))
+	player = TestPlayer('player', moves=[])
+	zombie = LocalZombie('zombie')
+	for actor, pos in ((player, (2, 3)), (zombie, (3, 4))):
+		actor.update_position(pos[0], pos[1])
+		level.add_person(actor, pos[0], pos[1])
+
+	player_moves = [(player, 2 + d_row, 3 + d_col) for d_row in range(-2, 3)
+		for d_col in range(-2, 3) if abs(d_row) + abs(d_col) <= 2]
+	zombie_moves = [(zombie, 3 + d_row, 4 + d_col) for d_row, d_col in ((1, 0), (-1, 0), (0, 1), (0, -1))]
+
+	rule_checker = RuleChecker(level)
+	print(f"{'actor':>8} {'shared moves/s':>15} {'batched moves/s':>16} {'per move moves/s':>17}")
+	for name, moves, method in (('player', player_moves, 'player_move_result'),
+		('zombie', zombie_moves, 'adversary_move_result')):
+		actor = moves[0][0]
+		batched = batch_moves_per_sec(getattr(rule_checker, method + 's'), actor,
+			[(row, col) for _, row, col in moves], args.moves)
+		moves = (moves * (args.moves // len(moves) + 1))[:args.moves]
+		shared = moves_per_sec(getattr(rule_checker, method), moves)
+		# Building the checker scans the level, so only time a sample of moves
+		per_move = moves_per_sec(lambda actor, row, col:
+			getattr(RuleChecker(level), method)(actor, row, col), moves[:200])
+		print(f"{name:>8} {shared:>15.0f} {batched:>16.0f} {per_move:>17.0f}")
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,66 @@
+"""
+Benchmark serializing game states as levels grow.
+
+Builds random levels of N rooms with players and zombies placed in them, and
+times building and encoding the (state) sent to observers and adversaries,
+reusing the cached encoding of the level as the game does, and encoding the
+whole state with json.dumps for comparison. Also times building and encoding
+a player update, which only covers the tiles around the player.
+
+Usage: python -m benchmarks.bench_state [--rooms 16 256 4096] [--actors 8]
+"""
+import argparse
+import json
+import math
+import random
+import time
+
+from src.Adversary.local_zombie import LocalZombie
+from src.Game.level import Level
+from src.Player.test_player import TestPlayer
+from src.utils import encode_state, build_player_update
+from benchmarks.levels import random_level_json
+
+def time_per_call(func, repeat):
+	"""
+	Time the average cost of calling func
+
+	Returns
+	-------
+	float
+		Microseconds per call
+	"""
+	start = time.perf_counter()
+	for _ in range(repeat):
+		func()
+	return (time.perf_counter() - start) / repeat * 1e6
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--rooms', type=int, nargs='+', default=[16, 256, 4096])
+	parser.add_argument('--actors', type=int, default=8)
+	parser.add_argument('--repeat', type=int, default=200)
+	parser.add_argument('--seed', type=int, default=0)
+	args = parser.parse_args()
+
+	print(f"{'rooms':>6} {'state KB':>9} {'cached state us':>16} {'json.dumps us':>14} "
+		f"{'player update us':>17}")
+	for num_rooms in args.rooms:
+		side = math.ceil(math.sqrt(num_rooms)) * 16
+		level = Level(random_level_json(num_rooms, side, side, seed=args.seed), compact=True)
+		rand = random.Random(args.seed)
+		actors = [TestPlayer(f'player{i}', moves=[]) for i in range(args.actors // 2)]
+		actors += [LocalZombie(f'zombie{i}') for i in range(args.actors - len(actors))]
+		for actor in actors:
+			row, col = level.get_random_free_position(rand)
+			actor.update_position(row, col)
+			level.add_person(actor, row, col)
+
+		state_kb = len(encode_state(level.build_state())) / 1e3
+		cached_us = time_per_call(lambda: encode_state(level.build_state()), args.repeat)
+		dumps_us = time_per_call(lambda: json.dumps(level.build_state()), max(1, args.repeat // 10))
+		update_us = time_per_call(lambda: json.dumps(build_player_update(actors[0], level)), args.repeat)
+		print(f"{num_rooms:>6} {state_kb:>9.1f} {cached_us:>16.1f} {dumps_us:>14.1f} {update_us:>17.1f}")
+
+if __name__ == '__main__':
+	main()
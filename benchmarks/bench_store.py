@@ -0,0 +1,60 @@
+"""
+Benchmark concurrent player registration against a name and score store.
+
+Starts one thread per registration, all reserving names at once, with every
+name requested twice so half the reservations must fail. Reports registrations
+per second and checks each name was reserved exactly once.
+
+Usage: python -m benchmarks.bench_store [--store sqlite] [--registrations 1000]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from src.Store.memory_store import MemoryStore
+from src.Store.sqlite_store import SQLiteStore
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--store', choices=['memory', 'sqlite'], default='memory')
+	parser.add_argument('--registrations', type=int, default=1000)
+	args = parser.parse_args()
+
+	tmp_dir = tempfile.TemporaryDirectory()
+	if args.store == 'sqlite':
+		store = SQLiteStore(os.path.join(tmp_dir.name, 'scores.db'))
+	else:
+		store = MemoryStore()
+
+	names = [f'player{i // 2}' for i in range(args.registrations)]
+	reserved = []
+	start_barrier = threading.Barrier(args.registrations + 1)
+
+	def register(name):
+		start_barrier.wait()
+		if store.reserve_name(name):
+			reserved.append(name)
+			store.add_scores([{"type": "player-score", "name": name, "exits": 0, "ejects": 1, "keys": 0}])
+
+	threads = [threading.Thread(target=register, args=(name,)) for name in names]
+	for t in threads:
+		t.start()
+	start_barrier.wait()
+	start = time.perf_counter()
+	for t in threads:
+		t.join()
+	elapsed = time.perf_counter() - start
+
+	scores = store.get_scores()
+	store.close()
+	tmp_dir.cleanup()
+
+	assert sorted(reserved) == sorted(set(names)), 'A name was reserved more than once'
+	assert len(scores) == len(reserved)
+	print(f'store={args.store} registrations={args.registrations} reserved={len(reserved)} '
+		f'seconds={elapsed:.3f} registrations/sec={args.registrations / elapsed:.1f}')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,5 @@
+"""
+Synthetic levels for benchmarks, sized by the number of rooms rather than read
+from a levels file.
+"""
+from src.Game.synthetic_levels import grid_level_json, random_level_json
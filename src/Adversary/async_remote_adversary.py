@@ -0,0 +1,109 @@
+import json
+
+from ..Common.abstract_adversary import AbstractAdversary
+from ..Adversary.local_zombie import LocalZombie
+from ..Adversary.local_ghost import LocalGhost 
+from ..Game.state import State
+from ..utils import encode_state
+
+class AsyncRemoteAdversary(AbstractAdversary):
+	"""
+	Remote adversary for the asyncio server engine, facilitating sending and
+	recieving messages from the remote adversary client over an AsyncConnection
+
+	Parameters
+	----------
+	conn : AsyncConnection
+		Connection to the client
+	"""
+	def __init__(self, conn):
+		self._conn = conn
+		super().__init__(name=None, adv_type=None, damage=None)
+
+	def update_state(self, state_update: dict):
+		"""
+		Updates the adversary's knowledge of the game state
+		"""
+		if isinstance(state_update, State):
+			state_update = state_update.get_json()
+		self._send(encode_state(state_update))
+	
+	async def request_move(self):
+		"""
+		Requests a move from the adversary
+
+		Returns
+		-------
+		(int, int)
+			Row and column index to move to
+		"""
+		self._send(json.dumps("move"))
+		move = await self._receive()
+		as_json = json.loads(move)
+		return as_json['to']
+	
+	def declare_type(self, adversary_type):
+		"""
+		Changes the adversary type to Ghost or Zombie, declares damage, updates
+		client with adversary type
+
+		Parameters
+		----------
+		adversary_type : str
+			Type of adversary to assume
+		"""
+		self._actor_type = adversary_type
+
+		if adversary_type == "zombie":
+			self._damage = LocalZombie().get_damage()
+		elif adversary_type == "ghost":
+			self._damage = LocalGhost().get_damage()
+		else:
+			raise ValueError(f"{adversary_type} is an invalid adversary type.")
+
+		msg = json.dumps({
+			"type": "declare-adversary", 
+			"adversary-type": adversary_type,
+			"name": self._name})
+		self._send(msg)
+	
+	def send_message(self, msg):
+		"""
+		Encodes the given message and sends it to the client
+
+		Parameters
+		----------
+		msg : dict or str
+			JSON message to send to player
+		"""
+		self._send(json.dumps(msg))
+	
+	def _send(self, msg):
+		"""
+		Queues the message to be written to the client
+
+		Parameters
+		----------
+		msg : str
+			Message to send to client
+		"""
+		self._conn.send(msg)
+	
+	async def _receive(self):
+		"""
+		Recieve a message from the client
+
+		Returns
+		----------
+		str
+			Message recieved from client
+		"""
+		return await self._conn.receive()
+	
+	def disconnect(self):
+		"""
+		Close the actors connection once queued messages are written. Unlike
+		the threaded remote actors this does not exit, as that would stop every
+		game on the event loop
+		"""
+		self._conn.close()
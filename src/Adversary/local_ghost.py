@@ -10,9 +10,14 @@ class LocalGhost(AbstractAdversary):
 	----------
 	name : str
 		Name of the adversary
+	rand : random.Random, default None
+		Random number generator for the name, the game's own so games with the
+		same seed play out the same
 	"""
-	def __init__(self, name=None):
-		super().__init__(name, adv_type='ghost', damage=40)
+	__slots__ = ()
+
+	def __init__(self, name=None, rand=None):
+		super().__init__(name, adv_type='ghost', damage=40, rand=rand)
 	
 	def update_state(self, state):
 		"""
@@ -20,13 +25,13 @@ class LocalGhost(AbstractAdversary):
 
 		Parameters
 		----------
-		state : state-dict
-			(state) JSON object
+		state : state-dict or State
+			(state) JSON object, or a State built from it
 		"""
-		self._state = State(state)
+		self._state = state if isinstance(state, State) else State(state)
 
 		# Locate this adversaries location in the level and update its position
-		for adversary in state['adversaries']:
+		for adversary in self._state.get_json()['adversaries']:
 			if adversary['name'] == self._name:
 				self._row = adversary['position'][0]
 				self._col = adversary['position'][1]
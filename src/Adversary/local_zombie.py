@@ -1,6 +1,5 @@
 from ..Common.abstract_adversary import AbstractAdversary
 from ..Game.state import State
-import random
 
 
 class LocalZombie(AbstractAdversary):
@@ -12,9 +11,14 @@ class LocalZombie(AbstractAdversary):
 	----------
 	name : str
 		Name of the adversary
+	rand : random.Random, default None
+		Random number generator for the name and random moves, the game's own
+		so games with the same seed play out the same
 	"""
-	def __init__(self, name=None):
-		super().__init__(name, adv_type='zombie', damage=60)
+	__slots__ = ()
+
+	def __init__(self, name=None, rand=None):
+		super().__init__(name, adv_type='zombie', damage=60, rand=rand)
 	
 	def update_state(self, state):
 		"""
@@ -22,12 +26,12 @@ class LocalZombie(AbstractAdversary):
 
 		Parameters
 		----------
-		state : state-dict
-			(state) JSON object
+		state : state-dict or State
+			(state) JSON object, or a State built from it
 		"""
-		self._state = State(state)
+		self._state = state if isinstance(state, State) else State(state)
 		# Locate this adversaries location in the level and update its position
-		for adversary in state['adversaries']:
+		for adversary in self._state.get_json()['adversaries']:
 			if adversary['name'] == self._name:
 				self._row = adversary['position'][0]
 				self._col = adversary['position'][1]
@@ -50,7 +54,7 @@ class LocalZombie(AbstractAdversary):
 		player_in_room_pos = self._state.players_in_room(self.get_position())
 		# No player in room, random move
 		if player_in_room_pos == []:
-			return random.choice(valid_moves)
+			return self._rand.choice(valid_moves)
 		# Player in room, move closer to them
 		else:
 			closest = None
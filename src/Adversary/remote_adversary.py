@@ -1,10 +1,11 @@
 import json
-import time
 import sys 
 
 from ..Common.abstract_adversary import AbstractAdversary
 from ..Adversary.local_zombie import LocalZombie
 from ..Adversary.local_ghost import LocalGhost 
+from ..Game.state import State
+from ..utils import encode_state
 
 class RemoteAdversary(AbstractAdversary):
 	"""
@@ -13,18 +14,20 @@ class RemoteAdversary(AbstractAdversary):
 
 	Parameters
 	----------
-	sock : socket.SocketType
-		Socket connection of remote adversary connection
+	conn : FramedSocket
+		Framed socket connection of remote adversary connection
 	"""
-	def __init__(self, sock):
-		self._socket = sock
+	def __init__(self, conn):
+		self._conn = conn
 		super().__init__(name=None, adv_type=None, damage=None)
 
 	def update_state(self, state_update: dict):
 		"""
 		Updates the adversary's knowledge of the game state
 		"""
-		self._send(json.dumps(state_update))
+		if isinstance(state_update, State):
+			state_update = state_update.get_json()
+		self._send(encode_state(state_update))
 	
 	def request_move(self):
 		"""
@@ -67,18 +70,19 @@ class RemoteAdversary(AbstractAdversary):
 	
 	def send_message(self, msg):
 		"""
-		Sends the given message to the client
+		Encodes the given message and sends it to the client
 
 		Parameters
 		----------
-		msg : str
-			Message to send to player
+		msg : dict or str
+			JSON message to send to player
 		"""
-		self._send(msg)
+		self._send(json.dumps(msg))
 	
 	def _send(self, msg):
 		"""
-		Sends the message to the connection
+		Queues the message to be sent to the connection, it is sent with
+		any other queued messages on the next flush or receive
 
 		Parameters
 		----------
@@ -87,11 +91,18 @@ class RemoteAdversary(AbstractAdversary):
 		"""
 		# Attempt to send message to client, disconnect if client shut down
 		try:
-			self._socket.send(msg.encode())
-		except ConnectionResetError:
+			self._conn.send(msg)
+		except ConnectionError:
+			self.disconnect()
+
+	def flush(self):
+		"""
+		Writes all queued messages to the client in one send
+		"""
+		try:
+			self._conn.flush()
+		except ConnectionError:
 			self.disconnect()
-		
-		time.sleep(1)
 	
 	def _receive(self):
 		"""
@@ -104,18 +115,13 @@ class RemoteAdversary(AbstractAdversary):
 		"""
 		# Attempt to recieve message, disconnect if client shut down
 		try:
-			data = self._socket.recv(4096)
-		except ConnectionResetError:
-			self.disconnect()
-		# Server sent empty bytes, disconnect signal
-		if not data:
+			return self._conn.receive()
+		except ConnectionError:
 			self.disconnect()
-		response = data.decode()
-		return response
 	
 	def disconnect(self):
 		"""
 		Close the actors socket, if remotely connected
 		"""
-		self._socket.close()
+		self._conn.close()
 		sys.exit()
\ No newline at end of file
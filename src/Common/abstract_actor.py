@@ -9,6 +9,8 @@ class AbstractActor(ABC):
 	name : str
 		name of the actor
 	"""
+	__slots__ = ('_name', '_actor_type', '_row', '_col')
+
 	def __init__(self, name, actor_type):
 		self._name = name
 		self._actor_type = actor_type
@@ -102,6 +104,12 @@ class AbstractActor(ABC):
 		}
 		return actor_position_json
 	
+	def flush(self):
+		"""
+		Send any messages queued for the actor, if remotely connected
+		"""
+		pass
+
 	def disconnect(self):
 		"""
 		Close the actors socket, if remotely connected
@@ -4,10 +4,14 @@ from ..Game.state import State
 import random
 
 class AbstractAdversary(AbstractActor):
-	def __init__(self, name, adv_type, damage):
+	__slots__ = ('_damage', '_rand', '_state')
+
+	def __init__(self, name, adv_type, damage, rand=None):
 		self._damage = damage
+		# Random number generator for the adversary's name and moves
+		self._rand = random.Random() if rand is None else rand
 		if name is None:
-			self._name = str(random.randint(1,1000000))
+			self._name = str(self._rand.randint(1,1000000))
 		else:
 			self._name = name
 		self._state = None
@@ -19,11 +23,11 @@ class AbstractAdversary(AbstractActor):
 
 		Parameters
 		----------
-		state : dict
+		state : dict or State
 			JSON object containing state data such as the level, players, 
-			adversaries, and exit status
+			adversaries, and exit status, or a State built from it
 		"""
-		self._state = State(state)
+		self._state = state if isinstance(state, State) else State(state)
 	
 	def get_damage(self):
 		"""
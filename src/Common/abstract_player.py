@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
 from .abstract_actor import AbstractActor
+from ..utils import apply_player_update_delta
 
 class AbstractPlayer(AbstractActor):
+	__slots__ = ('_player_state', '_ejected', '_exited', '_times_exited', '_times_ejected',
+		'_keys_found', '_health')
+
 	def __init__(self, name):
 		self._player_state = None
 		self._ejected = False
@@ -14,8 +18,11 @@ class AbstractPlayer(AbstractActor):
 	
 	def update_state(self, state: dict):
 		"""
-		Updates the players knowledge of the game state
+		Updates the players knowledge of the game state, applying the update
+		to the last one received if it is a player-update-delta
 		"""
+		if state.get("type") == "player-update-delta":
+			state = apply_player_update_delta(self._player_state, state)
 		self._player_state = state
 
 	@abstractmethod
@@ -39,8 +46,8 @@ class AbstractPlayer(AbstractActor):
 
 		Parameters
 		----------
-		msg : str
-			Message to be sent
+		msg : dict or str
+			JSON message to be sent, remote players encode it before sending
 		"""
 		pass
 	
@@ -0,0 +1,195 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+import asyncio
+import queue
+import threading
+
+from ..Store.leaderboard import Leaderboard
+
+class AbstractStore(ABC):
+	"""
+	Server wide store of the player names in use and the scores of every finished game.
+
+	Every read and write is run by a single writer thread, in the order they are submitted,
+	so games in different threads (or on the asyncio event loop) never race on the store and
+	need no locks of their own. The writer thread is started by the first operation.
+	Subclasses implement the operations, which are only ever called from the writer thread.
+
+	Parameters
+	----------
+	leaderboard_size : int, default 10
+		Number of top scores to keep for each leaderboard
+	"""
+	def __init__(self, leaderboard_size=10):
+		self._leaderboard = Leaderboard(leaderboard_size)
+		self._requests = queue.SimpleQueue()
+		self._writer = None
+		self._start_lock = threading.Lock()
+		self._closed = False
+
+	def _write_loop(self):
+		"""
+		Run each submitted operation in order until the store is closed
+		"""
+		# If the store cannot be opened, every operation fails with the same error
+		try:
+			self._open()
+			# Rank the scores already in the store
+			for score in self._get_scores():
+				self._leaderboard.add(score)
+			open_error = None
+		except Exception as e:
+			open_error = e
+
+		while True:
+			request = self._requests.get()
+			if request is None:
+				break
+			future, func, args = request
+			if not future.set_running_or_notify_cancel():
+				continue
+			try:
+				if open_error is not None:
+					raise open_error
+				future.set_result(func(*args))
+			except Exception as e:
+				future.set_exception(e)
+
+		if open_error is None:
+			self._close()
+
+	def _submit(self, func, *args):
+		"""
+		Submit an operation to be ran by the writer thread
+
+		Returns
+		-------
+		Future
+			Future for the result of the operation
+		"""
+		if self._closed:
+			raise ValueError("Cannot use store, it has been closed.")
+		if self._writer is None:
+			with self._start_lock:
+				if self._writer is None:
+					self._writer = threading.Thread(target=self._write_loop, daemon=True)
+					self._writer.start()
+
+		future = Future()
+		self._requests.put((future, func, args))
+		return future
+
+	def reserve_name(self, name):
+		"""
+		Atomically reserve the given player name, if it is not already in use
+
+		Parameters
+		----------
+		name : str
+			Name to reserve
+
+		Returns
+		-------
+		bool
+			Whether the name was reserved
+		"""
+		return self._submit(self._reserve_name, name).result()
+
+	async def reserve_name_async(self, name):
+		"""
+		Coroutine version of reserve_name, which does not block the event loop
+		"""
+		return await asyncio.wrap_future(self._submit(self._reserve_name, name))
+
+	def add_scores(self, scores):
+		"""
+		Append the scores of a finished game and rank them
+
+		Parameters
+		----------
+		scores : List[dict]
+			(player-score) JSON object of each player in the game
+
+		Returns
+		-------
+		List[dict]
+			Rank of each score for each leaderboard metric
+		"""
+		return self._submit(self._rank_scores, scores).result()
+
+	async def add_scores_async(self, scores):
+		"""
+		Coroutine version of add_scores, which does not block the event loop
+		"""
+		return await asyncio.wrap_future(self._submit(self._rank_scores, scores))
+
+	def _rank_scores(self, scores):
+		self._add_scores(scores)
+		for score in scores:
+			self._leaderboard.add(score)
+		return [self._leaderboard.get_rank(score) for score in scores]
+
+	def get_leaderboard(self):
+		"""
+		Retrieves the top scores for each leaderboard metric and the number of scores ranked
+
+		Returns
+		-------
+		(dict, int)
+			List of top (player-score) JSON objects for each metric, best first, and the
+			number of scores in the store
+		"""
+		return self._submit(self._top_scores).result()
+
+	async def get_leaderboard_async(self):
+		"""
+		Coroutine version of get_leaderboard, which does not block the event loop
+		"""
+		return await asyncio.wrap_future(self._submit(self._top_scores))
+
+	def _top_scores(self):
+		return self._leaderboard.get_top(), self._leaderboard.get_count()
+
+	def get_scores(self):
+		"""
+		Retrieves the scores of every finished game, in the order they were added
+
+		Returns
+		-------
+		List[dict]
+			(player-score) JSON objects
+		"""
+		return self._submit(self._get_scores).result()
+
+	def close(self):
+		"""
+		Finish every submitted operation and stop the writer thread
+		"""
+		self._closed = True
+		if self._writer is not None and self._writer.is_alive():
+			self._requests.put(None)
+			self._writer.join()
+
+	def _open(self):
+		"""
+		Prepare the store, called from the writer thread before any operation
+		"""
+		pass
+
+	def _close(self):
+		"""
+		Release the store, called from the writer thread after the last operation
+		"""
+		pass
+
+	@abstractmethod
+	def _reserve_name(self, name):
+		pass
+
+	@abstractmethod
+	def _add_scores(self, scores):
+		pass
+
+	@abstractmethod
+	def _get_scores(self):
+		pass
@@ -1,13 +1,28 @@
-import json
+import asyncio
+from concurrent.futures import Future
+import inspect
 import random
 import math
-import os.path
+import threading
 
-from .level import Level
+from .level import Level, LevelTemplate
 from ..Adversary.local_zombie import LocalZombie
 from ..Adversary.local_ghost import LocalGhost
+from .move_result import MoveCode
 from .rule_checker import RuleChecker
-from ..utils import build_player_update, send_level_start, send_end_level
+from .state import State
+from ..Store.memory_store import MemoryStore
+from ..utils import build_player_update, build_player_update_delta, \
+	send_level_start, send_end_level
+
+async def _resolve(value):
+	"""
+	Await the value if an actor returned an awaitable, otherwise return it as is.
+	Lets the same actor API be served by blocking and asyncio backed actors
+	"""
+	if inspect.isawaitable(value):
+		return await value
+	return value
 
 class GameManager:
 	"""
@@ -15,45 +30,137 @@ class GameManager:
 
 	Parameters
 	----------
-	levels : List[level_json]
-		List of levels representing the levels the players must progress through
+	levels : List[level_json] or List[LevelTemplate]
+		List of levels representing the levels the players must progress through,
+		given as templates when the levels are shared with other games
 	start_level_num : int, default 1
 		Level to start on, first level is level 1
 	combat : bool, default False
 		Whether or not use the HP system, if false players ejected on adversary
 		contact
 	seed : int, default None
-		Seed to use for randomization of tiles for actor placement
+		Seed of the game's random number generator, used for actor placement,
+		teleports and local adversaries, so games with the same seed play out
+		the same
 	local : bool, default False
-		Whether game is being ran without server
+		Whether game is being ran without server, local games keep names and
+		scores in their own in-memory store and cannot be given one
 	game_id : int, default 0
 		ID to used to distinguish game
+	delta_updates : bool, default False
+		Whether to only update players whose view changed after a move, with a
+		player-update-delta of the fields that changed
+	compact : bool, default False
+		Whether to store level tiles in a compact TileGrid, for very large levels.
+		Unused for levels given as templates.
+	store : AbstractStore, default None
+		Store of names and scores shared by every game on the server, the game
+		uses its own in-memory store if not given
+	verbose : bool, default True
+		Whether to print the progress of the game
+	max_turns : int, default None
+		Max number of turns to play in a level before it ends, as if every
+		active player was ejected. Levels have no limit if not given
+	prefetch : bool, default False
+		Whether to build the next level in a background thread while the
+		current level is played. Levels are otherwise built when reached.
+		Levels given as templates are never prefetched, since building them
+		only creates their objects
 	"""
 	def __init__(self, level_jsons, start_level_num=1, combat=False, seed=None, 
-	local=False, game_id = 0):
+	local=False, game_id = 0, delta_updates=False, compact=False, store=None,
+	verbose=True, max_turns=None, prefetch=False):
 		if start_level_num < 1 or start_level_num > len(level_jsons):
 			raise ValueError("Invalid level start number.")
 
-		self._levels = [Level(level_json) for level_json in level_jsons]
+		# Levels are built when the game reaches them
+		self._level_jsons = level_jsons
+		self._compact = compact
+		self._prefetch = prefetch
+		self._prefetched = None # Level number and future of the level being prefetched
 		self._level_num = start_level_num
 		self._players = [] # Players registered
 		self._adversaries = [] # Adversaries in current level
 		self._remote_adversaries = [] # Remote adversaries registered
 		self._observers = [] # Observers
 		self._game_in_progress = False # Whether game is in progress
-		self._current_level = self._levels[start_level_num - 1]
+		self._current_level = self._build_level(start_level_num)
 		self._combat = combat
 		self._seed = seed
+		self._rand = random.Random(seed) # Source of all randomness in the game
 		self._id = game_id
-
-		# If game is being ran without server, need to reset server_log file
-		if local:
-			server_data = {"player_names": [], "player_scores": []}
-			server_log_path = os.path.join(os.getcwd(), 'src/server_log.json')
-			with open(server_log_path, 'w') as server_file:
-				json.dump(server_data, server_file)
-		print(f'Game {self._id}: Intialized')
+		self._delta_updates = delta_updates
+		self._sent_updates = {} # Last update each player has, this level
+		self._changed_positions = set() # Positions changed since last update
+		self._layout_level = None # Level the shared adversary layout was built for
+		self._layout = None # Layout shared by the states given to adversaries
+		self._rule_checker = None # Rule checker of the current level
+		self._verbose = verbose
+		self._max_turns = max_turns
+		self._level_turns = 0 # Turns played in the current level
+		self._turns = 0 # Turns played in the game
+
+		# If game is being ran without server, it does not share a store
+		if local and store is not None:
+			raise ValueError("Local games cannot share a store.")
+		self._owns_store = store is None
+		self._store = MemoryStore() if self._owns_store else store
+		self._log('Intialized')
 	
+	def _log(self, msg):
+		"""
+		Prints the message about the game, unless the game is not verbose
+
+		Parameters
+		----------
+		msg : str
+			Message to print
+		"""
+		if self._verbose:
+			print(f'Game {self._id}: {msg}')
+
+	def _build_level(self, level_num):
+		"""
+		Builds the given level, or waits for it if it is being prefetched
+
+		Parameters
+		----------
+		level_num : int
+			Number of the level to build, first level is level 1
+
+		Returns
+		-------
+		Level
+			The built level
+		"""
+		if self._prefetched is not None and self._prefetched[0] == level_num:
+			future = self._prefetched[1]
+			self._prefetched = None
+			return future.result()
+		return Level(self._level_jsons[level_num - 1], self._compact)
+
+	def _prefetch_next_level(self):
+		"""
+		Starts building the next level in a background thread, if prefetching and there is a
+		next level to build from JSON. Any error building it is raised when the game reaches
+		the level.
+		"""
+		if not self._prefetch or self._level_num >= len(self._level_jsons):
+			return
+		if isinstance(self._level_jsons[self._level_num], LevelTemplate):
+			return
+
+		future = Future()
+		level_json = self._level_jsons[self._level_num]
+		def build():
+			try:
+				future.set_result(Level(level_json, self._compact))
+			except Exception as e:
+				future.set_exception(e)
+
+		threading.Thread(target=build, daemon=True).start()
+		self._prefetched = (self._level_num + 1, future)
+
 	def register_player(self, player):
 		"""
 		Registers the player to the game
@@ -63,6 +170,47 @@ class GameManager:
 		player : AbstractPlayer
 			Player to register
 		"""
+		self._welcome(player)
+
+		# Ask player up to 5 times for unique name
+		for _ in range(5):
+			# Request name
+			name = player.get_name(first_time=True)
+
+			if self._store.reserve_name(name):
+				self._add_player(player, name)
+				return True
+
+	async def register_player_async(self, player):
+		"""
+		Registers the player to the game, awaiting the player's name if it is
+		supplied by a coroutine (asyncio server engine)
+
+		Parameters
+		----------
+		player : AbstractPlayer
+			Player to register
+		"""
+		self._welcome(player)
+
+		# Ask player up to 5 times for unique name
+		for _ in range(5):
+			# Request name
+			name = await _resolve(player.get_name(first_time=True))
+
+			if await self._store.reserve_name_async(name):
+				self._add_player(player, name)
+				return True
+
+	def _welcome(self, player):
+		"""
+		Ensures the player can join the game and sends them the welcome message
+
+		Parameters
+		----------
+		player : AbstractPlayer
+			Player attempting to register
+		"""
 		if self._game_in_progress:
 			raise ValueError('Cannot add player, game in progress')
 		if len(self._players) >= 4:
@@ -71,29 +219,21 @@ class GameManager:
 		# Send a welcome message to the player
 		github = "https://github.ccs.neu.edu/CS4500-S21/Londorthel/"
 		server_welcome = {"type": "welcome", "info": github}
-		player.send_message(json.dumps(server_welcome))
-
-		# Open server log to get names in use across server
-		server_log_path = os.path.join(os.getcwd(), 'src/server_log.json')
-		with open(server_log_path) as server_file:
-			server_data = json.load(server_file)
-
-		# Ask player up to 5 times for unique name
-		for _ in range(5):
-			# Request name
-			name = player.get_name(first_time=True)
+		player.send_message(server_welcome)
 
-			# Check if name is unique
-			if name not in server_data['player_names']:
-				self._players.append(player)
+	def _add_player(self, player, name):
+		"""
+		Adds the player to the game, once their name has been reserved
 
-				server_data['player_names'].append(name)
-				# Add name to the server log
-				with open(server_log_path, 'w') as server_file:
-					json.dump(server_data, server_file)
-				
-				print(f'Game {self._id}: {name} Added')
-				return True
+		Parameters
+		----------
+		player : AbstractPlayer
+			Player being registered
+		name : str
+			Name reserved by the player
+		"""
+		self._players.append(player)
+		self._log(f'{name} Added')
 	
 	def register_adversary(self, adversary):
 		"""
@@ -106,7 +246,7 @@ class GameManager:
 			Adversary to register
 		"""
 		self._remote_adversaries.append(adversary)
-		print(f'Game {self._id}: Remote Adversary Added')
+		self._log('Remote Adversary Added')
 	
 	def register_observer(self, observer):
 		"""
@@ -122,22 +262,60 @@ class GameManager:
 	def play_game(self):
 		"""
 		Starts the level and continues gameplay by prompting actors to provide
-		a move until the level is over
+		a move until the level is over, then moves on to the next level until
+		the game is over
+		"""
+		while True:
+			self._start_level()
+			# Continue gameplay until level is over
+			while not self._is_level_over():
+				self._play_turn()
+				self._level_turns += 1
+				self._turns += 1
+			send_end_level(self._players, self._current_level.who_unlocked())
+			self._flush_actors()
+			# Level is over, decide what to do next
+			if not self._next_level():
+				self.end_game()
+				return
+
+	async def play_game_async(self):
+		"""
+		Coroutine version of play_game used by the asyncio server engine. Any
+		actor method that returns an awaitable (remote actors backed by asyncio
+		streams) is awaited, so the event loop is free while waiting on clients
+		"""
+		while True:
+			self._start_level()
+			# Continue gameplay until level is over
+			while not self._is_level_over():
+				await self._play_turn_async()
+				self._level_turns += 1
+				self._turns += 1
+			send_end_level(self._players, self._current_level.who_unlocked())
+			self._flush_actors()
+			# Level is over, decide what to do next
+			if not self._next_level():
+				await self.end_game_async()
+				return
+
+	def _start_level(self):
+		"""
+		Places all actors in the current level and sends out the level start
+		messages and initial updates
 		"""
 		self._game_in_progress = True
 		# Place all players and actors in new level
 		self._place_actors()
+		self._prefetch_next_level()
 		# Send level start JSONS
 		send_level_start(self._players, self._level_num)
-		# Issue updates to all players and observers
+		# Issue updates to all players and observers, starting from full updates
+		self._sent_updates = {}
+		self._level_turns = 0
 		self.update_observers()
 		self.update_players()
-		# Continue gameplay until level is over
-		while not self._is_level_over():
-			self._play_turn()
-		send_end_level(self._players, self._current_level.who_unlocked())
-		# Level is over, decide what to do next
-		self._next_level()
+		self._flush_actors()
 	
 	def _play_turn(self):
 		"""
@@ -153,51 +331,150 @@ class GameManager:
 			# Ask the player for up to 5 moves before skipping
 			for _ in range(5):
 				move = player.request_move()
-				move_result = self.move_player(player, move[0], move[1])
-				player.send_message(json.dumps(move_result))
-				print(f'Game {self._id}: {player.get_name()} move to {move} ({move_result})')
-
-				if move_result not in ('Nonexistent', 'Invalid'):
-					self.update_players()
-					self.update_observers()
+				if self._handle_player_move(player, move):
 					break
 		
 		for adversary in self._adversaries:
 			if self._is_level_over():
 				return
-			adversary.update_state(self._current_level.build_state())
+			adversary.update_state(self._build_adversary_state())
 			for _ in range(5):
 				move = adversary.request_move()
-				move_result = self.move_adversary(adversary, move[0], move[1])
-				print(f'Game {self._id}: {adversary.get_name()} move to {move} ({move_result})')
+				if self._handle_adversary_move(adversary, move):
+					break
 
-				if move_result not in ('Nonexistent', 'Invalid'):
-					self.update_players()
-					self.update_observers()
+	async def _play_turn_async(self):
+		"""
+		Coroutine version of _play_turn, awaiting moves from actors that supply
+		them asynchronously
+		"""
+		for player in self._players:
+			if self._is_level_over():
+				return
+			if not player.is_active():
+				continue
+			
+			# Ask the player for up to 5 moves before skipping
+			for _ in range(5):
+				move = await _resolve(player.request_move())
+				if self._handle_player_move(player, move):
+					break
+		
+		for adversary in self._adversaries:
+			if self._is_level_over():
+				return
+			adversary.update_state(self._build_adversary_state())
+			for _ in range(5):
+				move = await _resolve(adversary.request_move())
+				if self._handle_adversary_move(adversary, move):
 					break
+
+	def _build_adversary_state(self):
+		"""
+		Builds the state of the current level for adversaries. Rooms and hallways never
+		change within a level, so the layout is built once per level and shared by
+		every state.
+
+		Returns
+		-------
+		State
+			Read only state of the current level
+		"""
+		state_json = self._current_level.build_state()
+		if self._layout_level is not self._current_level:
+			self._layout = State(state_json).get_layout()
+			self._layout_level = self._current_level
+		return State(state_json, self._layout)
+
+	def _get_rule_checker(self):
+		"""
+		Retrieves the rule checker for the current level, creating it the first time it is
+		needed in each level
+
+		Returns
+		-------
+		RuleChecker
+			Rule checker validating moves in the current level
+		"""
+		if self._rule_checker is None or self._rule_checker.get_level() is not self._current_level:
+			self._rule_checker = RuleChecker(self._current_level, self._combat)
+		return self._rule_checker
+
+	def _handle_player_move(self, player, move):
+		"""
+		Applies the player's requested move and issues updates if it was valid
+
+		Parameters
+		----------
+		player : AbstractPlayer
+			Player that requested the move
+		move : (int, int)
+			Row and column index to move to
+
+		Returns
+		-------
+		bool
+			Whether the move was valid and the player's turn is over
+		"""
+		move_result = self.move_player(player, move[0], move[1])
+		# Players are sent the message for the result
+		player.send_message(str(move_result))
+		# Only build the message if it is printed, moves are the hot path
+		if self._verbose:
+			self._log(f'{player.get_name()} move to {move} ({move_result})')
+
+		if not move_result.is_valid():
+			return False
+
+		self.update_players()
+		self.update_observers()
+		self._flush_actors()
+		return True
+
+	def _handle_adversary_move(self, adversary, move):
+		"""
+		Applies the adversary's requested move and issues updates if it was
+		valid
+
+		Parameters
+		----------
+		adversary : AbstractAdversary
+			Adversary that requested the move
+		move : (int, int)
+			Row and column index to move to
+
+		Returns
+		-------
+		bool
+			Whether the move was valid and the adversary's turn is over
+		"""
+		move_result = self.move_adversary(adversary, move[0], move[1])
+		if self._verbose:
+			self._log(f'{adversary.get_name()} move to {move} ({move_result})')
+
+		if not move_result.is_valid():
+			return False
+
+		self.update_players()
+		self.update_observers()
+		self._flush_actors()
+		return True
 	
 	def _place_actors(self):
 		"""
 		Places all of the players and creates adversaries to be added to valid
 		tiles
 		"""
-		self._adversaries = self._get_adversaries()	
-		tile_pos = [t.get_position() for t in self._current_level.get_tiles()]
-		random.Random(self._seed).shuffle(tile_pos)
-		
+		level = self._current_level
+		self._adversaries = self._get_adversaries()
+
+		# Each actor takes a random free tile, so placing does not scan the level
 		for actor in self._players + self._adversaries:
-			rule_checker = RuleChecker(self._current_level, self._combat)
-			while True:
-				try:
-					rand_pos = tile_pos.pop(0)
-				except:
-					raise ValueError('Not enough tiles to place actors.')
-
-				if rule_checker.allowed_actor_placement(rand_pos):
-					actor.update_position(rand_pos[0], rand_pos[1])
-					tile = self._current_level.get_tile(rand_pos[0], rand_pos[1])
-					tile.add_person(actor)
-					break
+			rand_pos = level.get_random_free_position(self._rand)
+			if rand_pos is None:
+				raise ValueError('Not enough tiles to place actors.')
+			actor.update_position(rand_pos[0], rand_pos[1])
+			level.add_person(actor, rand_pos[0], rand_pos[1])
 	
 	def _get_adversaries(self):
 		num_zombies = math.floor(self._level_num / 2 + 1)
@@ -210,9 +487,9 @@ class GameManager:
 				remote_adversary.declare_type(adversaries[i])
 				actor_to_add = remote_adversary
 			elif adversaries[i] == 'zombie':
-				actor_to_add = LocalZombie()
+				actor_to_add = LocalZombie(rand=self._rand)
 			else:
-				actor_to_add = LocalGhost()
+				actor_to_add = LocalGhost(rand=self._rand)
 			
 			adversaries[i] = actor_to_add
 
@@ -225,34 +502,103 @@ class GameManager:
 		# Retrieve all player scores in this game
 		player_scores = [p.get_player_score_json() for p in self._players]
 
-		# Retrieve scores from other games
-		server_log_path = os.path.join(os.getcwd(), 'src/server_log.json')
-		with open(server_log_path, 'r') as server_file:
-			server_data = json.load(server_file)
-		
-		# Add this games scores and output new file
-		server_data['player_scores'] += player_scores
-		with open(server_log_path, 'w') as server_file:
-			json.dump(server_data, server_file)
+		# Add this games scores to the scores from other games, and rank them
+		ranks = self._store.add_scores(player_scores)
+		leaderboards, total = self._store.get_leaderboard()
+		if self._owns_store:
+			self._store.close()
+
+		self._send_end_game(player_scores, ranks, leaderboards, total)
+
+	async def end_game_async(self):
+		"""
+		Coroutine version of end_game used by the asyncio server engine, awaiting the
+		store so the event loop is free while the scores are added
+		"""
+		player_scores = [p.get_player_score_json() for p in self._players]
 
+		ranks = await self._store.add_scores_async(player_scores)
+		leaderboards, total = await self._store.get_leaderboard_async()
+		if self._owns_store:
+			# Closing waits for the writer thread to finish
+			await asyncio.get_running_loop().run_in_executor(None, self._store.close)
+
+		self._send_end_game(player_scores, ranks, leaderboards, total)
+
+	def _send_end_game(self, player_scores, ranks, leaderboards, total):
+		"""
+		Sends every player the end game JSON and the server scores, then disconnects the
+		players and remote adversaries
+
+		Parameters
+		----------
+		player_scores : List[dict]
+			(player-score) JSON object of each player in the game
+		ranks : List[dict]
+			Rank of each player's score for each leaderboard metric
+		leaderboards : dict
+			Top scores for each leaderboard metric
+		total : int
+			Number of scores in the store
+		"""
 		end_game_json = {"type": "end-game", "scores": player_scores}
-		server_scores_json = {
-			"type": "server-scores", 
-			"scores": server_data['player_scores']
-		}
 		 
-		for p in self._players:
-			p.send_message(json.dumps(end_game_json))
-			p.send_message(json.dumps(server_scores_json))
+		for p, rank in zip(self._players, ranks):
+			server_scores_json = {
+				"type": "server-scores", 
+				"leaderboards": leaderboards,
+				"rank": rank,
+				"total": total
+			}
+			p.send_message(end_game_json)
+			p.send_message(server_scores_json)
+
+		# Send the queued messages before disconnecting, which exits
+		self._flush_actors()
 		
 		# Disconnect all players
 		for actor in self._players + self._remote_adversaries:
 			actor.disconnect()
 
+	def get_level_num(self):
+		"""
+		Retrieves the number of the current level, first level is level 1
+
+		Returns
+		-------
+		int
+			Current level number
+		"""
+		return self._level_num
+
+	def get_turns(self):
+		"""
+		Retrieves the number of turns played in the game
+
+		Returns
+		-------
+		int
+			Number of turns played
+		"""
+		return self._turns
+
+	def _flush_actors(self):
+		"""
+		Sends every message queued for remote actors, so a move result and the
+		updates that follow it go out together
+		"""
+		for actor in self._players + self._remote_adversaries:
+			actor.flush()
+
 	def _next_level(self):
 		"""
-		Progresses the game at the end of the level by either moving to the 
-		next level or ending the game
+		Progresses the game at the end of the level by moving to the next level,
+		if there is one to play
+
+		Returns
+		-------
+		bool
+			Whether there is another level to play, the game should be ended if not
 		"""
 		successful = False
 
@@ -263,27 +609,30 @@ class GameManager:
 		
 		# All players ejected, game over
 		if not successful:
-			print(f'Game {self._id}: Game over, unsuccessful')
-			self.end_game()
+			self._log('Game over, unsuccessful')
+			return False
 		# A player exited and it was the last level
-		elif self._level_num == len(self._levels):
-			print(f'Game {self._id}: Game over, successful')
-			self.end_game()
+		elif self._level_num == len(self._level_jsons):
+			self._log('Game over, successful')
+			return False
 		# A player exited, move to next level:
 		else:
-			print(f'Game {self._id}: Level {self._level_num} complete')
+			self._log(f'Level {self._level_num} complete')
 			self._level_num += 1
-			self._current_level = self._levels[self._level_num - 1]
+			self._current_level = self._build_level(self._level_num)
 
 			for player in self._players:
 				player.return_to_game()
 
-			self.play_game()
+			return True
 			
 	def _is_level_over(self):
 		"""
-		Determines if a level is over (all players ejected or exited)
+		Determines if a level is over (all players ejected or exited, or the
+		max number of turns played)
 		"""
+		if self._max_turns is not None and self._level_turns >= self._max_turns:
+			return True
 		for player in self._players:
 			if player.is_active():
 				return False
@@ -291,13 +640,65 @@ class GameManager:
 	
 	def update_players(self):
 		"""
-		Update all the players
+		Update all the players. With delta updates, only players whose view
+		contains a position that changed since the last update are updated
 		"""
 		for player in self._players:
 			if not player.is_active():
 				continue
-			player_update = build_player_update(player, self._current_level)
+			if self._delta_updates:
+				self._update_player_delta(player)
+			else:
+				player_update = build_player_update(player, self._current_level)
+				player.update_state(player_update)
+
+		self._changed_positions = set()
+
+	def _update_player_delta(self, player):
+		"""
+		Sends the player the fields of their update that changed since the last
+		update they were sent, or a full update if they have none this level
+
+		Parameters
+		----------
+		player : AbstractPlayer
+			Player to update
+		"""
+		previous = self._sent_updates.get(player)
+		if previous is not None and not self._view_changed(player.get_position()):
+			return
+
+		player_update = build_player_update(player, self._current_level)
+		self._sent_updates[player] = player_update
+
+		if previous is None:
 			player.update_state(player_update)
+		else:
+			delta = build_player_update_delta(previous, player_update)
+			if delta is not None:
+				player.update_state(delta)
+
+	def _view_changed(self, pos, radius=2):
+		"""
+		Determines whether any position changed since the last update is in
+		view of the given position
+
+		Parameters
+		----------
+		pos : (int, int)
+			Row and column index at the center of the view
+		radius : int
+			Horizontal and vertical radius of the view
+		
+		Returns
+		-------
+		bool
+			Whether a changed position is within the view
+		"""
+		for changed in self._changed_positions:
+			if abs(changed[0] - pos[0]) <= radius and abs(changed[1] - pos[1]) <= radius:
+				return True
+		return False
 	
 	def move_player(self, player, row, col):
 		"""
@@ -311,41 +712,46 @@ class GameManager:
 			row index of the tile to move to
 		col : int
 			col index of the tile to move to
+
+		Returns
+		-------
+		MoveResult
+			Result of the move
 		"""
-		rule_checker = RuleChecker(self._current_level, self._combat)
-		move_result = rule_checker.player_move_result(player, row, col)
+		move_result = self._get_rule_checker().player_move_result(player, row, col)
 		
 		# The player does not exist in the game, or it is an invalid point
-		if move_result in ('Nonexistent', 'Invalid'):
+		if not move_result.is_valid():
 			return move_result
 
-		from_tile = self._current_level.get_tile(player.get_row(), player.get_col())
-		to_tile = self._current_level.get_tile(row, col)
+		level = self._current_level
+		code = move_result.code
+		self._changed_positions.update((player.get_position(), (row, col)))
 		
 		# Player was ejected, remove them from their tile, and update status
-		if move_result == 'Eject':
-			from_tile.remove_person()
+		if code == MoveCode.EJECT:
+			level.remove_person(player.get_row(), player.get_col())
 			player.eject()
 		# Player has exited, remove them from their tile, and update status
-		elif move_result == 'Exit':
-			from_tile.remove_person()
+		elif code == MoveCode.EXIT:
+			level.remove_person(player.get_row(), player.get_col())
 			player.exit()
 		# Player landed on key, remove key, unlock exit, update player and tile
-		elif move_result == 'Key':
-			self._current_level.remove_key(player.get_name())
-			self._current_level.unlock_exit()
-			from_tile.remove_person()
-			to_tile.add_person(player)
+		elif code == MoveCode.KEY:
+			level.remove_key(player.get_name())
+			level.unlock_exit()
+			player.found_key()
+			level.remove_person(player.get_row(), player.get_col())
+			level.add_person(player, row, col)
 			player.update_position(row, col)
 		# Other valid move, update player and tile
-		elif move_result == 'OK':
-			from_tile.remove_person()
-			to_tile.add_person(player)
+		elif code == MoveCode.OK:
+			level.remove_person(player.get_row(), player.get_col())
+			level.add_person(player, row, col)
 			player.update_position(row, col)
 		# Player recieved damage, remain on tile update health
-		elif 'Damage' in move_result:
-			amount = int(move_result.split('-')[-1])
-			player.reduce_health(amount)
+		elif code == MoveCode.DAMAGE:
+			player.reduce_health(move_result.damage)
 
 		return move_result
 	
@@ -366,46 +772,41 @@ class GameManager:
 		
 		Returns
 		-------
-		str
+		MoveResult
 			Result of the move
 		"""
-		rule_checker = RuleChecker(self._current_level, self._combat)
-		move_result = rule_checker.adversary_move_result(adversary, row, col)
+		move_result = self._get_rule_checker().adversary_move_result(adversary, row, col)
 
 		# The player does not exist in the game, or it is an invalid point
-		if move_result in ('Nonexistent', 'Invalid'):
+		if not move_result.is_valid():
 			return move_result
 		
-		from_tile = self._current_level.get_tile(adversary.get_row(), adversary.get_col())
-		to_tile = self._current_level.get_tile(row, col)
+		level = self._current_level
+		code = move_result.code
+		self._changed_positions.update((adversary.get_position(), (row, col)))
 
 		# Adversary landed on player
-		if move_result == 'Eject':
-			to_tile.get_person().eject()
-			to_tile.remove_person()
-			to_tile.add_person(adversary)
-			from_tile.remove_person()
+		if code == MoveCode.EJECT:
+			level.remove_person(row, col).eject()
+			level.remove_person(adversary.get_row(), adversary.get_col())
+			level.add_person(adversary, row, col)
 			adversary.update_position(row, col)
 		# Adversary dealt damage to player
-		elif 'Damage' in move_result:
-			amount = int(move_result.split('-')[-1])
-			to_tile.get_person().reduce_health(amount)
+		elif code == MoveCode.DAMAGE:
+			level.get_person(row, col).reduce_health(move_result.damage)
 		# Valid move
-		elif move_result == 'OK':
-			from_tile.remove_person()
-			to_tile.add_person(adversary)
+		elif code == MoveCode.OK:
+			level.remove_person(adversary.get_row(), adversary.get_col())
+			level.add_person(adversary, row, col)
 			adversary.update_position(row, col)
 		# Adversary is ghost, moved to wall, needs to teleport
-		elif move_result == 'Teleport':
-			tile_pos = [t.get_position() for t in self._current_level.get_tiles()]
-			random.Random().shuffle(tile_pos)
-
-			for p in tile_pos:
-				if rule_checker.allowed_actor_placement(p):
-					from_tile.remove_person()
-					self._current_level.get_tile(p[0], p[1]).add_person(adversary)
-					adversary.update_position(p[0], p[1])
-					break
+		elif code == MoveCode.TELEPORT:
+			p = level.get_random_free_position(self._rand)
+			if p is not None:
+				level.remove_person(adversary.get_row(), adversary.get_col())
+				level.add_person(adversary, p[0], p[1])
+				adversary.update_position(p[0], p[1])
+				self._changed_positions.add(p)
 		
 		return move_result
 	
@@ -414,7 +815,7 @@ class GameManager:
 		Update all observers
 		"""
 		for observer in self._observers:
-			print(f'GAME {self._id}: VIEW')
+			self._log('VIEW')
 			observer.update_state(self._current_level.build_state())
 
 
@@ -85,13 +85,10 @@ class Hallway:
 				for x in range(leftmost + 1, rightmost):
 					all_points.append((point[0], x))
 
-		all_points += self._waypoints
-		all_tiles = [Space(pt[0], pt[1]) for pt in all_points]
-
-		for tile in all_tiles:
-			if all_tiles.count(tile) > 1:
-				raise ValueError('Hallway overlaps with itself.')
-		return all_tiles
+		all_points += [tuple(pt) for pt in self._waypoints]
+		if len(set(all_points)) != len(all_points):
+			raise ValueError('Hallway overlaps with itself.')
+		return [Space(pt[0], pt[1]) for pt in all_points]
 
 	def _calculate_dimensions(self):
 		"""
@@ -1,21 +1,299 @@
+from array import array
+
 from .level_generator import LevelGenerator
+from .tile import Tile, Wall, VOID_WALL
+from .tile_grid import TILE_CODES
+from ..utils import CachedJSON
+
+class CompiledLevel(dict):
+	"""
+	Level JSON which has already been built into a valid Level, along with the flat arrays
+	of the built level, as loaded from a level cache. Building a Level from it skips
+	validating the level and building its arrays.
+
+	Parameters
+	----------
+	level_json : dict
+		JSON representation of the level
+	height : int
+		Number of rows in the level
+	width : int
+		Number of columns in the level
+	types : bytes
+		Type code of each tile, indexed by row * width + col
+	regions : array
+		Region id of each tile, indexed by row * width + col
+	"""
+	def __init__(self, level_json, height, width, types, regions):
+		super().__init__(level_json)
+		self.height = height
+		self.width = width
+		self.types = types
+		self.regions = regions
+
+class LevelTemplate:
+	"""
+	Geometry of a Snarl level, its tiles, rooms, hallways and region index, which never
+	changes during a game. A template is built once and shared by every Level played on it,
+	which each only hold their own actors, keys and exits, so it must not be mutated.
+
+	Parameters
+	----------
+	level_json : dict
+		JSON representation of the level, or a CompiledLevel
+	compact : bool
+		Whether to store the tiles in a compact TileGrid instead of a nested list of Tiles,
+		intended for very large levels
+	"""
+	def __init__(self, level_json, compact=False):
+		compiled = isinstance(level_json, CompiledLevel)
+		level_generator = LevelGenerator(level_json, compact, validate=not compiled)
+		self._objects = level_json['objects'] # Objects each game starts with
+		self._tiles = level_generator.get_whole_level()
+		self._rooms = sorted(level_generator.get_rooms())
+		self._hallways = level_generator.get_hallways()
+		self._height = len(self._tiles)
+		self._width = len(self._tiles[0]) if self._height else 0
+		self._regions = level_json.regions if compiled else self._build_region_index()
+		self._types = bytes(level_json.types) if compiled else None # Built when first needed
+		self._room_mask = None # Built when first needed
+		self._placeable_list = tuple(self._build_placeable()) # Room spaces actors can be placed on
+		self._placeable_index = {pos: i for i, pos in enumerate(self._placeable_list)}
+		self._rooms_json = [room.get_JSON() for room in self._rooms]
+		self._hallways_json = [hallway.get_JSON() for hallway in self._hallways]
+
+	def _build_region_index(self):
+		"""
+		Builds a flat array holding the region id of every tile in the level, where 0 is no
+		region, ids 1 to the number of rooms are the rooms in order, and the following ids are
+		the hallways in order. Rooms and hallways never overlap, so each tile has at most one.
+
+		Returns
+		-------
+		array
+			Region id of each tile, indexed by row * width + col
+		"""
+		num_regions = len(self._rooms) + len(self._hallways)
+		# Use the smallest element size that fits every region id
+		typecode = 'B' if num_regions < 2 ** 8 else 'H' if num_regions < 2 ** 16 else 'L'
+		regions = array(typecode, bytes(array(typecode).itemsize * self._height * self._width))
+
+		for region_id, room in enumerate(self._rooms, 1):
+			for row in range(room.get_row(), room.get_row() + room.get_height()):
+				start = row * self._width + room.get_col()
+				regions[start:start + room.get_width()] = array(typecode, [region_id] * room.get_width())
+
+		for region_id, hallway in enumerate(self._hallways, len(self._rooms) + 1):
+			for tile in hallway.get_tiles():
+				regions[tile.get_row() * self._width + tile.get_col()] = region_id
+
+		return regions
+
+	def _build_placeable(self):
+		"""
+		Finds the space tiles inside of rooms, the only tiles actors can be placed on
+
+		Returns
+		-------
+		set
+			Row and column index of each placeable tile
+		"""
+		placeable = set()
+		for room in self._rooms:
+			for row in range(room.get_row(), room.get_row() + room.get_height()):
+				for col in range(room.get_col(), room.get_col() + room.get_width()):
+					if self._tiles[row][col].get_type() == 'space':
+						placeable.add((row, col))
+		return placeable
+
+	def get_objects(self):
+		"""
+		Retrieves the JSON of the keys and exits each game on the level starts with
+
+		Returns
+		-------
+		List[dict]
+			JSON representation of each object
+		"""
+		return self._objects
+
+	def get_placeable(self):
+		"""
+		Retrieves the space tiles inside of rooms, the only tiles actors can be placed on
+
+		Returns
+		-------
+		(dict, tuple)
+			Index of each placeable tile in a fixed order, and the row and column index of
+			each placeable tile in that order
+		"""
+		return self._placeable_index, self._placeable_list
+
+	def get_structure_json(self):
+		"""
+		Retrieves the JSON representation of the rooms and hallways of the level
+
+		Returns
+		-------
+		(List[dict], List[dict])
+			JSON of each room and of each hallway
+		"""
+		return self._rooms_json, self._hallways_json
+
+	def get_all_tiles(self):
+		return self._tiles
+
+	def get_rooms(self):
+		return self._rooms
+
+	def get_hallways(self):
+		return self._hallways
+
+	def get_dimensions(self):
+		"""
+		Retrieves the size of the level
+
+		Returns
+		-------
+		(int, int)
+			Number of rows and columns in the level
+		"""
+		return (self._height, self._width)
+
+	def get_type_codes(self):
+		"""
+		Retrieves the type code of every tile in the level, built the first time it is needed.
+		Tiles outside of rooms and hallways are walls, so only their tiles are written. Games
+		racing to build it build the same value, so it needs no lock.
+
+		Returns
+		-------
+		bytes
+			Type code of each tile, indexed by row * width + col
+		"""
+		if self._types is None:
+			types = bytearray(self._height * self._width)
+			for component in self._rooms + self._hallways:
+				for tile in component.get_tiles():
+					types[tile.get_row() * self._width + tile.get_col()] = TILE_CODES[tile.get_type()]
+			self._types = bytes(types)
+		return self._types
+
+	def get_region_index(self):
+		"""
+		Retrieves the region id of every tile in the level, as described in _build_region_index
+
+		Returns
+		-------
+		array
+			Region id of each tile, indexed by row * width + col
+		"""
+		return self._regions
+
+	def get_room_mask(self):
+		"""
+		Retrieves whether each tile in the level is in a room, built the first time it is needed
+
+		Returns
+		-------
+		bytes
+			1 for each tile in a room and 0 otherwise, indexed by row * width + col
+		"""
+		if self._room_mask is None:
+			room_mask = bytearray(self._height * self._width)
+			for room in self._rooms:
+				for row in range(room.get_row(), room.get_row() + room.get_height()):
+					start = row * self._width + room.get_col()
+					room_mask[start:start + room.get_width()] = b'\x01' * room.get_width()
+			self._room_mask = bytes(room_mask)
+		return self._room_mask
+
+class LevelTile(Tile):
+	"""
+	View of a space or door tile of a LevelTemplate as it is in one game. The template's tiles
+	are shared by every game, so the actor, key and exit on the tile are read from the Level.
+	Views are read only, the tile is changed through the Level.
+
+	Parameters
+	----------
+	level : Level
+		Level the tile is viewed in
+	tile : Tile
+		Template tile being viewed
+	"""
+	__slots__ = ('_level', '_tile')
+
+	def __init__(self, level, tile):
+		self._level = level
+		self._tile = tile
+		self._row = tile.get_row()
+		self._col = tile.get_col()
+
+	def get_person(self):
+		return self._level.get_person(self._row, self._col)
+
+	def has_key(self):
+		return self._level.has_key(self._row, self._col)
+
+	def is_exit(self):
+		return self._level.is_exit(self._row, self._col)
+
+	def is_unlocked(self):
+		return self.is_exit() and not self._level.is_locked()
+
+	def get_type(self):
+		return self._tile.get_type()
+
+	def __str__(self):
+		return str(self._tile)
+
+	def __repr__(self):
+		return str(self._tile)
+
+	def __eq__(self, other):
+		if isinstance(other, Tile) and other.get_type() == self.get_type():
+			return self._row == other.get_row() and self._col == other.get_col()
+		return False
 
 class Level:
 	"""
-	Data representation of a Snarl Level.
+	Data representation of a Snarl Level as it is in one game. The geometry of the level is
+	held by a LevelTemplate, which can be shared with other games, while the level itself
+	only holds the actors, keys and exits in it.
 
 	Parameters
 	----------
-	level_generator : LevelGenerator
-		Valid level generation
+	level_json : dict or LevelTemplate
+		JSON representation of the level, or the template of the level to play on
+	compact : bool
+		Whether to store the tiles in a compact TileGrid instead of a nested list of Tiles,
+		intended for very large levels. Unused if given a template.
 	"""
-	def __init__(self, level_json):
-		self._level_generator = LevelGenerator(level_json)
-		self._tiles = self._level_generator.get_whole_level()
-		self._rooms = sorted(self._level_generator.get_rooms())
-		self._hallways = self._level_generator.get_hallways()
+	def __init__(self, level_json, compact=False):
+		if isinstance(level_json, LevelTemplate):
+			self._template = level_json
+		else:
+			self._template = LevelTemplate(level_json, compact)
+		self._tiles = self._template.get_all_tiles()
+		self._rooms = self._template.get_rooms()
+		self._hallways = self._template.get_hallways()
+		self._height, self._width = self._template.get_dimensions()
+		self._regions = self._template.get_region_index()
+		self._placeable_index, self._placeable_list = self._template.get_placeable()
 		self._is_locked = True
-		self._initialize_objects(level_json['objects'])
+		self._keys = set() # Positions of keys in the level
+		self._exits = set() # Positions of exits in the level
+		self._occupants = {} # Actor on each occupied position
+		self._actor_positions = {} # Position of each actor in the level
+		# Free positions are the first _num_free of a list which starts as the template's
+		# placeable list, and only the entries which differ from the template are stored
+		self._num_free = len(self._placeable_list)
+		self._free_moved = {} # Position at each index of the free list that differs
+		self._index_moved = {} # Index of each position that differs, None if not free
+		self._version = 0 # Bumped whenever the objects in the level change
+		self._level_json = None # JSON of the level, as of _level_json_version
+		self._level_json_version = None
+		self._initialize_objects(self._template.get_objects())
 		self._found_key = None
 	
 	def _initialize_objects(self, objects_array):
@@ -25,12 +303,166 @@ class Level:
 			elif obj['type'] == 'exit':
 				self.add_exit(obj['position'][0], obj['position'][1])
 
+	def _get_free_index(self, pos):
+		"""
+		Retrieves the index of the position in the free list
+
+		Returns
+		-------
+		int
+			Index of the position, or None if it is not free
+		"""
+		if pos in self._index_moved:
+			return self._index_moved[pos]
+		return self._placeable_index.get(pos)
+
+	def _set_free(self, index, pos):
+		"""
+		Puts the position at the index of the free list, only storing it if it differs from
+		the template
+		"""
+		if self._placeable_list[index] == pos:
+			self._free_moved.pop(index, None)
+		else:
+			self._free_moved[index] = pos
+		if self._placeable_index[pos] == index:
+			self._index_moved.pop(pos, None)
+		else:
+			self._index_moved[pos] = index
+
+	def _update_free(self, pos):
+		"""
+		Adds the position to or removes it from the free positions, depending on whether
+		an actor could be placed on it now. Removal swaps the last free position into its
+		place, so both are constant time.
+
+		Parameters
+		----------
+		pos : (int, int)
+			Row and column index of the tile that changed
+		"""
+		if pos not in self._placeable_index:
+			return
+		free = pos not in self._keys and pos not in self._exits and pos not in self._occupants
+		index = self._get_free_index(pos)
+		if free and index is None:
+			self._set_free(self._num_free, pos)
+			self._num_free += 1
+		elif not free and index is not None:
+			self._num_free -= 1
+			last = self._free_moved.pop(self._num_free, self._placeable_list[self._num_free])
+			if last != pos:
+				self._set_free(index, last)
+			self._index_moved[pos] = None
+
+	def is_free(self, row, col):
+		"""
+		Determines whether an actor can be placed on the tile at the given position, it is
+		an unoccupied space in a room without a key or exit
+
+		Parameters
+		----------
+		row : int
+			row index of the tile
+		col : int
+			col index of the tile
+
+		Returns
+		-------
+		bool
+			Whether the tile is free
+		"""
+		return self._get_free_index((row, col)) is not None
+
+	def get_random_free_position(self, rand):
+		"""
+		Chooses a free tile uniformly at random, in constant time
+
+		Parameters
+		----------
+		rand : random.Random
+			Random number generator to choose with
+
+		Returns
+		-------
+		(int, int)
+			Row and column index of the tile, or None if no tile is free
+		"""
+		if not self._num_free:
+			return None
+		index = rand.randrange(self._num_free)
+		return self._free_moved.get(index, self._placeable_list[index])
+
+	def _get_region(self, row, col):
+		"""
+		Retrieves the region id of the tile at the given position
+
+		Returns
+		-------
+		int
+			Region id of the tile, 0 if it is not in a room or hallway or not in the level
+		"""
+		if 0 <= row < self._height and 0 <= col < self._width:
+			return self._regions[row * self._width + col]
+		return 0
+
+	def get_template(self):
+		"""
+		Retrieves the template holding the geometry of the level
+
+		Returns
+		-------
+		LevelTemplate
+			Template of the level
+		"""
+		return self._template
+
 	def get_all_tiles(self):
+		"""
+		Retrieves the template tiles of the level, which only describe the geometry of the
+		level. Actors, keys and exits are read through get_tile.
+
+		Returns
+		-------
+		List[List[Tile]] or TileGrid
+			All of the template tiles
+		"""
 		return self._tiles
 
+	def get_dimensions(self):
+		"""
+		Retrieves the size of the level
+
+		Returns
+		-------
+		(int, int)
+			Number of rows and columns in the level
+		"""
+		return (self._height, self._width)
+
+	def get_type_codes(self):
+		"""
+		Retrieves the type code of every tile in the level, see LevelTemplate.get_type_codes
+		"""
+		return self._template.get_type_codes()
+
+	def get_region_index(self):
+		"""
+		Retrieves the region id of every tile in the level, see LevelTemplate._build_region_index
+		"""
+		return self._regions
+
+	def get_room_mask(self):
+		"""
+		Retrieves whether each tile in the level is in a room, see LevelTemplate.get_room_mask
+		"""
+		return self._template.get_room_mask()
+
 	def get_tile(self, row, col):
 		"""
-		Retrieve the tile from the given row, col index
+		Retrieve the tile from the given row, col index. Walls are returned as they are,
+		except the shared void wall, which is returned as a Wall at the position, and spaces
+		and doors as a LevelTile of this level.
 
 		Parameters
 		----------
@@ -45,9 +477,15 @@ class Level:
 			tile at the given position
 		"""
 		try:
-			return self._tiles[row][col]
+			tile = self._tiles[row][col]
 		except:
 			return None
+		if tile is VOID_WALL:
+			# Indices wrap like the nested list they index
+			return Wall(row % self._height, col % self._width)
+		if tile.get_type() == 'wall':
+			return tile
+		return LevelTile(self, tile)
 
 	def add_key(self, row, col):
 		"""
@@ -60,17 +498,126 @@ class Level:
 		col : int
 			col index of the tile
 		"""
-		self.get_tile(row, col).add_key()
+		if (row, col) in self._exits:
+			raise ValueError("Cannot add key to tile that is exit.")
+		self._keys.add((row, col))
+		self._update_free((row, col))
+		self._version += 1
+
+	def add_person(self, actor, row, col):
+		"""
+		Attempts to add an actor to the tile at the given row, col index. Unable to add the
+		actor if the tile is occupied.
+
+		Parameters
+		----------
+		actor : AbstractActor
+			Actor to add to the tile
+		row : int
+			row index of the tile
+		col : int
+			col index of the tile
+
+		Returns
+		-------
+		bool
+			Whether the actor was successfully added to the tile or not
+		"""
+		tile = self.get_tile(row, col)
+		if tile is None or tile.get_type() == 'wall' or (row, col) in self._occupants:
+			return False
+		self._occupants[(row, col)] = actor
+		self._actor_positions[actor] = (row, col)
+		self._update_free((row, col))
+		return True
+
+	def remove_person(self, row, col):
+		"""
+		Removes the actor from the tile at the given row, col index, if there is one
+
+		Parameters
+		----------
+		row : int
+			row index of the tile
+		col : int
+			col index of the tile
+
+		Returns
+		-------
+		AbstractActor
+			The actor removed from the tile or None
+		"""
+		actor = self._occupants.pop((row, col), None)
+		if actor is not None:
+			del self._actor_positions[actor]
+			self._update_free((row, col))
+		return actor
+
+	def get_person(self, row, col):
+		"""
+		Retrieves the actor on the tile at the given position
+
+		Returns
+		-------
+		AbstractActor
+			Actor on the tile, or None if it is unoccupied
+		"""
+		return self._occupants.get((row, col))
+
+	def has_key(self, row, col):
+		"""
+		Determines whether the key is on the tile at the given position
+
+		Returns
+		-------
+		bool
+			Whether the tile has a key
+		"""
+		return (row, col) in self._keys
+
+	def is_exit(self, row, col):
+		"""
+		Determines whether the tile at the given position is an exit
+
+		Returns
+		-------
+		bool
+			Whether the tile is an exit
+		"""
+		return (row, col) in self._exits
+
+	def is_unlocked_exit(self, row, col):
+		"""
+		Determines whether the tile at the given position is an unlocked exit
+
+		Returns
+		-------
+		bool
+			Whether the tile is an exit and the level is unlocked
+		"""
+		return not self._is_locked and (row, col) in self._exits
+
+	def get_actor_position(self, actor):
+		"""
+		Retrieves the position of the given actor in the level
+
+		Returns
+		-------
+		(int, int)
+			Row and column index of the actor, or None if they are not in the level
+		"""
+		return self._actor_positions.get(actor)
 
 	def remove_key(self, player_name):
 		"""
 		Removes the key from the level, someone picked it up
 		"""
-		for row in self._tiles:
-			for tile in row:
-				if tile.has_key():
-					tile.remove_key()
-					self._found_key = player_name
+		keys = list(self._keys)
+		self._keys.clear()
+		for row, col in keys:
+			self._found_key = player_name
+			self._version += 1
+			self._update_free((row, col))
 
 	def add_exit(self, row, col):
 		"""
@@ -83,17 +630,19 @@ class Level:
 		col : int
 			col index of the tile
 		"""
-		self.get_tile(row, col).add_level_exit()
+		if (row, col) in self._keys:
+			raise ValueError("Cannot add exit to tile that has key.")
+		self._exits.add((row, col))
+		self._update_free((row, col))
+		self._version += 1
 
 	def unlock_exit(self):
 		"""
 		Sets the unlock status of the level to True
 		"""
-		for row in self._tiles:
-			for tile in row:
-				if tile.is_exit():
-					tile.unlock()
-					self._is_locked = False
+		if self._exits:
+			self._is_locked = False
+			self._version += 1
 	
 	def who_unlocked(self):
 		return self._found_key
@@ -116,12 +665,11 @@ class Level:
 		Returns
 		-------
 		(int, int)
-			Row and column index of the exit position
+			Row and column index of the exit position, or None if there is no exit
 		"""
-		for row in self._tiles:
-			for tile in row:
-				if tile.is_exit():
-					return (tile.get_row(), tile.get_col())
+		if self._exits:
+			return min(self._exits)
+		return None
 
 	def get_tiles(self):
 		"""
@@ -132,44 +680,71 @@ class Level:
 		List[Tile]
 			All of the tiles in the level
 		"""
-		all_tiles = []
-		for row in self._tiles:
-			all_tiles += row
-		return all_tiles
+		return [self.get_tile(row, col) for row in range(self._height) for col in range(self._width)]
+
+	def get_version(self):
+		"""
+		Retrieves the version of the level, which changes whenever the objects in the
+		level change
+
+		Returns
+		-------
+		int
+			Version of the level
+		"""
+		return self._version
 
 	def get_JSON(self):
 		"""
-		Retrieves JSON representation of a level
+		Retrieves JSON representation of a level. Rooms and hallways never change, so the
+		JSON is only rebuilt when the version changes, and the same object is returned
+		until then. It must not be mutated.
 
 		Returns
 		-------
-		dict
+		CachedJSON
 			JSON representation of a level
 		"""
-		as_json = {
+		if self._level_json_version == self._version:
+			return self._level_json
+
+		rooms, hallways = self._template.get_structure_json()
+
+		self._level_json = CachedJSON({
 			"type": "level", 
-			"rooms": [room.get_JSON() for room in self._rooms], 
-			"hallways": [hallway.get_JSON() for hallway in self._hallways],
-			"objects": self.get_objects_json(self._tiles)
-		}
+			"rooms": rooms, 
+			"hallways": hallways,
+			"objects": self.get_objects_json()
+		})
+		self._level_json_version = self._version
 
-		return as_json
+		return self._level_json
 	
-	def get_objects_json(self, tiles):
-		all_objects = []
+	def get_objects_json(self, origin_pos=None, radius=2):
+		"""
+		Retrieves JSON representation of the keys and exits in the level, ordered by position.
+		If an origin position is given, only the objects in the grid centered around it with a
+		vertical and horizontal radius of the given value are included.
 
-		for row in tiles:
-			for tile in row:
-				if tile is None:
-					continue
+		Parameters
+		----------
+		origin_pos : (int, int), default None
+			Row and column index of the center of the visible grid
+		radius : int, default 2
+			Horizontal and vertical radius of the visible grid
 
-				tile_pos = (tile.get_row(), tile.get_col())
-				if tile.has_key():
-					all_objects.append({"type": "key", "position": tile_pos})
-				elif tile.is_exit():
-					all_objects.append({"type": "exit", "position": tile_pos})
+		Returns
+		-------
+		List[dict]
+			JSON representation of each object
+		"""
+		all_objects = [(pos, "key") for pos in self._keys] + [(pos, "exit") for pos in self._exits]
+
+		if origin_pos is not None:
+			all_objects = [(pos, obj_type) for pos, obj_type in all_objects 
+				if abs(pos[0] - origin_pos[0]) <= radius and abs(pos[1] - origin_pos[1]) <= radius]
 
-		return all_objects
+		return [{"type": obj_type, "position": pos} for pos, obj_type in sorted(all_objects)]
 
 	def get_level_layout(self, tiles):
 		"""
@@ -242,10 +817,9 @@ class Level:
 		Room
 			The room the tile is in or None
 		"""
-		tile_in_question = self.get_tile(row, col)
-		for room in self._rooms:
-			if tile_in_question in room.get_tiles():
-				return room
+		region = self._get_region(row, col)
+		if 0 < region <= len(self._rooms):
+			return self._rooms[region - 1]
 		return None
 
 	def tile_in_hallway(self, row , col):
@@ -264,10 +838,9 @@ class Level:
 		Hallway
 			The Hallway the tile is in or None
 		"""
-		tile_in_question = self.get_tile(row, col)
-		for hallway in self._hallways:
-			if tile_in_question in hallway.get_tiles():
-				return hallway
+		region = self._get_region(row, col)
+		if region > len(self._rooms):
+			return self._hallways[region - len(self._rooms) - 1]
 		return None
 
 	def get_reachable_rooms(self, row, col):
@@ -293,12 +866,10 @@ class Level:
 		for hallway in self._hallways:
 			start_pos = hallway.get_start_pos()
 			end_pos = hallway.get_end_pos()
-			start_tile = self.get_tile(start_pos[0], start_pos[1])
-			end_tile = self.get_tile(end_pos[0], end_pos[1])
 			
-			if start_tile in tile_room.get_tiles():
+			if self.tile_in_room(start_pos[0], start_pos[1]) is tile_room:
 				reachable_rooms.append(self.tile_in_room(end_pos[0], end_pos[1]))
-			elif end_tile in tile_room.get_tiles():
+			elif self.tile_in_room(end_pos[0], end_pos[1]) is tile_room:
 				reachable_rooms.append(self.tile_in_room(start_pos[0], start_pos[1]))
 
 		return reachable_rooms
@@ -315,39 +886,29 @@ class Level:
 		"adversaries": [],
 		"exit-locked": self.is_locked(),
 		}
-		for row in self._tiles:
-			for tile in row:
-				actor = tile.get_person()
-				if actor is None:
-					continue
-				elif actor.get_type() == 'player' and (actor.is_ejected() or actor.is_exited()):
-					continue
-				elif actor.get_type() == 'player':
-					game_state['players'].append(actor.get_position_JSON())
-				else:
-					game_state['adversaries'].append(actor.get_position_JSON())
+		# Occupied positions in row major order
+		for _, actor in sorted(self._occupants.items(), key=lambda item: item[0]):
+			if actor.get_type() == 'player' and (actor.is_ejected() or actor.is_exited()):
+				continue
+			elif actor.get_type() == 'player':
+				game_state['players'].append(actor.get_position_JSON())
+			else:
+				game_state['adversaries'].append(actor.get_position_JSON())
 
 		return game_state
 	
 	def player_in_room(self, row, col):
+		"""
+		Retrieves the positions of the players in the room the given tile is in
+
+		Returns
+		-------
+		List[(int, int)]
+			Row and column index of each player in the room in row major order, or None if
+			the tile is not in a room
+		"""
 		room = self.tile_in_room(row, col)
 		if room is None:
 			return None
-		player_pos = []
-		for r in self._rooms:
-			if (room.get_row(), room.get_col()) == (r.get_row(), r.get_col()):
-				for tile in room.get_tiles():
-					if tile.get_person() is not None and tile.get_person().get_type() == 'player':
-						player_pos.append(tile.get_position())
-		return player_pos
-
-
-
-		
-
-
-
-
-
-
-
+		return sorted(pos for pos, actor in self._occupants.items()
+			if actor.get_type() == 'player' and self.tile_in_room(pos[0], pos[1]) is room)
@@ -0,0 +1,209 @@
+from array import array
+import hashlib
+import json
+import os
+import struct
+
+from .level import LevelTemplate, CompiledLevel
+from ..utils import iter_levels
+
+# Identifies a compiled levels file, and the version of its format
+MAGIC = b'SNARLC\x00\x01'
+# Magic, sha256 digest of the source levels file, number of levels
+HEADER = struct.Struct('<8s32sI')
+# Length of the level JSON, rows, columns, region id typecode
+LEVEL_HEADER = struct.Struct('<III1s')
+# Bytes read at a time when hashing a levels file
+CHUNK_SIZE = 1 << 20
+
+def get_cache_path(file_name):
+	"""
+	Retrieves the path of the compiled cache of the given levels file, next to it with the
+	extension replaced by .snarlc
+
+	Parameters
+	----------
+	file_name : str
+		Name of the levels file
+
+	Returns
+	-------
+	str
+		Path of the cache file
+	"""
+	return os.path.splitext(file_name)[0] + '.snarlc'
+
+def file_digest(file_name):
+	"""
+	Computes the sha256 digest of the file, reading it in chunks so the file is never held
+	in memory at once
+
+	Parameters
+	----------
+	file_name : str
+		Name of the file
+
+	Returns
+	-------
+	bytes
+		sha256 digest of the file
+	"""
+	digest = hashlib.sha256()
+	with open(file_name, 'rb') as f:
+		for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+			digest.update(chunk)
+	return digest.digest()
+
+def _read_exactly(f, size):
+	"""
+	Reads the given number of bytes from the file
+
+	Returns
+	-------
+	bytes
+		Bytes read, or None if the file ended first
+	"""
+	data = f.read(size)
+	return data if len(data) == size else None
+
+def compile_levels(level_jsons):
+	"""
+	Builds each level, validating it, and keeps its flat arrays for the cache
+
+	Parameters
+	----------
+	level_jsons : Iterable[dict]
+		Level JSONs to compile
+
+	Returns
+	-------
+	List[CompiledLevel]
+		Compiled level of each level JSON
+	"""
+	compiled = []
+	for level_json in level_jsons:
+		template = LevelTemplate(level_json)
+		height, width = template.get_dimensions()
+		compiled.append(CompiledLevel(level_json, height, width, template.get_type_codes(),
+			template.get_region_index()))
+	return compiled
+
+def write_cache(cache_path, digest, levels):
+	"""
+	Writes the compiled levels to the cache file. The file is written to a temporary file
+	first and moved into place, so readers never see a partly written cache.
+
+	Parameters
+	----------
+	cache_path : str
+		Path of the cache file
+	digest : bytes
+		sha256 digest of the source levels file
+	levels : List[CompiledLevel]
+		Compiled levels to write
+	"""
+	parts = [HEADER.pack(MAGIC, digest, len(levels))]
+	for level in levels:
+		level_json = json.dumps(level, separators=(',', ':')).encode()
+		parts.append(LEVEL_HEADER.pack(len(level_json), level.height, level.width,
+			level.regions.typecode.encode()))
+		parts += [level_json, bytes(level.types), level.regions.tobytes()]
+
+	temp_path = f'{cache_path}.{os.getpid()}.tmp'
+	with open(temp_path, 'wb') as f:
+		f.write(b''.join(parts))
+	os.replace(temp_path, cache_path)
+
+def read_cache(cache_path, digest):
+	"""
+	Reads the compiled levels from the cache file, if it was compiled from the source file
+	with the given digest. Each level is read in turn, so only the level being read and the
+	levels already read are held in memory.
+
+	Parameters
+	----------
+	cache_path : str
+		Path of the cache file
+	digest : bytes
+		sha256 digest of the source levels file
+
+	Returns
+	-------
+	List[CompiledLevel]
+		Compiled levels, or None if there is no cache for the source file
+	"""
+	try:
+		with open(cache_path, 'rb') as f:
+			return _read_levels(f, digest)
+	# A corrupt cache is treated as missing, and rebuilt by the next load
+	except (OSError, ValueError, TypeError, struct.error):
+		return None
+
+def _read_levels(f, digest):
+	"""
+	Reads the compiled levels from the open cache file, as described in read_cache
+
+	Returns
+	-------
+	List[CompiledLevel]
+		Compiled levels, or None if the cache is not for the source file or is cut short.
+		Corrupt contents raise, and are caught by read_cache
+	"""
+	header = _read_exactly(f, HEADER.size)
+	if header is None:
+		return None
+	magic, cached_digest, num_levels = HEADER.unpack(header)
+	if magic != MAGIC or cached_digest != digest:
+		return None
+
+	levels = []
+	for _ in range(num_levels):
+		level_header = _read_exactly(f, LEVEL_HEADER.size)
+		if level_header is None:
+			return None
+		json_len, height, width, typecode = LEVEL_HEADER.unpack(level_header)
+		regions = array(typecode.decode())
+		level_json = _read_exactly(f, json_len)
+		types = _read_exactly(f, height * width)
+		region_bytes = _read_exactly(f, height * width * regions.itemsize)
+		if region_bytes is None or types is None or level_json is None:
+			return None
+		regions.frombytes(region_bytes)
+		levels.append(CompiledLevel(json.loads(level_json), height, width, types, regions))
+	return levels
+
+def load_levels(file_name, use_cache=True):
+	"""
+	Loads the levels from the given file, using its compiled cache if it is up to date.
+	Otherwise the levels are parsed, validated and compiled, and the cache is written for
+	next time. Games built from compiled levels skip validating them and building their
+	arrays.
+
+	Parameters
+	----------
+	file_name : str
+		Name of the levels file
+	use_cache : bool, default True
+		Whether to read and write the compiled cache
+
+	Returns
+	-------
+	List[CompiledLevel]
+		Compiled level of each level in the file
+	"""
+	digest = file_digest(file_name)
+
+	cache_path = get_cache_path(file_name)
+	if use_cache:
+		levels = read_cache(cache_path, digest)
+		if levels is not None:
+			return levels
+
+	levels = compile_levels(iter_levels(file_name))
+	if use_cache:
+		# A cache which cannot be written only costs the next load its speed
+		try:
+			write_cache(cache_path, digest, levels)
+		except OSError:
+			pass
+	return levels
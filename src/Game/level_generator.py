@@ -1,6 +1,7 @@
 from .tile import *
 from .room import Room
 from .hallway import Hallway
+from .tile_grid import TileGrid, SPACE
 
 class LevelGenerator:
 	"""
@@ -16,19 +17,30 @@ class LevelGenerator:
 		Each room to be added to the level
 	hallways : List[Hallway]
 		Each hallway to be added to the level
+	compact : bool
+		Whether to generate the level as a compact TileGrid rather than a nested list of Tiles
+	validate : bool, default True
+		Whether to check rooms and hallways do not overlap, skipped for levels that were
+		already validated when they were compiled
 	"""
-	def __init__(self, level_json):
+	def __init__(self, level_json, compact=False, validate=True):
+		self._validate = validate
 		self._rooms = []
 		self._hallways = []
 		self._max_width = 0
 		self._max_height = 0
 		self._whole_level = []
+		self._occupied = set() # Positions of every room and hallway tile, when validating
+		self._room_boundaries = {} # Room each position on a room boundary belongs to
 		# Add all given levels and rooms
 		for room_json in level_json['rooms']:
 			self._add_room(self._build_room(room_json))
 		for hallway_to_add in level_json['hallways']:
 			self._add_hallway(self._build_hallway(hallway_to_add))
-		self._finalize_level()
+		if compact:
+			self._finalize_grid()
+		else:
+			self._finalize_level()
 	
 
 	def _add_room(self, room_to_add):
@@ -41,13 +53,36 @@ class LevelGenerator:
             A properly formed room to add to the level
 		"""
 		# Ensure room does not overlap with any current rooms or hallways
-		self._check_overlaps(room_to_add.get_tiles())
+		if self._validate:
+			self._check_overlaps(room_to_add.get_tiles())
 
 		self._update_maxes(room_to_add.get_row() + room_to_add.get_height(),
 			room_to_add.get_col() + room_to_add.get_width())
 
+		self._add_boundary(room_to_add)
 		self._rooms.append(room_to_add)
 
+	def _add_boundary(self, room):
+		"""
+		Records the room as the room of each position on its boundary, so the rooms at the
+		ends of a hallway are found without checking every room
+
+		Parameters
+		----------
+		room : Room
+			Room that was added to the level
+		"""
+		top = room.get_row()
+		left = room.get_col()
+		bottom = top + room.get_height() - 1
+		right = left + room.get_width() - 1
+		for col in range(left, right + 1):
+			self._room_boundaries[(top, col)] = room
+			self._room_boundaries[(bottom, col)] = room
+		for row in range(top, bottom + 1):
+			self._room_boundaries[(row, left)] = room
+			self._room_boundaries[(row, right)] = room
+
 	def _build_room(self, room_json):
 		board = []
 		tile_map = {0: 'X', 1: 'O', 2: '|'}
@@ -72,18 +107,14 @@ class LevelGenerator:
             A properly formed hallway to add to the level. The end points of the hallway must both
             fall on the boundary of a room that has already been added.
 		"""
-		start_room = None
-		end_room = None
-		for room in self._rooms:
-			if room.is_on_boundary(hallway_to_add.get_start_pos()[0], hallway_to_add.get_start_pos()[1]):
-				start_room = room
-			elif room.is_on_boundary(hallway_to_add.get_end_pos()[0], hallway_to_add.get_end_pos()[1]):
-				end_room = room
+		start_room = self._room_boundaries.get(tuple(hallway_to_add.get_start_pos()))
+		end_room = self._room_boundaries.get(tuple(hallway_to_add.get_end_pos()))
 
-		if start_room is None or end_room is None:
+		if start_room is None or end_room is None or start_room is end_room:
 			raise ValueError("Cannot add hallway, end points are not on boundaries of different rooms.")
 
-		self._check_overlaps(hallway_to_add.get_tiles())
+		if self._validate:
+			self._check_overlaps(hallway_to_add.get_tiles())
 
 		self._update_maxes(hallway_to_add.get_max_height(), hallway_to_add.get_max_width())
 
@@ -102,12 +133,9 @@ class LevelGenerator:
 		Generates a nested list of tiles to represent the level based off the current rooms and
 		hallways that have been added
 		"""
-		# Pre allocate space for all of the tiles with walls
+		# Pre allocate space for all of the tiles with the shared void wall
 		for row_ind in range(self._max_height):
-			row = []
-			for col_ind in range(self._max_width):
-				row.append(Wall(row_ind, col_ind))
-			self._whole_level.append(row)
+			self._whole_level.append([VOID_WALL] * self._max_width)
 
 		# Iterate over each of the rooms, adding their tiles to the map
 		for room in self._rooms:
@@ -121,6 +149,22 @@ class LevelGenerator:
 			for tile in tiles:
 				self._whole_level[tile.get_row()][tile.get_col()] = tile
 
+	def _finalize_grid(self):
+		"""
+		Generates a compact TileGrid to represent the level based off the current rooms and
+		hallways that have been added. Only room and hallway tiles are written, the rest of the
+		grid is left as walls.
+		"""
+		self._whole_level = TileGrid(self._max_height, self._max_width)
+
+		for room in self._rooms:
+			for tile in room.get_tiles():
+				self._whole_level.set_type(tile.get_row(), tile.get_col(), int(str(tile)))
+
+		for hallway in self._hallways:
+			for tile in hallway.get_tiles():
+				self._whole_level.set_type(tile.get_row(), tile.get_col(), SPACE)
+
 	def _update_maxes(self, max_row, max_col):
 		"""
 		Update the the dimensions of the entire level if the added component extends
@@ -141,7 +185,9 @@ class LevelGenerator:
 
 	def _check_overlaps(self, tiles_to_add):
 		"""
-		Check whether the list of tiles to add over laps with any previously added components
+		Check whether the list of tiles to add over laps with any previously added components,
+		and marks their positions occupied if not. Each check is linear in the number of tiles
+		added, not the size of the level.
 
 		Parameters
 		----------
@@ -149,20 +195,17 @@ class LevelGenerator:
 			List of tiles to be added to the level
 		"""
 		pos_to_add = [(tile.get_row(), tile.get_col()) for tile in tiles_to_add]
-		for component in self._rooms + self._hallways:
-			component_positions = [(tile.get_row(), tile.get_col()) for tile in component.get_tiles()]
-
-			for pos in pos_to_add:
-				if pos in component_positions:
-					raise ValueError("Cannot add, overlaps with another hallway or room.")
+		if not self._occupied.isdisjoint(pos_to_add):
+			raise ValueError("Cannot add, overlaps with another hallway or room.")
+		self._occupied.update(pos_to_add)
 
 	def get_whole_level(self):
 		"""
-		Retrieves all of the tiles in the level as a flat list
+		Retrieves all of the tiles in the level
 
 		Returns
 		-------
-		List[Tile]
+		List[List[Tile]] or TileGrid
 			All of level tiles
 		"""
 		return self._whole_level
@@ -0,0 +1,106 @@
+from enum import IntEnum
+
+class MoveCode(IntEnum):
+	"""
+	Kinds of results of an actor's move
+	"""
+	OK = 0
+	INVALID = 1
+	NONEXISTENT = 2
+	KEY = 3
+	EXIT = 4
+	EJECT = 5
+	DAMAGE = 6
+	TELEPORT = 7
+
+# Message sent to players for each kind of result, damage adds the amount
+WIRE_NAMES = {
+	MoveCode.OK: "OK",
+	MoveCode.INVALID: "Invalid",
+	MoveCode.NONEXISTENT: "Nonexistent",
+	MoveCode.KEY: "Key",
+	MoveCode.EXIT: "Exit",
+	MoveCode.EJECT: "Eject",
+	MoveCode.DAMAGE: "Damage",
+	MoveCode.TELEPORT: "Teleport"
+}
+
+class MoveResult:
+	"""
+	Result of an actor's move, as returned by the RuleChecker. Results are shared, there is
+	one for each code and one for each amount of damage, so validating a move allocates
+	nothing. The message sent to players, such as "Damage-40", is built once per result.
+
+	Results compare equal to their message, so they can be checked against the strings
+	used in the protocol.
+
+	Parameters
+	----------
+	code : MoveCode
+		Kind of result
+	damage : int, default 0
+		Amount of damage dealt, for damage results
+	"""
+	__slots__ = ('code', 'damage', '_message')
+
+	_damage_results = {} # Shared damage result for each amount
+
+	def __init__(self, code, damage=0):
+		self.code = code
+		self.damage = damage
+		self._message = WIRE_NAMES[code] if code != MoveCode.DAMAGE else f"Damage-{damage}"
+
+	@classmethod
+	def of_damage(cls, damage):
+		"""
+		Retrieves the shared result for dealing the given amount of damage
+
+		Parameters
+		----------
+		damage : int
+			Amount of damage dealt
+
+		Returns
+		-------
+		MoveResult
+			Damage result
+		"""
+		result = cls._damage_results.get(damage)
+		if result is None:
+			result = cls._damage_results[damage] = cls(MoveCode.DAMAGE, damage)
+		return result
+
+	def is_valid(self):
+		"""
+		Retrieves whether the move was made, it was not invalid or by an actor not in the game
+
+		Returns
+		-------
+		bool
+			Whether the move was valid
+		"""
+		return self.code != MoveCode.INVALID and self.code != MoveCode.NONEXISTENT
+
+	def __str__(self):
+		return self._message
+
+	def __repr__(self):
+		return f"MoveResult({self._message!r})"
+
+	def __eq__(self, other):
+		if isinstance(other, MoveResult):
+			return self.code == other.code and self.damage == other.damage
+		if isinstance(other, str):
+			return self._message == other
+		return NotImplemented
+
+	def __hash__(self):
+		return hash(self._message)
+
+MoveResult.OK = MoveResult(MoveCode.OK)
+MoveResult.INVALID = MoveResult(MoveCode.INVALID)
+MoveResult.NONEXISTENT = MoveResult(MoveCode.NONEXISTENT)
+MoveResult.KEY = MoveResult(MoveCode.KEY)
+MoveResult.EXIT = MoveResult(MoveCode.EXIT)
+MoveResult.EJECT = MoveResult(MoveCode.EJECT)
+MoveResult.TELEPORT = MoveResult(MoveCode.TELEPORT)
@@ -1,7 +1,37 @@
+from .move_result import MoveCode, MoveResult
+from .tile_grid import WALL, DOOR
+
 class RuleChecker:
+	"""
+	Validates moves and placements in a level. A rule checker is created once per level,
+	using the level's flat arrays of the type of every tile and whether it is in a room, so
+	validating a move is a few array and dict lookups.
+
+	Parameters
+	----------
+	level : Level
+		Level to validate moves in
+	combat : bool, default False
+		Whether the game uses the Hit Point system
+	"""
 	def __init__(self, level, combat=False):
 		self._level = level
 		self._combat = combat
+		self._height, self._width = level.get_dimensions()
+		# Type code of each tile, and whether it is in a room, indexed by row * width + col
+		self._types = level.get_type_codes()
+		self._in_room = level.get_room_mask()
+
+	def get_level(self):
+		"""
+		Retrieve the level the rule checker validates moves in
+
+		Returns
+		-------
+		Level
+			Level of the rule checker
+		"""
+		return self._level
 
 	def player_move_result(self, player, row, col):
 		"""
@@ -15,53 +45,76 @@ class RuleChecker:
 			Row index of tile to move to
 		col : int
 			Col index of tile to move to
-		
+
 		Returns
 		-------
-		str
+		MoveResult
 			The result of the move
 		"""
-		tile = self._get_tile(row, col)
+		return self.player_move_results(player, [(row, col)])[0]
+
+	def player_move_results(self, player, candidates):
+		"""
+		Retrieves the result of the player attempting to move to each of the given
+		positions. Everything about the player is looked up once for the whole batch,
+		so search based players can validate every tile in reach cheaply.
+
+		Parameters
+		----------
+		player : AbstractPlayer
+			Player to move
+		candidates : List[(int, int)]
+			Row and column index of each tile to move to
+
+		Returns
+		-------
+		List[MoveResult]
+			The result of each move, in the order of the candidates
+		"""
 		# Player is not part of the game
 		if player is None:
-			return 'Nonexistent'
-
-		# Tile does not exist
-		if tile is None:
-			return "Invalid"
-		# Tile outside player reach
-		elif abs(player.get_row() - row) + abs(player.get_col() - col) > 2:
-			return "Invalid"
-		# Tile is current position, skipping turn
-		elif player.get_position() == (row, col):
-			return "OK"
-		# Tile is a player
-		elif tile.get_person() is not None and tile.get_person().get_type() == 'player':
-			return "Invalid"
-		# Tile is wall
-		elif tile.get_type() == 'wall':
-			return "Invalid"
-		# Tile is unlocked exit
-		elif tile.is_unlocked():
-			return "Exit"
-		# Tile has key
-		elif tile.has_key():
-			return 'Key'
-		# Tile is an adversary
-		elif tile.get_person() is not None and tile.get_person().get_type() != 'player':
-			damage = tile.get_person().get_damage()
-			if self._combat:
-				health = player.get_health()
-			else:
-				health = 1
+			return [MoveResult.NONEXISTENT] * len(candidates)
 
-			if health - damage <= 0:
-					return "Eject"
+		level = self._level
+		types = self._types
+		height, width = self._height, self._width
+		player_row, player_col = player.get_row(), player.get_col()
+		health = player.get_health() if self._combat else 1
+		results = []
+		for row, col in candidates:
+			person = level.get_person(row, col)
+			# Tile does not exist
+			if not (0 <= row < height and 0 <= col < width):
+				results.append(MoveResult.INVALID)
+			# Tile outside player reach
+			elif abs(player_row - row) + abs(player_col - col) > 2:
+				results.append(MoveResult.INVALID)
+			# Tile is current position, skipping turn
+			elif player_row == row and player_col == col:
+				results.append(MoveResult.OK)
+			# Tile is a player
+			elif person is not None and person.get_type() == 'player':
+				results.append(MoveResult.INVALID)
+			# Tile is wall
+			elif types[row * width + col] == WALL:
+				results.append(MoveResult.INVALID)
+			# Tile is unlocked exit
+			elif level.is_unlocked_exit(row, col):
+				results.append(MoveResult.EXIT)
+			# Tile has key
+			elif level.has_key(row, col):
+				results.append(MoveResult.KEY)
+			# Tile is an adversary
+			elif person is not None:
+				damage = person.get_damage()
+				if health - damage <= 0:
+					results.append(MoveResult.EJECT)
+				else:
+					results.append(MoveResult.of_damage(damage))
 			else:
-				return f"Damage-{damage}"
-		else:
-			return 'OK'
-	
+				results.append(MoveResult.OK)
+		return results
+
 	def adversary_move_result(self, adversary, row, col):
 		"""
 		Returns the result of the given adversary moving to the given pos
@@ -74,110 +127,100 @@ class RuleChecker:
 			Row index of tile to move to
 		col : int
 			Col index of tile to move to
-		
+
 		Returns
 		-------
-		str
+		MoveResult
 			Result of the move
 		"""
-		tile = self._get_tile(row, col)
-
-		# Tile does not exist
-		if tile is None:
-			return "Invalid"
-		# Tile outside adversary reach
-		elif abs(adversary.get_row() - row) + abs(adversary.get_col() - col) > 1:
-			return "Invalid"
-		# Check if attempting to skip move, but valid move available
-		elif adversary.get_row() == row and adversary.get_col() == col:
-			for p in [(row, col-1),(row-1, col),(row, col+1),(row+1,col)]:
-				if self.adversary_move_result(adversary, p[0], p[1]) != "Invalid":
-					return "Invalid"
-		# Tile contains adversary
-		elif tile.get_person() is not None and tile.get_person().get_type() != 'player':
-			return "Invalid"
-		# Tile is wall and adversary is ghost
-		elif tile.get_person() is not None and adversary.get_type() == 'ghost':
-			return "Teleport"
-		# Tile is wall
-		elif tile.get_type() == 'wall':
-			return "Invalid"
-		# Adversary is zombie and tile is door
-		elif adversary.get_type() == 'zombie' and tile.get_type() == 'door':
-			return "Invalid"
-		# Tile not in room
-		elif not self._level.tile_in_room(row, col):
-			return "Invalid"
-		# Tile contains player
-		elif tile.get_person() is not None and tile.get_person().get_type() == 'player':
-			damage = adversary.get_damage()
-			if self._combat:
-				health = tile.get_person().get_health()
-			else:
-				health = 1
-			
+		return self.adversary_move_results(adversary, [(row, col)])[0]
 
-			if health - damage <= 0:
-					return "Eject"
-			else:
-				return f"Damage-{damage}"
-		# Valid move
-		else:
-			return 'OK'
-		
-	def allowed_actor_placement(self, pos):
+	def adversary_move_results(self, adversary, candidates):
 		"""
-		Determines whether the actor is allowed to be placed on the given location
+		Returns the result of the given adversary moving to each of the given positions.
+		Everything about the adversary is looked up once for the whole batch, and whether
+		it has a valid move, needed to decide if it may skip its move, is checked with one
+		batch of its neighbouring tiles.
 
 		Parameters
 		----------
-		pos : (int, int)
-			row, col index of tile to place actor
+		adversary : AbstractAdversary
+			Adversary to move
+		candidates : List[(int, int)]
+			Row and column index of each tile to move to
 
 		Returns
 		-------
-		bool
-			Whether the actor can be placed on the tile
+		List[MoveResult]
+			Result of each move, in the order of the candidates
 		"""
-		tile_to_add = self._get_tile(pos[0], pos[1])
-		# Tile is not in level
-		if tile_to_add is None:
-			return False
-		# Tile has object
-		elif tile_to_add.has_key() or tile_to_add.is_exit():
-			return False
-		# Tile is wall or door
-		elif tile_to_add.get_type() != 'space':
-			return False
-		# Tile is not in room
-		elif not self._level.tile_in_room(pos[0], pos[1]):
-			return False
-		# Tile is occupied
-		elif tile_to_add.get_person() is not None:
-			return False
-		else:
-			return True
-
-	def _get_tile(self, row, col):
+		level = self._level
+		types = self._types
+		in_room = self._in_room
+		height, width = self._height, self._width
+		adv_row, adv_col = adversary.get_row(), adversary.get_col()
+		adv_type = adversary.get_type()
+		damage = adversary.get_damage()
+		results = []
+		for row, col in candidates:
+			# Tile does not exist
+			if not (0 <= row < height and 0 <= col < width):
+				results.append(MoveResult.INVALID)
+				continue
+			# Tile outside adversary reach
+			elif abs(adv_row - row) + abs(adv_col - col) > 1:
+				results.append(MoveResult.INVALID)
+				continue
+			# Check if attempting to skip move, but valid move available
+			elif adv_row == row and adv_col == col:
+				neighbours = [(row, col-1),(row-1, col),(row, col+1),(row+1,col)]
+				can_move = any(result.code != MoveCode.INVALID for result in
+					self.adversary_move_results(adversary, neighbours))
+				results.append(MoveResult.INVALID if can_move else MoveResult.OK)
+				continue
+
+			index = row * width + col
+			person = level.get_person(row, col)
+			# Tile contains adversary
+			if person is not None and person.get_type() != 'player':
+				results.append(MoveResult.INVALID)
+			# Tile is wall and adversary is ghost
+			elif person is not None and adv_type == 'ghost':
+				results.append(MoveResult.TELEPORT)
+			# Tile is wall
+			elif types[index] == WALL:
+				results.append(MoveResult.INVALID)
+			# Adversary is zombie and tile is door
+			elif adv_type == 'zombie' and types[index] == DOOR:
+				results.append(MoveResult.INVALID)
+			# Tile not in room
+			elif not in_room[index]:
+				results.append(MoveResult.INVALID)
+			# Tile contains player
+			elif person is not None:
+				health = person.get_health() if self._combat else 1
+				if health - damage <= 0:
+					results.append(MoveResult.EJECT)
+				else:
+					results.append(MoveResult.of_damage(damage))
+			# Valid move
+			else:
+				results.append(MoveResult.OK)
+		return results
+
+	def allowed_actor_placement(self, pos):
 		"""
-		Retrieve the tile from the given row, col index
+		Determines whether the actor is allowed to be placed on the given location
 
 		Parameters
 		----------
-		row : int
-			row index of the tile
-		col : int
-			col index of the tile
+		pos : (int, int)
+			row, col index of tile to place actor
 
 		Returns
 		-------
-		Tile
-			tile at the given position
+		bool
+			Whether the actor can be placed on the tile
 		"""
-		try:
-			return self._level.get_tile(row, col)
-		except:
-			return None
-
-
-
+		# Level tracks the unoccupied spaces in rooms without a key or exit
+		return self._level.is_free(pos[0], pos[1])
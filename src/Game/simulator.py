@@ -0,0 +1,211 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import time
+
+from .game_manager import GameManager
+from .level import LevelTemplate
+from .level_cache import load_levels
+from ..Player.ai_player import AIPlayer
+from ..Store.memory_store import MemoryStore
+
+# Fields of the outcome of a game, in the order workers return them
+RESULT_FIELDS = ("successful", "levels-completed", "turns", "exits", "ejects", "keys")
+
+class Simulator:
+	"""
+	Plays games of Snarl headlessly with AI players against local adversaries, to measure how
+	games on a set of levels play out. Games print nothing and no messages are encoded as JSON.
+
+	Parameters
+	----------
+	level_jsons : List[dict]
+		Levels to play through in each game, built into templates once and shared
+		by every game
+	num_players : int, default 1
+		Number of AI players in each game
+	combat : bool, default False
+		Whether to use the combat system
+	max_turns : int, default 500
+		Max number of turns in a level before it ends, so a game can not run forever
+	seed : int, default 0
+		Seed of the first game, each game after uses the next seed
+	compact : bool, default False
+		Whether to store level tiles in a compact TileGrid
+	"""
+	def __init__(self, level_jsons, num_players=1, combat=False, max_turns=500, seed=0,
+	compact=False):
+		if num_players < 1 or num_players > 4:
+			raise ValueError("Number of players must be between 1 and 4.")
+
+		self._templates = [LevelTemplate(level_json, compact) for level_json in level_jsons]
+		self._num_players = num_players
+		self._combat = combat
+		self._max_turns = max_turns
+		self._seed = seed
+
+	def play_game(self, game_num, store=None):
+		"""
+		Plays one game to the end
+
+		Parameters
+		----------
+		game_num : int
+			Number of the game, used to seed it
+		store : AbstractStore, default None
+			Store to record the game's scores in, the game uses its own if not given
+
+		Returns
+		-------
+		dict
+			Outcome of the game: whether it was successful, the number of levels completed
+			and turns played, and the total exits, ejects and keys of the players
+		"""
+		seed = self._seed + game_num
+		manager = GameManager(self._templates, combat=self._combat, seed=seed,
+			game_id=game_num, store=store, verbose=False,
+			max_turns=self._max_turns)
+		players = [AIPlayer(f'{game_num}-{i}', seed=seed * 4 + i) for i in range(self._num_players)]
+		for player in players:
+			manager.register_player(player)
+
+		manager.play_game()
+
+		# The game ends after the last level if a player exited it
+		successful = (manager.get_level_num() == len(self._templates) and
+			any(player.is_exited() for player in players))
+		scores = [player.get_player_score_json() for player in players]
+
+		return {
+			"successful": successful,
+			"levels-completed": manager.get_level_num() - (0 if successful else 1),
+			"turns": manager.get_turns(),
+			"exits": sum(score['exits'] for score in scores),
+			"ejects": sum(score['ejects'] for score in scores),
+			"keys": sum(score['keys'] for score in scores)
+		}
+
+	def run(self, num_games):
+		"""
+		Plays the given number of games and reports their statistics
+
+		Parameters
+		----------
+		num_games : int
+			Number of games to play
+
+		Returns
+		-------
+		dict
+			Number of games and turns played, games and turns per second, the fraction of
+			games that were successful, the average exits, ejects and keys per game, and
+			the number of games that completed each level
+		"""
+		store = MemoryStore()
+		start = time.perf_counter()
+		results = [self.play_game(game_num, store) for game_num in range(num_games)]
+		seconds = time.perf_counter() - start
+		store.close()
+
+		return summarize(results, seconds, len(self._templates))
+
+def summarize(results, seconds, num_levels):
+	"""
+	Compiles statistics of the given game outcomes
+
+	Parameters
+	----------
+	results : List[dict]
+		Outcome of each game, as returned by Simulator.play_game
+	seconds : float
+		Seconds taken to play the games
+	num_levels : int
+		Number of levels in each game
+
+	Returns
+	-------
+	dict
+		Statistics of the games, as returned by Simulator.run
+	"""
+	games = len(results)
+	turns = sum(result['turns'] for result in results)
+	level_completions = [0] * num_levels
+	for result in results:
+		for level_ind in range(result['levels-completed']):
+			level_completions[level_ind] += 1
+
+	return {
+		"games": games,
+		"turns": turns,
+		"seconds": seconds,
+		"games-per-sec": games / seconds if seconds else 0,
+		"turns-per-sec": turns / seconds if seconds else 0,
+		"success-rate": sum(result['successful'] for result in results) / games if games else 0,
+		"exits-per-game": sum(result['exits'] for result in results) / games if games else 0,
+		"ejects-per-game": sum(result['ejects'] for result in results) / games if games else 0,
+		"keys-per-game": sum(result['keys'] for result in results) / games if games else 0,
+		"level-completions": level_completions
+	}
+
+# Simulator and store of each worker process, created once by _init_worker
+_worker_simulator = None
+_worker_store = None
+
+def _init_worker(levels_file, options):
+	"""
+	Loads the levels and creates the simulator for a worker process
+	"""
+	global _worker_simulator, _worker_store
+	_worker_simulator = Simulator(load_levels(levels_file), **options)
+	_worker_store = MemoryStore()
+
+def _play_games(game_nums):
+	"""
+	Plays the given games in a worker process
+
+	Returns
+	-------
+	List[tuple]
+		Outcome of each game, with the values in the order of RESULT_FIELDS
+	"""
+	results = []
+	for game_num in game_nums:
+		result = _worker_simulator.play_game(game_num, _worker_store)
+		results.append(tuple(result[field] for field in RESULT_FIELDS))
+	return results
+
+def run_parallel(levels_file, num_games, workers=None, **options):
+	"""
+	Plays the given number of games split across worker processes, with the same results
+	as Simulator.run
+
+	Parameters
+	----------
+	levels_file : str
+		File containing the levels to play through
+	num_games : int
+		Number of games to play
+	workers : int, default None
+		Number of worker processes, one per core if not given
+	options
+		Options passed on to the Simulator of each worker
+
+	Returns
+	-------
+	dict
+		Statistics of the games, as returned by Simulator.run
+	"""
+	level_jsons = load_levels(levels_file)
+	workers = workers or os.cpu_count() or 1
+	# Several blocks per worker, so workers finishing early pick up more games
+	block_size = max(1, num_games // (workers * 4))
+	blocks = [range(start, min(start + block_size, num_games)) 
+		for start in range(0, num_games, block_size)]
+
+	start = time.perf_counter()
+	with ProcessPoolExecutor(workers, initializer=_init_worker, 
+		initargs=(levels_file, options)) as executor:
+		results = [dict(zip(RESULT_FIELDS, result)) 
+			for block in executor.map(_play_games, blocks) for result in block]
+	seconds = time.perf_counter() - start
+
+	return summarize(results, seconds, len(level_jsons))
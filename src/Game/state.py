@@ -1,8 +1,21 @@
 
 class State:
-	def __init__(self, state_json):
+	"""
+	Read only view of a game state, with the level built into a rectangular layout
+
+	Parameters
+	----------
+	state_json : dict
+		(state) JSON object
+	layout : List[List[int]], default None
+		Prebuilt layout of the level in the state, so states of the same level can share
+		one layout. Built from the level JSON if not given
+	"""
+	def __init__(self, state_json, layout=None):
 		self._state_json = state_json
-		self._layout = self._build_layout()
+		if layout is None:
+			layout = self._build_layout()
+		self._layout = layout
 	
 	def get_tile(self, pos):
 		"""
@@ -0,0 +1,164 @@
+"""
+Synthetic levels, sized by the number of rooms rather than read from a levels file,
+for benchmarks and tests of very large levels.
+"""
+import math
+import random
+
+def grid_level_json(rooms_per_side, room_size=6, gap=4):
+	"""
+	Build a level JSON of a square grid of open rooms. Rooms in the same row are
+	connected left to right by straight hallways, and the rooms in the first
+	column are connected top to bottom. The key is in the first room and the exit
+	in the last room.
+
+	Parameters
+	----------
+	rooms_per_side : int
+		Number of rooms along each side of the grid
+	room_size : int, default 6
+		Number of rows and columns in each room
+	gap : int, default 4
+		Number of tiles between neighbouring rooms
+
+	Returns
+	-------
+	dict
+		JSON representation of the level
+	"""
+	step = room_size + gap
+	middle = room_size // 2
+	rooms = []
+	hallways = []
+
+	for row_ind in range(rooms_per_side):
+		for col_ind in range(rooms_per_side):
+			origin = [row_ind * step, 1 + col_ind * step]
+			rooms.append({"type": "room", "origin": origin,
+				"bounds": {"rows": room_size, "columns": room_size},
+				"layout": [[1] * room_size for _ in range(room_size)]})
+
+			# Hallway to the room on the right
+			if col_ind + 1 < rooms_per_side:
+				hallways.append({"type": "hallway",
+					"from": [origin[0] + middle, origin[1] + room_size - 1],
+					"to": [origin[0] + middle, origin[1] + step], "waypoints": []})
+			# Hallway to the room below, first column only
+			if col_ind == 0 and row_ind + 1 < rooms_per_side:
+				hallways.append({"type": "hallway",
+					"from": [origin[0] + room_size - 1, origin[1] + middle],
+					"to": [origin[0] + step, origin[1] + middle], "waypoints": []})
+
+	last = rooms[-1]['origin']
+	objects = [{"type": "key", "position": [1, 2]},
+		{"type": "exit", "position": [last[0] + room_size - 2, last[1] + room_size - 2]}]
+
+	return {"type": "level", "rooms": rooms, "hallways": hallways, "objects": objects}
+
+def random_level_json(num_rooms, height, width, seed=0, min_room_size=4, max_room_size=12):
+	"""
+	Build a random level JSON of the given number of rooms spread over a level of up to the
+	given size, the same for the same seed. The level is split into a grid of equal cells,
+	filled with one room each in row major order, and a random spanning tree of neighbouring
+	cells is connected by hallways, so every room is reachable. Rooms are walled with doors
+	where hallways meet them, and a hallway between rooms that are not lined up turns twice
+	on the line between their cells, which no room or other hallway crosses. The key and the
+	exit are in random rooms.
+
+	Parameters
+	----------
+	num_rooms : int
+		Number of rooms in the level
+	height : int
+		Max number of rows in the level
+	width : int
+		Max number of columns in the level
+	seed : int, default 0
+		Seed of the random number generator
+	min_room_size : int, default 4
+		Min number of rows and columns in each room, at least 4
+	max_room_size : int, default 12
+		Max number of rows and columns in each room
+
+	Returns
+	-------
+	dict
+		JSON representation of the level
+	"""
+	if num_rooms < 1 or min_room_size < 4 or max_room_size < min_room_size:
+		raise ValueError("Level needs a room, and rooms need at least 4 rows and columns.")
+
+	rand = random.Random(seed)
+	# Split the level into cells with about the same shape as the level
+	cell_cols = min(num_rooms, max(1, round(math.sqrt(num_rooms * width / height))))
+	cell_rows = math.ceil(num_rooms / cell_cols)
+	cell_height = height // cell_rows
+	cell_width = width // cell_cols
+	# The first and last row and column of each cell are left for hallways
+	if min(cell_height, cell_width) - 2 < min_room_size:
+		raise ValueError(f"{num_rooms} rooms do not fit in a {height} by {width} level.")
+
+	bounds = [] # Top, left, bottom and right of each room
+	for ind in range(num_rooms):
+		cell_row, cell_col = divmod(ind, cell_cols)
+		rows = rand.randint(min_room_size, min(max_room_size, cell_height - 2))
+		cols = rand.randint(min_room_size, min(max_room_size, cell_width - 2))
+		top = rand.randint(cell_row * cell_height + 1, (cell_row + 1) * cell_height - 1 - rows)
+		left = rand.randint(cell_col * cell_width + 1, (cell_col + 1) * cell_width - 1 - cols)
+		bounds.append((top, left, top + rows - 1, left + cols - 1))
+
+	layouts = []
+	for top, left, bottom, right in bounds:
+		layout = [[0] * (right - left + 1)]
+		layout += [[0] + [1] * (right - left - 1) + [0] for _ in range(bottom - top - 1)]
+		layouts.append(layout + [[0] * (right - left + 1)])
+
+	# Neighbouring cells to the right and below, joined in a random order unless already connected
+	edges = [(ind, ind + 1) for ind in range(num_rooms - 1) if (ind + 1) % cell_cols]
+	edges += [(ind, ind + cell_cols) for ind in range(num_rooms - cell_cols)]
+	rand.shuffle(edges)
+	parents = list(range(num_rooms))
+	def find(ind):
+		while parents[ind] != ind:
+			parents[ind] = parents[parents[ind]]
+			ind = parents[ind]
+		return ind
+
+	hallways = []
+	for first, second in edges:
+		first_root, second_root = find(first), find(second)
+		if first_root == second_root:
+			continue
+		parents[first_root] = second_root
+
+		(top1, left1, bottom1, right1), (top2, left2, bottom2, right2) = bounds[first], bounds[second]
+		if second == first + 1:
+			# From the right wall of the first room to the left wall of the second
+			start = [rand.randint(top1 + 1, bottom1 - 1), right1]
+			end = [rand.randint(top2 + 1, bottom2 - 1), left2]
+			turn = (second % cell_cols) * cell_width
+			waypoints = [[start[0], turn], [end[0], turn]] if start[0] != end[0] else []
+		else:
+			# From the bottom wall of the first room to the top wall of the second
+			start = [bottom1, rand.randint(left1 + 1, right1 - 1)]
+			end = [top2, rand.randint(left2 + 1, right2 - 1)]
+			turn = (second // cell_cols) * cell_height
+			waypoints = [[turn, start[1]], [turn, end[1]]] if start[1] != end[1] else []
+		layouts[first][start[0] - top1][start[1] - left1] = 2
+		layouts[second][end[0] - top2][end[1] - left2] = 2
+		hallways.append({"type": "hallway", "from": start, "to": end, "waypoints": waypoints})
+
+	rooms = [{"type": "room", "origin": [top, left],
+		"bounds": {"rows": bottom - top + 1, "columns": right - left + 1}, "layout": layout}
+		for (top, left, bottom, right), layout in zip(bounds, layouts)]
+
+	# Key and exit on different tiles inside of random rooms
+	positions = []
+	while len(positions) < 2:
+		top, left, bottom, right = bounds[rand.randrange(num_rooms)]
+		pos = [rand.randint(top + 1, bottom - 1), rand.randint(left + 1, right - 1)]
+		if pos not in positions:
+			positions.append(pos)
+	objects = [{"type": "key", "position": positions[0]}, {"type": "exit", "position": positions[1]}]
+
+	return {"type": "level", "rooms": rooms, "hallways": hallways, "objects": objects}
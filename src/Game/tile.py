@@ -11,6 +11,8 @@ class Tile(ABC):
 	col : int
 		column of the tile
 	"""
+	__slots__ = ('_row', '_col')
+
 	def __init__(self, row, col):
 		if row < 0 or col < 0:
 			raise ValueError("Row and column must be positive.")
@@ -110,6 +112,8 @@ class Space(Tile):
 	col : int
 		column of the tile
 	"""
+	__slots__ = ('_person', '_has_key', '_level_exit', '_is_unlocked')
+
 	def __init__(self, row, col):
 		self._person = None
 		self._has_key = False
@@ -236,7 +240,7 @@ class Space(Tile):
 		return "1"
 
 	def __eq__(self, other):
-		if isinstance(other, Space):
+		if isinstance(other, Tile) and other.get_type() == "space":
 			return self._row == other.get_row() and self._col == other.get_col()
 		return False
 
@@ -252,6 +256,8 @@ class Door(Tile):
 	col : int
 		column of the tile
 	"""
+	__slots__ = ('_person', '_has_key', '_level_exit', '_is_unlocked')
+
 	def __init__(self, row, col):
 		self._person = None
 		self._has_key = False
@@ -370,11 +376,13 @@ class Door(Tile):
 		return "2"
 
 	def __eq__(self, other):
-		if isinstance(other, Door):
+		if isinstance(other, Tile) and other.get_type() == "door":
 			return self._row == other.get_row() and self._col == other.get_col()
 		return False
 
 class Wall(Tile):
+	__slots__ = ()
+
 	def has_key(self):
 		return False
 	
@@ -397,7 +405,23 @@ class Wall(Tile):
 		return "0"
 
 	def __eq__(self, other):
-		if isinstance(other, Wall):
+		if isinstance(other, Tile) and other.get_type() == "wall":
 			return self._row == other.get_row() and self._col == other.get_col()
 		return False
 
+class VoidWall(Wall):
+	"""
+	Wall filling the parts of a level outside of every room and hallway. Void walls hold no
+	state, so a single instance, VOID_WALL, stands in for all of them in a level's storage
+	and has no position. Levels return a positioned Wall in its place from get_tile.
+	"""
+	__slots__ = ()
+
+	def __init__(self):
+		self._row = None
+		self._col = None
+
+	def __eq__(self, other):
+		return other is self
+
+VOID_WALL = VoidWall()
@@ -0,0 +1,183 @@
+from .tile import Tile
+
+# Tile type codes, matching the integers used in level layouts
+WALL = 0
+SPACE = 1
+DOOR = 2
+
+TILE_TYPES = {WALL: "wall", SPACE: "space", DOOR: "door"}
+
+# Tile type code of each tile type name
+TILE_CODES = {name: code for code, name in TILE_TYPES.items()}
+
+class TileGrid:
+	"""
+	Compact representation of the geometry of a level, with tile types stored as one byte
+	per tile in a flat bytearray. The actors, keys and exits on the tiles are held by the
+	Level, like the tiles of a LevelTemplate.
+
+	The grid is indexed like the nested list of tiles it replaces, grid[row][col] returns a
+	lightweight TileView supporting the same methods as a Space, Door or Wall.
+
+	Parameters
+	----------
+	height : int
+		Number of rows in the grid
+	width : int
+		Number of columns in the grid
+	"""
+	def __init__(self, height, width):
+		self._height = height
+		self._width = width
+		# Every tile starts as a wall
+		self._types = bytearray(height * width)
+
+	def get_height(self):
+		return self._height
+
+	def get_width(self):
+		return self._width
+
+	def set_type(self, row, col, code):
+		"""
+		Sets the type of the tile at the given position
+
+		Parameters
+		----------
+		row : int
+			row index of the tile
+		col : int
+			col index of the tile
+		code : int
+			Type code of the tile, one of WALL, SPACE or DOOR
+		"""
+		self._types[row * self._width + col] = code
+
+	def get_type_code(self, row, col):
+		"""
+		Retrieves the type code of the tile at the given position
+
+		Returns
+		-------
+		int
+			Type code of the tile, one of WALL, SPACE or DOOR
+		"""
+		return self._types[row * self._width + col]
+
+	def get_tile(self, row, col):
+		"""
+		Retrieves a view of the tile at the given position
+
+		Parameters
+		----------
+		row : int
+			row index of the tile
+		col : int
+			col index of the tile
+
+		Returns
+		-------
+		TileView
+			View of the tile at the given position
+		"""
+		if not (0 <= row < self._height and 0 <= col < self._width):
+			raise IndexError(f"({row}, {col}) is outside of the grid.")
+		return TileView(self, row, col)
+
+	def __getitem__(self, row):
+		# Wrap negative indices the same way the nested list does
+		if row < 0:
+			row += self._height
+		if not 0 <= row < self._height:
+			raise IndexError("Grid row index out of range.")
+		return GridRow(self, row)
+
+	def __len__(self):
+		return self._height
+
+	def __iter__(self):
+		for row in range(self._height):
+			yield GridRow(self, row)
+
+class GridRow:
+	"""
+	A single row of a TileGrid, indexed by column
+
+	Parameters
+	----------
+	grid : TileGrid
+		Grid the row belongs to
+	row : int
+		row index of the row
+	"""
+	__slots__ = ('_grid', '_row')
+
+	def __init__(self, grid, row):
+		self._grid = grid
+		self._row = row
+
+	def __getitem__(self, col):
+		width = self._grid.get_width()
+		if col < 0:
+			col += width
+		if not 0 <= col < width:
+			raise IndexError("Grid column index out of range.")
+		return TileView(self._grid, self._row, col)
+
+	def __len__(self):
+		return self._grid.get_width()
+
+	def __iter__(self):
+		for col in range(self._grid.get_width()):
+			yield TileView(self._grid, self._row, col)
+
+class TileView(Tile):
+	"""
+	Lightweight read only view of the type of a single tile in a TileGrid. Views hold no
+	state of their own, so any number of views of the same tile can exist. The Level wraps
+	spaces and doors in a LevelTile to read what is on them.
+
+	Parameters
+	----------
+	grid : TileGrid
+		Grid the tile belongs to
+	row : int
+		row of the tile
+	col : int
+		column of the tile
+	"""
+	__slots__ = ('_grid',)
+
+	def __init__(self, grid, row, col):
+		self._grid = grid
+		self._row = row
+		self._col = col
+
+	def _code(self):
+		return self._grid._types[self._row * self._grid._width + self._col]
+
+	def get_person(self):
+		return None
+
+	def has_key(self):
+		return False
+
+	def is_exit(self):
+		return False
+
+	def is_unlocked(self):
+		return False
+
+	def get_type(self):
+		return TILE_TYPES[self._code()]
+
+	def __str__(self):
+		return str(self._code())
+
+	def __repr__(self):
+		return str(self._code())
+
+	def __eq__(self, other):
+		if isinstance(other, Tile) and other.get_type() == self.get_type():
+			return self._row == other.get_row() and self._col == other.get_col()
+		return False
@@ -16,7 +16,8 @@ class LocalObserver(AbstractObserver):
 			print('No state to render')
 			return
 		
-		layout = self._state.get_layout()
+		# Copy the layout before drawing on it, it may be shared with other states
+		layout = [list(row) for row in self._state.get_layout()]
 		state_json = self._state.get_json()
 
 		other_things = state_json['level']['objects'] + state_json['players'] + state_json['adversaries']
@@ -0,0 +1,106 @@
+import random
+
+from ..Common.abstract_player import AbstractPlayer
+
+class AIPlayer(AbstractPlayer):
+	"""
+	Automated player which only uses what it can see in its player updates. It heads for the
+	key once it has seen it, then for the exit, staying off of tiles next to adversaries.
+	When it has seen neither it explores, preferring tiles it has visited the least.
+
+	Parameters
+	----------
+	name : str
+		Name of the player
+	seed : int, default None
+		Seed for breaking ties between equally good moves
+	"""
+	__slots__ = ('_rand', '_key_pos', '_exit_pos', '_visits')
+
+	def __init__(self, name, seed=None):
+		self._rand = random.Random(seed)
+		self._key_pos = None # Where the key was last seen this level
+		self._exit_pos = None # Where the exit was seen this level
+		self._visits = {} # Number of times each position was moved to this level
+		super().__init__(name)
+
+	def send_message(self, msg):
+		"""
+		Forgets what was learned about the level when a new level starts
+
+		Parameters
+		----------
+		msg : dict or str
+			JSON message sent to the player
+		"""
+		if isinstance(msg, dict) and msg.get('type') == 'start-level':
+			self._key_pos = None
+			self._exit_pos = None
+			self._visits = {}
+
+	def update_state(self, state):
+		"""
+		Updates the player's knowledge of the game state, remembering where the key and
+		exit are when they are in view
+		"""
+		super().update_state(state)
+		row, col = self._player_state['position']
+		visible_types = {}
+		for obj in self._player_state['objects']:
+			visible_types[tuple(obj['position'])] = obj['type']
+
+		for pos, obj_type in visible_types.items():
+			if obj_type == 'key':
+				self._key_pos = pos
+			elif obj_type == 'exit':
+				self._exit_pos = pos
+
+		# The key is no longer where it was seen, someone picked it up
+		if (self._key_pos is not None and abs(self._key_pos[0] - row) <= 2 and
+			abs(self._key_pos[1] - col) <= 2 and visible_types.get(self._key_pos) != 'key'):
+			self._key_pos = None
+
+	def request_move(self):
+		"""
+		Chooses the best tile in reach, avoiding adversaries first, then getting closer to
+		the key or exit, then visiting new tiles
+
+		Returns
+		-------
+		(int, int)
+			row, col index to move to
+		"""
+		row, col = self._player_state['position']
+		layout = self._player_state['layout']
+		adversaries = [tuple(actor['position']) for actor in self._player_state['actors']
+			if actor['type'] != 'player']
+		players = [tuple(actor['position']) for actor in self._player_state['actors']
+			if actor['type'] == 'player']
+		target = self._key_pos if self._key_pos is not None else self._exit_pos
+
+		best_move = None
+		best_score = None
+		for d_row in range(-2, 3):
+			for d_col in range(-2, 3):
+				pos = (row + d_row, col + d_col)
+				if abs(d_row) + abs(d_col) > 2 or pos[0] < 0 or pos[1] < 0:
+					continue
+				# Walls and tiles outside of the level
+				if layout[2 + d_row][2 + d_col] == 0 or pos in players:
+					continue
+
+				danger = sum(1 for adv in adversaries if abs(adv[0] - pos[0]) + abs(adv[1] - pos[1]) <= 1)
+				distance = 0 if target is None else abs(target[0] - pos[0]) + abs(target[1] - pos[1])
+				score = (danger, distance + 2 * self._visits.get(pos, 0), self._rand.random())
+				if best_score is None or score < best_score:
+					best_move = pos
+					best_score = score
+
+		self._visits[best_move] = self._visits.get(best_move, 0) + 1
+		return best_move
+
+	def render_view(self):
+		"""
+		Render's the player's current knowledge of the state
+		"""
+		pass
@@ -0,0 +1,105 @@
+import json
+
+from ..Common.abstract_player import AbstractPlayer
+
+class AsyncRemotePlayer(AbstractPlayer):
+	"""
+	Remote player for the asyncio server engine, where moves are requested
+	through an AsyncConnection. Methods that wait on the client return
+	coroutines which the GameManager awaits
+
+	Parameters
+	----------
+	conn : AsyncConnection
+		Connection to the client
+	"""
+	def __init__(self, conn):
+		self._conn = conn
+		super().__init__(None)
+
+	def get_name(self, first_time=False):
+		"""
+		If name has not been set, request a name from the client
+
+		Returns
+		-------
+		str or coroutine
+			Name of player, or a coroutine resolving to it if first_time
+		"""
+		if first_time:
+			return self._request_name()
+			
+		return self._name
+	
+	async def _request_name(self):
+		self._send(json.dumps("name"))
+		name = json.loads(await self._receive())
+		self._name = name
+		return name
+	
+	def update_state(self, state: dict):
+		"""
+		Updates the players knowledge of the game state
+		"""
+		self._send(json.dumps(state))
+
+	async def request_move(self):
+		"""
+		Requests a move from the client
+
+		Returns
+		-------
+		(int, int)
+			row, column indices to move to
+		"""
+		self._send(json.dumps("move"))
+		move = await self._receive()
+		as_json = json.loads(move)
+		return as_json['to']
+	
+	def render_view(self):
+		"""
+		Render's the player's current knowledge of the state
+		"""
+		pass
+	
+	def send_message(self, msg):
+		"""
+		Encodes the given message and sends it to the client
+
+		Parameters
+		----------
+		msg : dict or str
+			JSON message to send to player
+		"""
+		self._send(json.dumps(msg))
+	
+	def _send(self, msg):
+		"""
+		Queues the message to be written to the client
+
+		Parameters
+		----------
+		msg : str
+			Message to send to client
+		"""
+		self._conn.send(msg)
+	
+	async def _receive(self):
+		"""
+		Recieve a message from the client
+
+		Returns
+		----------
+		str
+			Message recieved from client
+		"""
+		return await self._conn.receive()
+	
+	def disconnect(self):
+		"""
+		Close the actors connection once queued messages are written. Unlike
+		the threaded remote actors this does not exit, as that would stop every
+		game on the event loop
+		"""
+		self._conn.close()
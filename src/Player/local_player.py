@@ -75,7 +75,8 @@ class LocalPlayer(AbstractPlayer):
 			print('No state to render')
 			return
 		print(f'HEALTH: {self._player_state["health"]}')
-		layout_rows = self._player_state['layout']
+		# Copy the layout, the symbols drawn on it are not part of the state
+		layout_rows = [list(row) for row in self._player_state['layout']]
 
 		for thing in self._player_state['objects'] + self._player_state['actors']:
 			symbol = self._get_symbol(thing['type'])
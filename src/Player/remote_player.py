@@ -1,6 +1,4 @@
-import socket
 import json
-import time
 import sys
 
 from ..Common.abstract_player import AbstractPlayer
@@ -11,11 +9,11 @@ class RemotePlayer(AbstractPlayer):
 
 	Parameters
 	----------
-	sock : socket.SocketType
-		Socket connection to the server
+	conn : FramedSocket
+		Framed socket connection to the client
 	"""
-	def __init__(self, sock):
-		self._socket = sock
+	def __init__(self, conn):
+		self._conn = conn
 		super().__init__(None)
 
 	def get_name(self, first_time=False):
@@ -62,18 +60,19 @@ class RemotePlayer(AbstractPlayer):
 	
 	def send_message(self, msg):
 		"""
-		Sends the given message to the client
+		Encodes the given message and sends it to the client
 
 		Parameters
 		----------
-		msg : str
-			Message to send to player
+		msg : dict or str
+			JSON message to send to player
 		"""
-		self._send(msg)
+		self._send(json.dumps(msg))
 	
 	def _send(self, msg):
 		"""
-		Sends the message through the socket
+		Queues the message to be sent through the socket, it is sent with
+		any other queued messages on the next flush or receive
 
 		Parameters
 		----------
@@ -82,11 +81,18 @@ class RemotePlayer(AbstractPlayer):
 		"""
 		# Attempt to send message to client, disconnect if client shut down
 		try:
-			self._socket.send(msg.encode())
-		except ConnectionResetError:
+			self._conn.send(msg)
+		except ConnectionError:
+			self.disconnect()
+
+	def flush(self):
+		"""
+		Writes all queued messages to the client in one send
+		"""
+		try:
+			self._conn.flush()
+		except ConnectionError:
 			self.disconnect()
-		
-		time.sleep(1)
 	
 	def _receive(self):
 		"""
@@ -99,18 +105,13 @@ class RemotePlayer(AbstractPlayer):
 		"""
 		# Attempt to recieve message, disconnect if client shut down
 		try:
-			data = self._socket.recv(4096)
-		except ConnectionResetError:
-			self.disconnect()
-		# Server sent empty bytes, disconnect signal
-		if not data:
+			return self._conn.receive()
+		except ConnectionError:
 			self.disconnect()
-		response = data.decode()
-		return response
 	
 	def disconnect(self):
 		"""
 		Close the actors socket, if remotely connected
 		"""
-		self._socket.close()
+		self._conn.close()
 		sys.exit()
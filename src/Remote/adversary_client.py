@@ -4,6 +4,7 @@ import sys
 
 from ..Adversary.local_zombie import LocalZombie
 from ..Adversary.local_ghost import LocalGhost
+from .transport import FramedSocket
 
 class AdversaryClient:
 	"""
@@ -19,6 +20,7 @@ class AdversaryClient:
 	"""
 	def __init__(self, host, port):
 		self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		self._conn = FramedSocket(self._socket)
 		self._adversary = None
 		self._host = host
 		self._port = port
@@ -96,8 +98,8 @@ class AdversaryClient:
 		"""
 		# Attempt to send message to server, disconnect if server shut down
 		try:
-			self._socket.sendall(msg.encode())
-		except ConnectionResetError:
+			self._conn.send(msg)
+		except ConnectionError:
 			self._disconnect()
 
 	def _receive(self):
@@ -111,19 +113,14 @@ class AdversaryClient:
 		"""
 		# Attempt to recieve message, disconnect if server shut down
 		try:
-			data = self._socket.recv(4096)
-		except ConnectionResetError:
+			return self._conn.receive()
+		except ConnectionError:
 			self._disconnect()
-		# Server sent empty bytes, disconnect signal
-		if not data:
-			self._disconnect()
-		response = data.decode()
-		return response
 	
 	def _disconnect(self):
 		"""
 		Close the socket and program
 		"""
 		print('Server disconnected')
-		self._socket.close()
+		self._conn.close()
 		sys.exit()
@@ -0,0 +1,100 @@
+import asyncio
+import socket
+
+from .transport import encode_frame, read_frame
+
+class AsyncConnection:
+	"""
+	Client connection for the asyncio server engine, sending and recieving
+	length-prefixed frames. Outbound messages are queued and written by a
+	single pump coroutine per connection, which coalesces every message queued
+	since its last write into one write and waits for the transport to drain
+	before writing again, without blocking any other connection or game
+
+	Parameters
+	----------
+	reader : asyncio.StreamReader
+		Stream to read client messages from
+	writer : asyncio.StreamWriter
+		Stream to write messages to the client
+	"""
+	def __init__(self, reader, writer):
+		self._reader = reader
+		self._writer = writer
+		# Writes are already coalesced, so don't let Nagle's algorithm hold
+		# them back waiting on acknowledgements
+		sock = writer.get_extra_info('socket')
+		if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+			sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		self._outbox = asyncio.Queue()
+		self._closed = False
+		self._pump_task = asyncio.get_running_loop().create_task(self._pump())
+
+	def send(self, msg):
+		"""
+		Queues the message to be written to the client
+
+		Parameters
+		----------
+		msg : str
+			Message to send to client
+		"""
+		if not self._closed:
+			self._outbox.put_nowait(msg)
+
+	async def receive(self):
+		"""
+		Recieve a message from the client
+
+		Returns
+		-------
+		str
+			Message recieved from client
+		"""
+		# Attempt to recieve message, close if client shut down
+		try:
+			return await read_frame(self._reader)
+		except ConnectionError:
+			self.close()
+			raise
+
+	def close(self):
+		"""
+		Close the connection once all queued messages have been written
+		"""
+		if not self._closed:
+			self._closed = True
+			self._outbox.put_nowait(None)
+
+	async def wait_closed(self):
+		"""
+		Wait until the queued messages have been written and the connection closed
+		"""
+		await self._pump_task
+
+	async def _pump(self):
+		"""
+		Write queued messages to the client in order until the connection closes
+		"""
+		closing = False
+		while not closing:
+			frames = []
+			msg = await self._outbox.get()
+			# Gather everything queued since the last write into one write
+			while True:
+				if msg is None:
+					closing = True
+					break
+				frames.append(encode_frame(msg))
+				if self._outbox.empty():
+					break
+				msg = self._outbox.get_nowait()
+
+			try:
+				self._writer.write(b''.join(frames))
+				await self._writer.drain()
+			except ConnectionError:
+				self._closed = True
+				break
+
+		self._writer.close()
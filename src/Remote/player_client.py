@@ -3,6 +3,7 @@ import socket
 import sys
 
 from ..Player.local_player import LocalPlayer
+from .transport import FramedSocket
 
 class PlayerClient:
 	"""
@@ -18,6 +19,7 @@ class PlayerClient:
 	"""
 	def __init__(self, host, port):
 		self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		self._conn = FramedSocket(self._socket)
 		self._player = LocalPlayer()
 		self._host = host
 		self._port = port
@@ -55,9 +57,9 @@ class PlayerClient:
 			elif self.is_start_level(req):
 				print("Starting level: ", req['level'])
 				print("Players in game: ", ', '.join(req['players']))
-			# Player update
-			elif self.is_player_update(req):
-				if req['message'] is not None:
+			# Player update, or the fields of it that changed
+			elif self.is_player_update(req) or self.is_player_update_delta(req):
+				if req.get('message') is not None:
 					print(req['message'])
 				self._player.update_state(req)
 			# Move request
@@ -85,7 +87,7 @@ class PlayerClient:
 					print("="*20)
 			# Server scores message
 			elif self.is_server_scores(req):
-				self.print_scores(req['scores'])
+				self.print_scores(req)
 			# Move result for damage
 			elif 'Damage' in req:
 				print(f'Damage taken: {req.split("-")[-1]} HP')
@@ -129,6 +131,15 @@ class PlayerClient:
 		)
 		return fields
 	
+	@staticmethod
+	def is_player_update_delta(req):
+		fields = (
+			type(req) == dict and
+			"type" in req and
+			req['type'] == "player-update-delta"
+		)
+		return fields
+	
 	@staticmethod
 	def is_end_level(req):
 		fields = (
@@ -156,38 +167,28 @@ class PlayerClient:
 		fields = (
 			type(req) == dict and
 			"type" in req and
-			"scores" in req and
+			"leaderboards" in req and
+			"rank" in req and
 			req['type'] == "server-scores"
 		)
 		return fields
 	
-	def print_scores(self, player_score_list):
+	def print_scores(self, server_scores):
 		"""
-		Prints the server leaderboard
+		Prints the server leaderboards and the player's rank on each
 
 		Parameters
 		----------
-		player_score_list : List[dict]
-			List of player score objects from around the server
+		server_scores : dict
+			(server-scores) JSON object, with the top scores for each metric
+			already ranked by the server
 		"""
-
-		# Sort the player scores by exits, ejects, and keys
-		exits = sorted(player_score_list, key=lambda score: score['exits'])
-		ejects = sorted(player_score_list, key=lambda score: score['ejects'], reverse=True)
-		keys = sorted(player_score_list, key=lambda score: score['keys'])
-		# Print all the rankings
-		print("="*20)
-		print("Snarl Server Exits Leaderboard:")
-		for p in exits:
-			print(f'{p["name"]} ({p["exits"]})')
-		print("="*20)
-		print("Snarl Server Ejects Leaderboard:")
-		for p in ejects:
-			print(f'{p["name"]} ({p["ejects"]})')
-		print("="*20)
-		print("Snarl Server Keys Leaderboard:")
-		for p in keys:
-			print(f'{p["name"]} ({p["keys"]})')
+		for metric, title in (("exits", "Exits"), ("ejects", "Ejects"), ("keys", "Keys")):
+			print("="*20)
+			print(f"Snarl Server {title} Leaderboard:")
+			for p in server_scores['leaderboards'][metric]:
+				print(f'{p["name"]} ({p[metric]})')
+			print(f'Your rank: {server_scores["rank"][metric]} of {server_scores["total"]}')
 
 	def _send(self, msg):
 		"""
@@ -200,8 +201,8 @@ class PlayerClient:
 		"""
 		# Attempt to send message to server, disconnect if server shut down
 		try:
-			self._socket.sendall(msg.encode())
-		except ConnectionResetError:
+			self._conn.send(msg)
+		except ConnectionError:
 			self._disconnect()
 
 	def _receive(self):
@@ -215,18 +216,13 @@ class PlayerClient:
 		"""
 		# Attempt to recieve message, disconnect if server shut down
 		try:
-			data = self._socket.recv(4096)
-		except ConnectionResetError:
-			self._disconnect()
-		# Server sent empty bytes, disconnect signal
-		if not data:
+			return self._conn.receive()
+		except ConnectionError:
 			self._disconnect()
-		response = data.decode()
-		return response
 	
 	def _disconnect(self):
 		"""
 		Close the socket and program
 		"""
-		self._socket.close()
+		self._conn.close()
 		sys.exit()
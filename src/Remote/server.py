@@ -1,13 +1,19 @@
+import asyncio
 import socket
 import json
 import sys
 import threading
-import os
 
 from ..Game.game_manager import GameManager
+from ..Game.level import LevelTemplate
 from ..Player.remote_player import RemotePlayer
 from ..Observer.local_observer import LocalObserver
 from ..Adversary.remote_adversary import RemoteAdversary
+from ..Player.async_remote_player import AsyncRemotePlayer
+from ..Adversary.async_remote_adversary import AsyncRemoteAdversary
+from .async_connection import AsyncConnection
+from .transport import FramedSocket
+from ..Store.memory_store import MemoryStore
 
 class Server:
 	"""
@@ -20,7 +26,8 @@ class Server:
 	port : int
 		Port to accept clients on
 	levels : List[dict]
-		List of level JSON objects to use in game
+		List of level JSON objects to use in game, built into templates once and
+		shared by every game on the server
 	max_players : int, default 4
 		Max number of players to allow in the game
 	timeout : int, default 30
@@ -35,21 +42,37 @@ class Server:
 		Whether to allow remote adversaries to join
 	observe : bool, default False
 		Whether to display all game updates on the server
+	engine : str, default "thread"
+		How games are hosted, "thread" runs every game in its own thread, while
+		"asyncio" runs every connection and game as a coroutine on one event loop
+	delta_updates : bool, default False
+		Whether to send players player-update-delta messages of only what
+		changed in their view, rather than a full update after every move
+	store : AbstractStore, default None
+		Store of player names and scores shared by every game, names and scores
+		are kept in memory if not given
 	"""
 	def __init__(self, host, port, levels, max_players=4, timeout=30, combat=False,
-	max_games=1, remote_adversaries=False, observe=False):
+	max_games=1, remote_adversaries=False, observe=False, engine="thread",
+	delta_updates=False, store=None):
 		if max_players > 4:
 			raise ValueError('Max players cannot exceed 4')
+		if engine not in ("thread", "asyncio"):
+			raise ValueError(f'{engine} is an invalid server engine.')
 		
 		self._max_players = max_players
 		self._timeout = timeout
 		self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 		self._connections = []
-		self._levels = levels
+		self._levels = [LevelTemplate(level_json) for level_json in levels] # Shared by every game
 		self._combat = combat
 		self._max_games = max_games
 		self._remote_adversaries = remote_adversaries
 		self._observe = observe
+		self._engine = engine
+		self._delta_updates = delta_updates
+		self._arrivals = None # Identified connections (asyncio engine)
+		self._store = MemoryStore() if store is None else store
 
 		try:
 			self._socket.bind((host, port))
@@ -57,16 +80,23 @@ class Server:
 			print('Address already in use')
 			sys.exit()
 		
-		# Initialize log file
-		server_data = {"player_names": [], "player_scores": []}
-		server_log_path = os.path.join(os.getcwd(), 'src/server_log.json')
-		with open(server_log_path, 'w') as server_file:
-			json.dump(server_data, server_file)
-		
 	def run(self):
 		"""
 		Run the server
 		"""
+		try:
+			if self._engine == "asyncio":
+				asyncio.run(self._run_async())
+			else:
+				self._run_threaded()
+		finally:
+			self._store.close()
+
+	def _run_threaded(self):
+		"""
+		Run the server, accepting connections serially and running each game in
+		its own thread
+		"""
 		# Begin accepting client connections
 		self._socket.listen()
 		threads = []
@@ -122,10 +152,15 @@ class Server:
 		# Wait for as many players in count 
 		while len(players) < count:
 			# Accept a new connection
-			conn, addr = self._socket.accept()
+			sock, addr = self._socket.accept()
+			sock.settimeout(None)
+			conn = FramedSocket(sock)
 			# Ask for connection to identify themselves
-			conn.sendall(json.dumps("identify").encode())
-			conn_type = json.loads(conn.recv(4096).decode())
+			conn.send(json.dumps("identify"))
+			try:
+				conn_type = json.loads(conn.receive())
+			except (ConnectionError, ValueError):
+				conn_type = None
 
 			if conn_type == "player":
 				# Create new user
@@ -159,7 +194,8 @@ class Server:
 		game_id : int
 			ID number of the game
 		"""
-		manager = GameManager(self._levels, combat=self._combat, game_id=game_id)
+		manager = GameManager(self._levels, combat=self._combat, game_id=game_id,
+			delta_updates=self._delta_updates, store=self._store)
 
 		for player in players:
 			manager.register_player(player)
@@ -172,3 +208,126 @@ class Server:
 		
 		manager.play_game()
 
+	async def _run_async(self):
+		"""
+		Run the server on an asyncio event loop. Each connection identifies
+		itself in its own coroutine, so a slow client cannot stall the accept
+		loop, and each game is a task on the same loop
+		"""
+		self._arrivals = asyncio.Queue()
+		self._socket.listen()
+		self._socket.setblocking(False)
+		server = await asyncio.start_server(self._identify_async, sock=self._socket)
+		games = []
+
+		async with server:
+			for game_id in range(1, self._max_games + 1):
+				# Wait for initial player, then additional players
+				players, adversaries = await self._wait_for_players_async(1, None)
+				more_players, more_adversaries = await self._wait_for_players_async(
+					self._max_players - 1, self._timeout)
+
+				games.append(asyncio.create_task(self._new_game_async(
+					players + more_players, adversaries + more_adversaries, game_id)))
+
+			await asyncio.gather(*games)
+
+		# Close all connections at conclusion of all games
+		for conn in self._connections:
+			conn.close()
+		await asyncio.gather(*[conn.wait_closed() for conn in self._connections])
+
+	async def _identify_async(self, reader, writer):
+		"""
+		Asks a new connection to identify itself and queues it for the game
+		currently accepting clients
+
+		Parameters
+		----------
+		reader : asyncio.StreamReader
+			Stream to read client messages from
+		writer : asyncio.StreamWriter
+			Stream to write messages to the client
+		"""
+		conn = AsyncConnection(reader, writer)
+		conn.send(json.dumps("identify"))
+		try:
+			conn_type = json.loads(await conn.receive())
+		except (ConnectionError, ValueError):
+			conn_type = None
+
+		if conn_type == "player":
+			actor = AsyncRemotePlayer(conn)
+		elif conn_type == "adversary" and self._remote_adversaries:
+			actor = AsyncRemoteAdversary(conn)
+		else:
+			conn.close()
+			return
+
+		self._connections.append(conn)
+		await self._arrivals.put((conn_type, actor))
+
+	async def _wait_for_players_async(self, count, timeout):
+		"""
+		Waits for identified players and adversaries to arrive
+
+		Parameters
+		----------
+		count : int
+			Max number of players to wait for
+		timeout : int or None
+			Max seconds to wait between arrivals, None to wait indefinitely
+		
+		Returns
+		-------
+		List[AbstractPlayer], List[AbstractAdversary]
+			Lists of players and adversaries that connected to server
+		"""
+		players = []
+		adversaries = []
+
+		while len(players) < count:
+			try:
+				conn_type, actor = await asyncio.wait_for(self._arrivals.get(), timeout)
+			except asyncio.TimeoutError:
+				break
+
+			if conn_type == "player":
+				players.append(actor)
+			else:
+				adversaries.append(actor)
+
+		return players, adversaries
+
+	async def _new_game_async(self, players, adversaries, game_id):
+		"""
+		Begin a new game of Snarl on the event loop with the given players. A
+		failing game only ends its own task, like a failing thread
+
+		Parameters
+		----------
+		players : List[AbstractPlayer]
+			Players to be registered to the game
+		adversaries : List[AbstractAdversary]
+			Adversaries to be registered to the game
+		game_id : int
+			ID number of the game
+		"""
+		manager = GameManager(self._levels, combat=self._combat, game_id=game_id,
+			delta_updates=self._delta_updates, store=self._store)
+
+		try:
+			for player in players:
+				await manager.register_player_async(player)
+			
+			for adversary in adversaries:
+				manager.register_adversary(adversary)
+			
+			if self._observe:
+				manager.register_observer(LocalObserver())
+			
+			await manager.play_game_async()
+		except Exception as e:
+			print(f'Game {game_id}: Ended with error ({e})')
+			for actor in players + adversaries:
+				actor.disconnect()
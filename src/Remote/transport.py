@@ -0,0 +1,157 @@
+import asyncio
+import socket
+import struct
+
+# Every message on the wire is a 4 byte big-endian length followed by that many
+# bytes of UTF-8 encoded JSON
+HEADER = struct.Struct('!I')
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+def encode_frame(msg):
+	"""
+	Encode the message as a length-prefixed frame
+
+	Parameters
+	----------
+	msg : str
+		Message to encode
+
+	Returns
+	-------
+	bytes
+		Header and encoded message
+	"""
+	data = msg.encode()
+	return HEADER.pack(len(data)) + data
+
+def _message_size(header):
+	"""
+	Retrieve the size of the message following the given header
+
+	Parameters
+	----------
+	header : bytes
+		Length prefix of a frame
+
+	Returns
+	-------
+	int
+		Number of bytes in the message
+	"""
+	size = HEADER.unpack(header)[0]
+	if size > MAX_MESSAGE_SIZE:
+		raise ValueError(f'Message of {size} bytes exceeds maximum size.')
+	return size
+
+class FramedSocket:
+	"""
+	Length-prefixed message framing over a blocking socket. Outbound frames are
+	queued and written together in a single send when the socket is flushed,
+	which happens before every receive, when the queue grows past its limit or
+	when flush is called. Recieved bytes are buffered so a read never returns
+	part of a message or more than one message
+
+	Parameters
+	----------
+	sock : socket.SocketType
+		Connected socket
+	max_pending : int, default 256KB
+		Bytes that may be queued before a send blocks to flush them
+	"""
+	def __init__(self, sock, max_pending=256 * 1024):
+		self._socket = sock
+		# Frames are already coalesced, so don't let Nagle's algorithm hold
+		# them back waiting on acknowledgements
+		if sock.family in (socket.AF_INET, socket.AF_INET6):
+			self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		self._buffer = bytearray()
+		self._pending = []
+		self._pending_size = 0
+		self._max_pending = max_pending
+
+	def send(self, msg):
+		"""
+		Queue the message to be sent as a single frame
+
+		Parameters
+		----------
+		msg : str
+			Message to send
+		"""
+		frame = encode_frame(msg)
+		self._pending.append(frame)
+		self._pending_size += len(frame)
+		# Backpressure, block on the socket instead of queueing without bound
+		if self._pending_size >= self._max_pending:
+			self.flush()
+
+	def flush(self):
+		"""
+		Write all queued frames to the socket in one send, blocking until the
+		socket accepts them
+		"""
+		if not self._pending:
+			return
+		data = b''.join(self._pending)
+		self._pending = []
+		self._pending_size = 0
+		self._socket.sendall(data)
+
+	def receive(self):
+		"""
+		Recieve the next whole message, blocking until it has arrived. Queued
+		messages are sent first, as the other end may be waiting on them
+
+		Returns
+		-------
+		str
+			Message recieved
+		"""
+		self.flush()
+		while True:
+			if len(self._buffer) >= HEADER.size:
+				end = HEADER.size + _message_size(self._buffer[:HEADER.size])
+				if len(self._buffer) >= end:
+					data = bytes(self._buffer[HEADER.size:end])
+					del self._buffer[:end]
+					return data.decode()
+
+			data = self._socket.recv(65536)
+			# Empty bytes, other end shut down
+			if not data:
+				raise ConnectionResetError('Connection closed')
+			self._buffer += data
+
+	def settimeout(self, timeout):
+		self._socket.settimeout(timeout)
+
+	def close(self):
+		"""
+		Send any queued messages and close the socket
+		"""
+		try:
+			self.flush()
+		except OSError:
+			pass
+		self._socket.close()
+
+async def read_frame(reader):
+	"""
+	Read the next whole message from an asyncio stream
+
+	Parameters
+	----------
+	reader : asyncio.StreamReader
+		Stream to read from
+
+	Returns
+	-------
+	str
+		Message recieved
+	"""
+	try:
+		header = await reader.readexactly(HEADER.size)
+		data = await reader.readexactly(_message_size(header))
+	except asyncio.IncompleteReadError:
+		raise ConnectionResetError('Connection closed')
+	return data.decode()
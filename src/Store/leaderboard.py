@@ -0,0 +1,96 @@
+import heapq
+from collections import Counter
+
+# Leaderboard metrics, and whether a higher value ranks better
+METRICS = {"exits": True, "ejects": False, "keys": True}
+
+class Leaderboard:
+	"""
+	Rankings of player scores for each metric, updated as scores are added. For each metric
+	only the best scores are kept, in a heap, along with a count of the scores with each
+	value, so adding a score and ranking it do not depend on how many scores there are.
+
+	Players are ranked by most exits, fewest ejects and most keys. Ties are ranked in the
+	order the scores were added.
+
+	Parameters
+	----------
+	size : int, default 10
+		Number of top scores to keep for each metric
+	"""
+	def __init__(self, size=10):
+		self._size = size
+		self._count = 0
+		self._top = {metric: [] for metric in METRICS}
+		self._values = {metric: Counter() for metric in METRICS}
+
+	def _sort_key(self, metric, value, order):
+		"""
+		Key which is smaller for worse scores, so the worst kept score is at the top of the heap
+		"""
+		return (value if METRICS[metric] else -value, -order)
+
+	def add(self, score):
+		"""
+		Adds a player's score to the rankings
+
+		Parameters
+		----------
+		score : dict
+			(player-score) JSON object
+		"""
+		self._count += 1
+		for metric in METRICS:
+			value = score[metric]
+			self._values[metric][value] += 1
+			entry = (self._sort_key(metric, value, self._count), score)
+			if len(self._top[metric]) < self._size:
+				heapq.heappush(self._top[metric], entry)
+			elif entry[0] > self._top[metric][0][0]:
+				heapq.heapreplace(self._top[metric], entry)
+
+	def get_top(self):
+		"""
+		Retrieves the best scores for each metric, best first
+
+		Returns
+		-------
+		dict
+			List of (player-score) JSON objects for each metric
+		"""
+		return {metric: [score for _, score in sorted(top, key=lambda entry: entry[0], reverse=True)]
+			for metric, top in self._top.items()}
+
+	def get_rank(self, score):
+		"""
+		Retrieves the rank the given score would have for each metric, where 1 is best and
+		scores tied with it are not counted against it
+
+		Parameters
+		----------
+		score : dict
+			(player-score) JSON object
+
+		Returns
+		-------
+		dict
+			Rank of the score for each metric
+		"""
+		ranks = {}
+		for metric, higher_better in METRICS.items():
+			value = score[metric]
+			better = sum(count for other, count in self._values[metric].items()
+				if (other > value if higher_better else other < value))
+			ranks[metric] = better + 1
+		return ranks
+
+	def get_count(self):
+		"""
+		Retrieves the number of scores added
+
+		Returns
+		-------
+		int
+			Number of scores ranked
+		"""
+		return self._count
@@ -0,0 +1,27 @@
+from ..Common.abstract_store import AbstractStore
+
+class MemoryStore(AbstractStore):
+	"""
+	Store of player names and scores held in memory, lost when the server stops
+
+	Parameters
+	----------
+	leaderboard_size : int, default 10
+		Number of top scores to keep for each leaderboard
+	"""
+	def __init__(self, leaderboard_size=10):
+		self._names = set()
+		self._scores = []
+		super().__init__(leaderboard_size)
+
+	def _reserve_name(self, name):
+		if name in self._names:
+			return False
+		self._names.add(name)
+		return True
+
+	def _add_scores(self, scores):
+		self._scores.extend(scores)
+
+	def _get_scores(self):
+		return list(self._scores)
@@ -0,0 +1,47 @@
+import json
+import sqlite3
+
+from ..Common.abstract_store import AbstractStore
+
+class SQLiteStore(AbstractStore):
+	"""
+	Store of player names and scores kept in an SQLite database, so scores persist
+	between runs of the server. Names are only reserved for the life of the server, so
+	they are cleared when the store is opened.
+
+	Parameters
+	----------
+	path : str
+		Path of the database file, created if it does not exist
+	leaderboard_size : int, default 10
+		Number of top scores to keep for each leaderboard
+	"""
+	def __init__(self, path, leaderboard_size=10):
+		self._path = path
+		self._db = None
+		super().__init__(leaderboard_size)
+
+	def _open(self):
+		self._db = sqlite3.connect(self._path)
+		self._db.execute("CREATE TABLE IF NOT EXISTS player_names (name TEXT PRIMARY KEY)")
+		self._db.execute("CREATE TABLE IF NOT EXISTS player_scores (id INTEGER PRIMARY KEY, score TEXT)")
+		self._db.execute("DELETE FROM player_names")
+		self._db.commit()
+
+	def _close(self):
+		self._db.close()
+
+	def _reserve_name(self, name):
+		# The primary key makes the insert fail if the name is in use
+		cursor = self._db.execute("INSERT OR IGNORE INTO player_names VALUES (?)", (name,))
+		self._db.commit()
+		return cursor.rowcount == 1
+
+	def _add_scores(self, scores):
+		self._db.executemany("INSERT INTO player_scores (score) VALUES (?)", 
+			[(json.dumps(score),) for score in scores])
+		self._db.commit()
+
+	def _get_scores(self):
+		rows = self._db.execute("SELECT score FROM player_scores ORDER BY id")
+		return [json.loads(score) for (score,) in rows]
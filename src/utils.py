@@ -1,40 +1,104 @@
 import json
 import os
 
-def parse_levels(file_name):
+class CachedJSON(dict):
 	"""
-	Parse all of the levels from the given file
+	JSON object which remembers its encoding the first time it is encoded, so an object
+	shared by many messages is only serialized once. It must not be mutated once encoded.
+	"""
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		self._encoded = None
+
+	def encode(self):
+		"""
+		Retrieves the JSON encoding of the object
+
+		Returns
+		-------
+		str
+			JSON encoding of the object
+		"""
+		if self._encoded is None:
+			self._encoded = json.dumps(self)
+		return self._encoded
+
+def encode_state(state):
+	"""
+	Encode a game state as JSON, reusing the cached encoding of the level if it has one
 
 	Parameters
 	----------
-	file_name : str
-		Name of the file to parse
-	
+	state : dict
+		(state) JSON object
+
 	Returns
 	-------
-	[JSON]
-		First JSON should be an int, rest should be level instances
+	str
+		JSON encoding of the state
+	"""
+	level = state.get('level')
+	if not isinstance(level, CachedJSON):
+		return json.dumps(state)
+
+	fields = [json.dumps(key) + ': ' + (level.encode() if key == 'level' else json.dumps(value))
+		for key, value in state.items()]
+	return '{' + ', '.join(fields) + '}'
+
+def iter_levels(file_name):
 	"""
-	jsons = []
+	Lazily parse the levels from the given file, one level at a time. Levels are separated
+	by blank lines, after the number of levels in the file.
+
+	Parameters
+	----------
+	file_name : str
+		Name of the file to parse
+
+	Yields
+	------
+	dict
+		Each level JSON in the file, in order
+	"""
+	first = True
 	json_strs = []
 
 	with open(os.path.join(os.getcwd(), file_name)) as f:
 		for line in f:
 			if line != '\n':
 				json_strs.append(line.strip())
+				continue
+			as_json = json.loads(' '.join(json_strs))
+			json_strs = []
+			if first:
+				if not isinstance(as_json, int):
+					raise ValueError("First JSON must be int")
+				first = False
 			else:
-				as_json = json.loads(' '.join(json_strs))
-				jsons.append(as_json)
-				json_strs = []
+				yield as_json
 
 	as_json = json.loads(' '.join(json_strs))
-	jsons.append(as_json)
+	if first:
+		if not isinstance(as_json, int):
+			raise ValueError("First JSON must be int")
+	else:
+		yield as_json
 
-	if len(jsons) < 1:
-		raise ValueError("Invalid levels file.")
-	elif not isinstance(jsons[0], int):
-		raise ValueError("First JSON must be int")
-	return jsons[1:]
+def parse_levels(file_name):
+	"""
+	Parse all of the levels from the given file
+
+	Parameters
+	----------
+	file_name : str
+		Name of the file to parse
+	
+	Returns
+	-------
+	[JSON]
+		Level JSON of each level in the file, after the number of levels
+	"""
+	return list(iter_levels(file_name))
 
 def build_player_update(player, level):
 	"""
@@ -71,7 +135,7 @@ def build_player_update(player, level):
 		"type": "player-update",
 		"layout": level.get_level_layout(visible_tiles),
 		"position": player.get_position(),
-		"objects": level.get_objects_json(visible_tiles),
+		"objects": level.get_objects_json(player_pos),
 		"actors": actors,
 		"message": None,
 		"health": player.get_health()
@@ -79,6 +143,53 @@ def build_player_update(player, level):
 
 	return player_state
 
+def build_player_update_delta(previous, update):
+	"""
+	Build a player update delta containing only the fields of the update that
+	differ from the previous update sent to the player
+
+	Parameters:
+	-----------
+	previous : dict
+		Last player update the player received (after applying any deltas)
+	update : dict
+		Current player update for the player
+	
+	Returns:
+	--------
+	dict or None
+		A player-update-delta, or None if nothing in the update changed
+	"""
+	delta = {"type": "player-update-delta"}
+	for field, value in update.items():
+		if field != "type" and previous.get(field) != value:
+			delta[field] = value
+
+	if len(delta) == 1:
+		return None
+	return delta
+
+def apply_player_update_delta(previous, delta):
+	"""
+	Apply a player update delta to the last player update received
+
+	Parameters:
+	-----------
+	previous : dict
+		Last player update received
+	delta : dict
+		Player update delta received
+	
+	Returns:
+	--------
+	dict
+		The full player update the delta describes
+	"""
+	update = dict(previous)
+	update.update(delta)
+	update["type"] = "player-update"
+	return update
+
 def send_end_level(players, who_unlocked):
 	"""
 	Compile the end level JSON to be sent to all the players
@@ -100,7 +211,7 @@ def send_end_level(players, who_unlocked):
 	}
 	
 	for p in players:
-		p.send_message(json.dumps(end_level_json))
+		p.send_message(end_level_json)
 
 def send_level_start(players, level_num):
 	"""
@@ -118,4 +229,4 @@ def send_level_start(players, level_num):
 	}
 	
 	for p in active_players:
-		p.send_message(json.dumps(start_level_json))
+		p.send_message(start_level_json)
@@ -1,17 +1,38 @@
+import asyncio
+import json
+import random
+import socket
 import unittest
 
 from src.Game.game_manager import GameManager
+from src.Game.level import LevelTemplate
 from src.utils import parse_levels
+from src.Player.remote_player import RemotePlayer
 from src.Player.test_player import TestPlayer
+from src.Remote.transport import FramedSocket
+from src.Store.memory_store import MemoryStore
+from src.utils import build_player_update
+
+class RecordingPlayer(TestPlayer):
+	"""
+	Test player which records the type of each update it recieves
+	"""
+	def __init__(self, name, moves):
+		self.update_types = []
+		self.message_types = []
+		super().__init__(name, moves)
+
+	def update_state(self, state):
+		self.update_types.append(state['type'])
+		super().update_state(state)
+
+	def send_message(self, msg):
+		self.message_types.append(msg['type'] if isinstance(msg, dict) else msg)
 
 class Test_GameManager(unittest.TestCase):
 	"""
-	Shuffled snarl1.levels tiles with seed=1
-	[(2, 7), (0, 2), (1, 3), (0, 1), (4, 5), (4, 0), (0, 5), (1, 1), 
-	(2, 1), (3, 5), (4, 2), (2, 4), (4, 6), (2, 5), (3, 3), (2, 6), 
-	(1, 2), (4, 1), (2, 2), (4, 3), (4, 7), (1, 6), (3, 2), (2, 3), 
-	(1, 5), (1, 4), (0, 0), (1, 7), (0, 3), (0, 6), (3, 1), (3, 0), 
-	(3, 6), (3, 4), (3, 7), (0, 7), (2, 0), (0, 4), (4, 4), (1, 0)]
+	With seed=160, the first player in snarl1.levels is placed at (1, 3) and the
+	zombie at (1, 1)
 	"""
 	def test_eject(self):
 		"""
@@ -19,7 +40,7 @@ class Test_GameManager(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -47,7 +68,7 @@ class Test_GameManager(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(1,4), (1,4), (3,4), (3,2), (2,1), (2,3),
 		(2,5), (2,6)])
 		# Register player and place actors
@@ -76,7 +97,7 @@ class Test_GameManager(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True, combat=True)
+		gm = GameManager(level_jsons, seed=160, local=True, combat=True)
 		p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -97,6 +118,171 @@ class Test_GameManager(unittest.TestCase):
 		self.assertEqual(p1.is_ejected(), True)
 		self.assertEqual(state['adversaries'][0]['position'], (2, 2))
 	
+	def test_async_turns(self):
+		"""
+		Test the coroutine game loop plays turns the same as the blocking loop
+		"""
+		# Read levels, create game manager and test player
+		level_jsons = parse_levels('resources/snarl1.levels')
+		gm = GameManager(level_jsons, seed=160, local=True)
+		p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
+		# Register player and place actors
+		asyncio.run(gm.register_player_async(p1))
+		gm._place_actors()
+		# Play two turns, ejecting player as in test_eject
+		asyncio.run(gm._play_turn_async())
+		self.assertEqual(p1.get_position(), (2, 3))
+		asyncio.run(gm._play_turn_async())
+		state = gm._current_level.build_state()
+		self.assertEqual(p1.is_ejected(), True)
+		self.assertEqual(state['adversaries'][0]['position'], (2, 2))
+		self.assertEqual(gm._is_level_over(), True)
+
+	def test_delta_updates(self):
+		"""
+		Test players only recieve deltas when their view changes, and applying
+		them gives the same view as a full update
+		"""
+		level_jsons = parse_levels('resources/snarl.levels')
+		gm = GameManager(level_jsons, seed=160, local=True, delta_updates=True)
+		p1 = RecordingPlayer("kyle", moves=[])
+		p2 = RecordingPlayer("divo", moves=[])
+		gm.register_player(p1)
+		gm.register_player(p2)
+		gm._start_level()
+		# Each player's first update of the level is a full update
+		self.assertEqual(p1.update_types, ['player-update'])
+		self.assertEqual(p2.update_types, ['player-update'])
+
+		for _ in range(10):
+			if gm._is_level_over():
+				break
+			gm._play_turn()
+			for player in (p1, p2):
+				if player.is_active():
+					full_update = build_player_update(player, gm._current_level)
+					self.assertEqual(player._player_state, full_update)
+
+		# Players skip their moves, so only adversary moves in view update them
+		for player in (p1, p2):
+			self.assertTrue(set(player.update_types[1:]) <= {'player-update-delta'})
+			self.assertLess(len(player.update_types), 1 + 10 * 3)
+
+	def test_shared_adversary_layout(self):
+		"""
+		Test local adversaries are given states sharing one layout of the level
+		"""
+		level_jsons = parse_levels('resources/snarl1.levels')
+		gm = GameManager(level_jsons, seed=160, local=True)
+		p1 = TestPlayer("kyle", moves=[(1,3), (1,3)])
+		gm.register_player(p1)
+		gm._place_actors()
+		zombie = gm._adversaries[0]
+
+		gm._play_turn()
+		first_state = zombie._state
+		gm._play_turn()
+		self.assertIsNot(zombie._state, first_state)
+		self.assertIs(zombie._state.get_layout(), first_state.get_layout())
+
+	def test_seeded_game(self):
+		"""
+		Test games with the same seed play out the same, whatever the state of the
+		random module
+		"""
+		level_jsons = parse_levels('resources/snarl.levels')
+		histories = []
+		for global_seed in (1, 2):
+			random.seed(global_seed)
+			gm = GameManager(level_jsons, seed=7, local=True, verbose=False, max_turns=30)
+			gm.register_player(TestPlayer("kyle", moves=[(0, 0)] * 100))
+			gm._place_actors()
+			history = []
+			for _ in range(30):
+				gm._play_turn()
+				state = gm._current_level.build_state()
+				history.append([(adv['name'], adv['position']) for adv in state['adversaries']])
+			histories.append(history)
+
+		self.assertEqual(histories[0], histories[1])
+
+	def test_async_end_game(self):
+		"""
+		Test a game played on the event loop ends by recording its scores and sending every
+		player the end game messages
+		"""
+		level_jsons = parse_levels('resources/snarl1.levels')
+		store = MemoryStore()
+		gm = GameManager(level_jsons, seed=160, verbose=False, max_turns=1, store=store)
+		p1 = RecordingPlayer("kyle", moves=[(1, 3)])
+		asyncio.run(gm.register_player_async(p1))
+		asyncio.run(gm.play_game_async())
+		self.assertEqual(p1.message_types[-2:], ["end-game", "server-scores"])
+		self.assertEqual([score['name'] for score in store.get_scores()], ["kyle"])
+		store.close()
+
+	def test_remote_end_game(self):
+		"""
+		Test every remote player recieves the end game messages, even though
+		disconnecting the first player exits
+		"""
+		level_jsons = parse_levels('resources/snarl1.levels')
+		gm = GameManager(level_jsons, seed=160, verbose=False)
+		clients = []
+		for name in ["kyle", "bob"]:
+			a, b = socket.socketpair()
+			# Only the first player is disconnected, stop reading the others on a timeout
+			a.settimeout(1)
+			client = FramedSocket(a)
+			# Answer the name request ahead of time
+			client.send(json.dumps(name))
+			client.flush()
+			gm.register_player(RemotePlayer(FramedSocket(b)))
+			clients.append(client)
+
+		with self.assertRaises(SystemExit):
+			gm.end_game()
+
+		for client in clients:
+			types = []
+			while True:
+				try:
+					msg = json.loads(client.receive())
+				except OSError:
+					break
+				types.append(msg['type'] if isinstance(msg, dict) else msg)
+			self.assertEqual(types[-2:], ["end-game", "server-scores"])
+			client.close()
+
+	def test_lazy_levels(self):
+		"""
+		Test levels are only built when the game reaches them, or prefetched while the level
+		before them is played
+		"""
+		level_jsons = parse_levels('resources/snarl.levels')
+		# Second level has overlapping rooms, but is never built
+		invalid = dict(level_jsons[1], rooms=level_jsons[1]['rooms'] * 2)
+		gm = GameManager([level_jsons[0], invalid], local=True, verbose=False)
+		with self.assertRaises(ValueError):
+			gm._build_level(2)
+
+		gm = GameManager(level_jsons, seed=160, local=True, verbose=False, prefetch=True)
+		gm.register_player(TestPlayer("kyle", moves=[]))
+		gm._start_level()
+		level_num, future = gm._prefetched
+		self.assertEqual(level_num, 2)
+		level = future.result()
+		self.assertIs(gm._build_level(2), level)
+		self.assertIsNone(gm._prefetched)
+
+		# Levels on shared templates are cheap to build, so they are built when reached
+		templates = [LevelTemplate(level_json) for level_json in level_jsons]
+		gm = GameManager(templates, seed=160, local=True, verbose=False, prefetch=True)
+		gm.register_player(TestPlayer("divo", moves=[]))
+		gm._start_level()
+		self.assertIsNone(gm._prefetched)
+		self.assertIs(gm._build_level(2).get_template(), templates[1])
+
 	def test_start_level_low(self):
 		"""
 		Test starting a game at start level less than 1
@@ -114,6 +300,16 @@ class Test_GameManager(unittest.TestCase):
 			GameManager([], 1)
 
 		self.assertTrue("Invalid level start number." in str(trial.exception))
+
+	def test_local_store(self):
+		"""
+		Test a local game refuses a shared store instead of ignoring it
+		"""
+		level_jsons = parse_levels('resources/snarl1.levels')
+		store = MemoryStore()
+		with self.assertRaises(ValueError):
+			GameManager(level_jsons, local=True, store=store, verbose=False)
+		store.close()
 	
 	def test_register_after_start(self):
 		"""
@@ -122,7 +318,7 @@ class Test_GameManager(unittest.TestCase):
 		with self.assertRaises(Exception) as trial:
 			# Generate game manager and two players
 			level_jsons = parse_levels('resources/snarl1.levels')
-			gm = GameManager(level_jsons, seed=1, local=True)
+			gm = GameManager(level_jsons, seed=160, local=True)
 			p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
 			p2 = TestPlayer("divo", moves=[(2,3), (2,2)])
 			# Register one player and play game
@@ -140,7 +336,7 @@ class Test_GameManager(unittest.TestCase):
 		with self.assertRaises(Exception) as trial:
 			# Generate game manager and five players
 			level_jsons = parse_levels('resources/snarl1.levels')
-			gm = GameManager(level_jsons, seed=1, local=True)
+			gm = GameManager(level_jsons, seed=160, local=True)
 			p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
 			p2 = TestPlayer("divo", moves=[(2,3), (2,2)])
 			p3 = TestPlayer("John", moves=[(2,3), (2,2)])
@@ -0,0 +1,175 @@
+import random
+import unittest
+
+from src.Adversary.local_zombie import LocalZombie
+from src.Game.level import Level, LevelTemplate
+from src.Player.test_player import TestPlayer
+from src.utils import parse_levels, encode_state
+import json
+
+class Test_Level(unittest.TestCase):
+	def test_region_index(self):
+		"""
+		Test the room and hallway lookups agree with searching each room and hallway's tiles
+		"""
+		for level_json in parse_levels('resources/snarl.levels'):
+			level = Level(level_json)
+			for tile in level.get_tiles():
+				row, col = tile.get_position()
+				rooms = [room for room in level._rooms if tile in room.get_tiles()]
+				hallways = [hallway for hallway in level._hallways if tile in hallway.get_tiles()]
+				self.assertEqual(level.tile_in_room(row, col), rooms[0] if rooms else None)
+				self.assertEqual(level.tile_in_hallway(row, col), hallways[0] if hallways else None)
+
+	def test_region_outside_level(self):
+		"""
+		Test positions outside of the level are in no room or hallway
+		"""
+		level = Level(parse_levels('resources/snarl1.levels')[0])
+		self.assertIsNone(level.tile_in_room(-1, 1))
+		self.assertIsNone(level.tile_in_room(1, 100))
+		self.assertIsNone(level.tile_in_hallway(100, 1))
+
+	def test_object_registry(self):
+		"""
+		Test keys and exits are tracked through the key being found and the exit unlocked
+		"""
+		level_json = parse_levels('resources/snarl1.levels')[0]
+		level = Level(level_json)
+		key_pos = tuple(level_json['objects'][0]['position'])
+		exit_pos = tuple(level_json['objects'][1]['position'])
+		self.assertEqual(level.get_exit_position(), exit_pos)
+		self.assertEqual(level.get_objects_json(), sorted([{"type": "key", "position": key_pos}, 
+			{"type": "exit", "position": exit_pos}], key=lambda obj: obj['position']))
+		# Only objects within the radius of the origin are visible
+		self.assertEqual(level.get_objects_json(key_pos, radius=0), [{"type": "key", "position": key_pos}])
+
+		level.remove_key("kyle")
+		level.unlock_exit()
+		self.assertFalse(level.get_tile(key_pos[0], key_pos[1]).has_key())
+		self.assertTrue(level.get_tile(exit_pos[0], exit_pos[1]).is_unlocked())
+		self.assertEqual(level.get_objects_json(), [{"type": "exit", "position": exit_pos}])
+		self.assertEqual(level.who_unlocked(), "kyle")
+		self.assertFalse(level.is_locked())
+
+	def test_occupant_index(self):
+		"""
+		Test actors added and removed through the level are in the state in row major order
+		"""
+		level = Level(parse_levels('resources/snarl1.levels')[0])
+		p1 = TestPlayer("kyle", moves=[])
+		zombie_1 = LocalZombie("zombie_1")
+		zombie_2 = LocalZombie("zombie_2")
+		for actor, pos in ((p1, (3, 4)), (zombie_1, (3, 2)), (zombie_2, (1, 5))):
+			actor.update_position(pos[0], pos[1])
+			self.assertTrue(level.add_person(actor, pos[0], pos[1]))
+		# Tile is already occupied
+		self.assertFalse(level.add_person(zombie_2, 3, 4))
+		self.assertEqual(level.get_tile(3, 4).get_person(), p1)
+
+		state = level.build_state()
+		self.assertEqual([adv['name'] for adv in state['adversaries']], ["zombie_2", "zombie_1"])
+		self.assertEqual(state['players'][0]['position'], (3, 4))
+
+		self.assertEqual(level.remove_person(3, 4), p1)
+		self.assertIsNone(level.get_tile(3, 4).get_person())
+		self.assertIsNone(level.get_actor_position(p1))
+		self.assertEqual(level.get_actor_position(zombie_1), (3, 2))
+		self.assertEqual(level.build_state()['players'], [])
+
+	def test_free_positions(self):
+		"""
+		Test the free positions are exactly the tiles actors are allowed to be placed on, as
+		actors move and the key is found
+		"""
+		level_json = parse_levels('resources/snarl.levels')[1]
+		level = Level(level_json)
+
+		def placeable():
+			return {tile.get_position() for tile in level.get_tiles() if tile.get_type() == 'space' and
+				level.tile_in_room(*tile.get_position()) is not None and tile.get_person() is None and
+				not tile.has_key() and not tile.is_exit()}
+
+		def free():
+			return {tile.get_position() for tile in level.get_tiles() if level.is_free(*tile.get_position())}
+
+		self.assertEqual(free(), placeable())
+		rand = random.Random(0)
+		zombie = LocalZombie("zombie")
+		pos = level.get_random_free_position(rand)
+		level.add_person(zombie, pos[0], pos[1])
+		self.assertFalse(level.is_free(pos[0], pos[1]))
+		for _ in range(20):
+			new_pos = level.get_random_free_position(rand)
+			level.remove_person(pos[0], pos[1])
+			level.add_person(zombie, new_pos[0], new_pos[1])
+			pos = new_pos
+			self.assertEqual(free(), placeable())
+
+		key_pos = level.get_objects_json()[0]['position']
+		level.remove_key("kyle")
+		self.assertTrue(level.is_free(key_pos[0], key_pos[1]))
+		self.assertEqual(free(), placeable())
+
+		# Fill every free tile but one
+		remaining = free()
+		while len(remaining) > 1:
+			pos = level.get_random_free_position(rand)
+			self.assertIn(pos, remaining)
+			level.add_person(LocalZombie("zombie"), pos[0], pos[1])
+			remaining.remove(pos)
+		self.assertEqual(free(), remaining)
+		self.assertEqual(level.get_random_free_position(rand), remaining.pop())
+
+	def test_cached_level_json(self):
+		"""
+		Test the level JSON is reused until the objects change, and states encode the same as
+		without the cache
+		"""
+		level = Level(parse_levels('resources/snarl1.levels')[0])
+		level_json = level.get_JSON()
+		self.assertIs(level.build_state()['level'], level_json)
+		version = level.get_version()
+
+		level.remove_key("kyle")
+		level.unlock_exit()
+		self.assertGreater(level.get_version(), version)
+		self.assertIsNot(level.get_JSON(), level_json)
+		self.assertIs(level.get_JSON()['rooms'], level_json['rooms'])
+		self.assertEqual([obj['type'] for obj in level.get_JSON()['objects']], ['exit'])
+
+		state = level.build_state()
+		self.assertEqual(json.loads(encode_state(state)), json.loads(json.dumps(state)))
+
+	def test_shared_template(self):
+		"""
+		Test levels played on the same template share its tiles, but not their actors, keys
+		or exits
+		"""
+		level_json = parse_levels('resources/snarl1.levels')[0]
+		template = LevelTemplate(level_json)
+		first = Level(template)
+		second = Level(template)
+		self.assertIs(first.get_all_tiles(), second.get_all_tiles())
+		self.assertEqual(first.get_JSON(), Level(level_json).get_JSON())
+
+		player = TestPlayer("p1", moves=[])
+		self.assertTrue(first.add_person(player, 3, 4))
+		first.remove_key("p1")
+		first.unlock_exit()
+		self.assertIs(first.get_tile(3, 4).get_person(), player)
+		self.assertIsNone(second.get_tile(3, 4).get_person())
+		self.assertFalse(first.is_free(3, 4))
+		self.assertTrue(second.is_free(3, 4))
+		self.assertEqual(first.player_in_room(3, 4), [(3, 4)])
+		self.assertEqual(second.player_in_room(3, 4), [])
+
+		key_pos = second.get_objects_json()[0]['position']
+		exit_pos = second.get_exit_position()
+		self.assertTrue(second.get_tile(*key_pos).has_key())
+		self.assertFalse(first.get_tile(*key_pos).has_key())
+		self.assertTrue(first.get_tile(*exit_pos).is_unlocked())
+		self.assertFalse(second.get_tile(*exit_pos).is_unlocked())
+
+if __name__ == '__main__':
+	unittest.main()
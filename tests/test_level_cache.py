@@ -0,0 +1,98 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.Game.level import Level, CompiledLevel
+from src.Game.level_cache import (load_levels, read_cache, write_cache, compile_levels,
+	get_cache_path, file_digest, HEADER, LEVEL_HEADER)
+from src.utils import parse_levels, iter_levels
+
+class Test_LevelCache(unittest.TestCase):
+	def setUp(self):
+		self._dir = tempfile.mkdtemp()
+		self._levels_file = os.path.join(self._dir, 'snarl.levels')
+		shutil.copy('resources/snarl.levels', self._levels_file)
+
+	def tearDown(self):
+		shutil.rmtree(self._dir)
+
+	def test_iter_levels(self):
+		"""
+		Test levels are streamed one at a time, the same as they are parsed
+		"""
+		levels = iter_levels('resources/snarl.levels')
+		self.assertEqual(next(levels), parse_levels('resources/snarl.levels')[0])
+		self.assertEqual(len(list(levels)), 2)
+
+	def test_cached_levels(self):
+		"""
+		Test levels loaded from the cache build the same levels as parsing them
+		"""
+		load_levels(self._levels_file)
+		self.assertTrue(os.path.exists(get_cache_path(self._levels_file)))
+		cached = load_levels(self._levels_file)
+
+		for level_json, cached_json in zip(parse_levels(self._levels_file), cached):
+			self.assertIsInstance(cached_json, CompiledLevel)
+			self.assertEqual(cached_json, level_json)
+			level = Level(level_json)
+			cached_level = Level(cached_json)
+			self.assertEqual(cached_level.get_JSON(), level.get_JSON())
+			self.assertEqual(cached_level.get_type_codes(), level.get_type_codes())
+			self.assertEqual(cached_level.get_region_index(), level.get_region_index())
+			self.assertEqual(cached_level.get_room_mask(), level.get_room_mask())
+
+	def test_stale_cache(self):
+		"""
+		Test the cache is rebuilt when the levels file changes
+		"""
+		load_levels(self._levels_file)
+		with open('resources/snarl1.levels') as src, open(self._levels_file, 'w') as dst:
+			dst.write(src.read())
+		self.assertEqual(load_levels(self._levels_file), parse_levels('resources/snarl1.levels'))
+
+	def test_truncated_cache(self):
+		"""
+		Test a cache cut short is not read, and is rebuilt on the next load
+		"""
+		load_levels(self._levels_file)
+		cache_path = get_cache_path(self._levels_file)
+		digest = file_digest(self._levels_file)
+		with open(self._levels_file, 'rb') as f:
+			self.assertEqual(digest, hashlib.sha256(f.read()).digest())
+		self.assertEqual(len(read_cache(cache_path, digest)), 3)
+
+		size = os.path.getsize(cache_path)
+		with open(cache_path, 'r+b') as f:
+			f.truncate(size - 10)
+		self.assertIsNone(read_cache(cache_path, digest))
+		self.assertEqual(load_levels(self._levels_file), parse_levels(self._levels_file))
+		self.assertEqual(os.path.getsize(cache_path), size)
+
+	def test_corrupt_cache(self):
+		"""
+		Test a cache with garbage after a valid header is not read, and is rebuilt on the
+		next load
+		"""
+		load_levels(self._levels_file)
+		cache_path = get_cache_path(self._levels_file)
+		digest = file_digest(self._levels_file)
+		size = os.path.getsize(cache_path)
+		with open(cache_path, 'r+b') as f:
+			f.seek(HEADER.size)
+			f.write(b'\xff' * (size - HEADER.size))
+		self.assertIsNone(read_cache(cache_path, digest))
+
+		# Level JSON which is not valid JSON
+		write_cache(cache_path, digest, compile_levels(iter_levels(self._levels_file)))
+		with open(cache_path, 'r+b') as f:
+			f.seek(HEADER.size + LEVEL_HEADER.size)
+			f.write(b'garbage')
+		self.assertIsNone(read_cache(cache_path, digest))
+		self.assertEqual(load_levels(self._levels_file), parse_levels(self._levels_file))
+		self.assertEqual(len(read_cache(cache_path, digest)), 3)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from src.Game.level import Level
+from src.Game.level_generator import LevelGenerator
+from src.Game.synthetic_levels import grid_level_json, random_level_json
+
+def room_json(origin, size=4):
+	return {"type": "room", "origin": origin, "bounds": {"rows": size, "columns": size},
+		"layout": [[1] * size for _ in range(size)]}
+
+def hallway_json(start, end, waypoints=[]):
+	return {"type": "hallway", "from": start, "to": end, "waypoints": waypoints}
+
+class Test_LevelGenerator(unittest.TestCase):
+	def test_overlaps(self):
+		"""
+		Test rooms and hallways overlapping anything already in the level are rejected
+		"""
+		rooms = [room_json([0, 1]), room_json([0, 9])]
+		LevelGenerator({"rooms": rooms, "hallways": [hallway_json([2, 4], [2, 9])]})
+
+		with self.assertRaises(ValueError):
+			LevelGenerator({"rooms": rooms + [room_json([3, 4])], "hallways": []})
+		with self.assertRaises(ValueError):
+			LevelGenerator({"rooms": rooms, "hallways": [hallway_json([2, 4], [2, 9]),
+				hallway_json([1, 4], [6, 6], [[6, 6]])]})
+		with self.assertRaises(ValueError):
+			LevelGenerator({"rooms": rooms + [room_json([10, 5])], "hallways": [
+				hallway_json([2, 4], [2, 9]), hallway_json([10, 6], [1, 4], [[1, 6]])]})
+
+	def test_hallway_ends(self):
+		"""
+		Test hallways must start and end on the boundaries of two different rooms
+		"""
+		rooms = [room_json([0, 1]), room_json([0, 9])]
+		with self.assertRaises(ValueError):
+			LevelGenerator({"rooms": rooms, "hallways": [hallway_json([2, 4], [2, 8])]})
+		with self.assertRaises(ValueError):
+			LevelGenerator({"rooms": rooms, "hallways": [hallway_json([0, 2], [3, 4], [[0, 4]])]})
+
+	def test_large_level(self):
+		"""
+		Test every room and hallway of a large level is built, with a door at each hallway end
+		"""
+		level_json = grid_level_json(20)
+		generator = LevelGenerator(level_json)
+		self.assertEqual(len(generator.get_rooms()), 400)
+		self.assertEqual(len(generator.get_hallways()), len(level_json['hallways']))
+		tiles = generator.get_whole_level()
+		for hallway in level_json['hallways']:
+			for row, col in (hallway['from'], hallway['to']):
+				self.assertEqual(tiles[row][col].get_type(), 'door')
+
+	def test_random_levels(self):
+		"""
+		Test random levels are valid, fit in the given size, connect every room and place the
+		key and exit inside of rooms, and are the same for the same seed
+		"""
+		for seed in range(10):
+			for num_rooms, height, width in ((1, 8, 8), (2, 10, 20), (12, 60, 40), (100, 300, 300)):
+				level_json = random_level_json(num_rooms, height, width, seed=seed)
+				level = Level(level_json)
+				self.assertEqual(len(level_json['rooms']), num_rooms)
+				self.assertLessEqual(level.get_dimensions()[0], height)
+				self.assertLessEqual(level.get_dimensions()[1], width)
+
+				first = level.tile_in_room(*level_json['rooms'][0]['origin'])
+				reached = [first]
+				for room in reached:
+					pos = (room.get_row(), room.get_col())
+					reached += [other for other in level.get_reachable_rooms(*pos) if other not in reached]
+				self.assertEqual(len(reached), num_rooms)
+
+				for obj in level_json['objects']:
+					pos = obj['position']
+					self.assertEqual(level.get_tile(*pos).get_type(), 'space')
+					self.assertIsNotNone(level.tile_in_room(*pos))
+
+		self.assertEqual(random_level_json(50, 200, 200, seed=3), random_level_json(50, 200, 200, seed=3))
+		self.assertNotEqual(random_level_json(50, 200, 200, seed=3), random_level_json(50, 200, 200, seed=4))
+		with self.assertRaises(ValueError):
+			random_level_json(100, 50, 50)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 from src.Game.game_manager import GameManager
+from src.Game.move_result import MoveCode, MoveResult
 from src.Game.rule_checker import RuleChecker
 from src.utils import parse_levels
 from src.Player.test_player import TestPlayer
@@ -30,7 +31,7 @@ class Test_RuleChecker(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -46,7 +47,7 @@ class Test_RuleChecker(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -67,7 +68,7 @@ class Test_RuleChecker(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -83,7 +84,7 @@ class Test_RuleChecker(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -98,7 +99,7 @@ class Test_RuleChecker(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(1,5), (2,2)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -114,7 +115,7 @@ class Test_RuleChecker(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(3,3),(3,2),(2,1)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -131,7 +132,7 @@ class Test_RuleChecker(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(3,3),(3,2),(2,1)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -146,7 +147,7 @@ class Test_RuleChecker(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(3,3),(3,2),(2,1)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -161,7 +162,7 @@ class Test_RuleChecker(unittest.TestCase):
 		"""
 		# Read levels, create game manager and test player
 		level_jsons = parse_levels('resources/snarl1.levels')
-		gm = GameManager(level_jsons, seed=1, local=True)
+		gm = GameManager(level_jsons, seed=160, local=True)
 		p1 = TestPlayer("kyle", moves=[(3,3),(3,2),(2,1)])
 		# Register player and place actors
 		gm.register_player(p1)
@@ -180,6 +181,66 @@ class Test_RuleChecker(unittest.TestCase):
 		self.assertEqual(rule_checker.allowed_actor_placement((-1,6)), False)
 		# Placing actor on wall
 		self.assertEqual(rule_checker.allowed_actor_placement((0,0)), False)
+
+	def test_shared_rule_checker(self):
+		"""
+		Test one rule checker is used for each level, and sees the moves made in it
+		"""
+		level_jsons = parse_levels('resources/snarl1.levels')
+		gm = GameManager(level_jsons, seed=160, local=True)
+		p1 = TestPlayer("kyle", moves=[(2,3)])
+		gm.register_player(p1)
+		gm._place_actors()
+
+		rule_checker = gm._get_rule_checker()
+		self.assertEqual(rule_checker.player_move_result(p1, 2, 3), "OK")
+		gm.move_player(p1, 2, 3)
+		self.assertIs(gm._get_rule_checker(), rule_checker)
+		# Player has moved off of their old tile, and onto the new one
+		self.assertEqual(rule_checker.player_move_result(p1, 1, 3), "OK")
+		zombie = gm._adversaries[0]
+		self.assertEqual(rule_checker.adversary_move_result(zombie, 1, 2), "OK")
+		self.assertEqual(rule_checker.adversary_move_result(zombie, 0, 1), "Invalid")
+
+	def test_batched_move_results(self):
+		"""
+		Test validating a batch of moves gives the same results as validating each move
+		"""
+		level_jsons = parse_levels('resources/snarl.levels')
+		gm = GameManager(level_jsons, start_level_num=2, seed=160, local=True, combat=True)
+		p1 = TestPlayer("kyle", moves=[])
+		gm.register_player(p1)
+		gm._place_actors()
+		rule_checker = gm._get_rule_checker()
+
+		for actor in [p1] + gm._adversaries:
+			row, col = actor.get_position()
+			candidates = [(row + d_row, col + d_col) for d_row in range(-3, 4) for d_col in range(-3, 4)]
+			if actor is p1:
+				results = rule_checker.player_move_results(actor, candidates)
+				expected = [rule_checker.player_move_result(actor, r, c) for r, c in candidates]
+			else:
+				results = rule_checker.adversary_move_results(actor, candidates)
+				expected = [rule_checker.adversary_move_result(actor, r, c) for r, c in candidates]
+			self.assertEqual(results, expected)
+			self.assertIn("OK", results)
+		self.assertEqual(rule_checker.player_move_results(None, candidates), ['Nonexistent'] * len(candidates))
+
+	def test_move_result_codes(self):
+		"""
+		Test move results are shared, carry their damage, and match the protocol messages
+		"""
+		damage = MoveResult.of_damage(40)
+		self.assertIs(damage, MoveResult.of_damage(40))
+		self.assertEqual(damage.code, MoveCode.DAMAGE)
+		self.assertEqual(damage.damage, 40)
+		self.assertEqual(str(damage), "Damage-40")
+		self.assertEqual(damage, "Damage-40")
+		self.assertNotEqual(damage, MoveResult.of_damage(60))
+		self.assertEqual(str(MoveResult.EJECT), "Eject")
+		self.assertIn(MoveResult.INVALID, ('Nonexistent', 'Invalid'))
+		self.assertFalse(MoveResult.NONEXISTENT.is_valid())
+		self.assertTrue(MoveResult.TELEPORT.is_valid())
 	
 	
 	
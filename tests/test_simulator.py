@@ -0,0 +1,75 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.Game.simulator import Simulator, run_parallel
+from src.Player.ai_player import AIPlayer
+from src.utils import parse_levels
+
+class Test_Simulator(unittest.TestCase):
+	def test_run(self):
+		"""
+		Test simulated games play to the end without printing, and are summarized
+		"""
+		level_jsons = parse_levels('resources/snarl.levels')
+		simulator = Simulator(level_jsons, num_players=2, max_turns=100)
+		output = io.StringIO()
+		with contextlib.redirect_stdout(output):
+			report = simulator.run(5)
+
+		self.assertEqual(output.getvalue(), '')
+		self.assertEqual(report['games'], 5)
+		self.assertGreater(report['turns'], 0)
+		self.assertEqual(len(report['level-completions']), len(level_jsons))
+		# A level can only be completed by games that completed the levels before it
+		completions = report['level-completions']
+		self.assertEqual(completions, sorted(completions, reverse=True))
+		self.assertEqual(report['success-rate'], completions[-1] / 5)
+
+	def test_max_turns(self):
+		"""
+		Test a level ends once the max number of turns is played
+		"""
+		simulator = Simulator(parse_levels('resources/snarl1.levels'), max_turns=1)
+		result = simulator.play_game(0)
+		self.assertEqual(result['turns'], 1)
+		self.assertFalse(result['successful'])
+
+	def test_run_parallel(self):
+		"""
+		Test games played across worker processes have the same outcome as in one process
+		"""
+		options = {"num_players": 2, "max_turns": 100, "seed": 3}
+		report = Simulator(parse_levels('resources/snarl.levels'), **options).run(6)
+		# Use a copy of the levels, so their compiled cache is not written into resources
+		with tempfile.TemporaryDirectory() as temp_dir:
+			levels_file = os.path.join(temp_dir, 'snarl.levels')
+			shutil.copy('resources/snarl.levels', levels_file)
+			parallel_report = run_parallel(levels_file, 6, workers=2, **options)
+
+		for stat in ('games', 'turns', 'success-rate', 'exits-per-game', 'ejects-per-game',
+			'keys-per-game', 'level-completions'):
+			self.assertEqual(parallel_report[stat], report[stat])
+
+	def test_ai_player_heads_for_key(self):
+		"""
+		Test the AI player moves towards the key it can see, and away from adversaries
+		"""
+		player = AIPlayer("kyle", seed=0)
+		player.update_position(2, 2)
+		layout = [[1] * 5 for _ in range(5)]
+		player.update_state({"type": "player-update", "layout": layout, "position": (2, 2),
+			"objects": [{"type": "key", "position": (4, 2)}], "actors": [], "message": None})
+		self.assertEqual(player.request_move(), (4, 2))
+
+		player.update_state({"type": "player-update", "layout": layout, "position": (2, 2),
+			"objects": [{"type": "key", "position": (4, 2)}], 
+			"actors": [{"type": "zombie", "name": "z", "position": (3, 1)}], "message": None})
+		move = player.request_move()
+		self.assertGreater(abs(move[0] - 3) + abs(move[1] - 1), 1)
+
+if __name__ == '__main__':
+	unittest.main()
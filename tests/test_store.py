@@ -0,0 +1,127 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+
+from src.Store.leaderboard import Leaderboard
+from src.Store.memory_store import MemoryStore
+from src.Store.sqlite_store import SQLiteStore
+
+SCORE = {"type": "player-score", "name": "kyle", "exits": 1, "ejects": 0, "keys": 1}
+
+class Test_Store(unittest.TestCase):
+	def setUp(self):
+		self._tmp_dir = tempfile.TemporaryDirectory()
+		self._db_path = os.path.join(self._tmp_dir.name, 'scores.db')
+
+	def tearDown(self):
+		self._tmp_dir.cleanup()
+
+	def test_reserve_name(self):
+		"""
+		Test a name can only be reserved once
+		"""
+		for store in (MemoryStore(), SQLiteStore(self._db_path)):
+			self.assertTrue(store.reserve_name("kyle"))
+			self.assertFalse(store.reserve_name("kyle"))
+			self.assertTrue(store.reserve_name("divo"))
+			store.close()
+
+	def test_concurrent_reservations(self):
+		"""
+		Test each name is reserved exactly once when many threads reserve at once
+		"""
+		store = MemoryStore()
+		reserved = []
+		threads = [threading.Thread(target=lambda i=i: reserved.append(store.reserve_name(f"p{i % 10}")))
+			for i in range(100)]
+		for t in threads:
+			t.start()
+		for t in threads:
+			t.join()
+		store.close()
+		self.assertEqual(reserved.count(True), 10)
+
+	def test_scores_persist(self):
+		"""
+		Test SQLite scores are kept between stores, while reserved names are not
+		"""
+		store = SQLiteStore(self._db_path)
+		store.reserve_name("kyle")
+		store.add_scores([SCORE])
+		store.close()
+
+		store = SQLiteStore(self._db_path)
+		self.assertEqual(store.get_scores(), [SCORE])
+		self.assertTrue(store.reserve_name("kyle"))
+		store.close()
+
+	def test_closed_store(self):
+		"""
+		Test using a store after it is closed raises an error
+		"""
+		store = MemoryStore()
+		store.add_scores([SCORE])
+		store.close()
+		with self.assertRaises(ValueError):
+			store.get_scores()
+
+	def test_leaderboard_top(self):
+		"""
+		Test only the best scores are kept for each metric, best first
+		"""
+		leaderboard = Leaderboard(size=2)
+		for name, exits, ejects, keys in (("a", 1, 2, 0), ("b", 3, 0, 1), ("c", 2, 1, 2), ("d", 3, 4, 0)):
+			leaderboard.add({"type": "player-score", "name": name, "exits": exits, "ejects": ejects, "keys": keys})
+
+		top = leaderboard.get_top()
+		self.assertEqual([score['name'] for score in top['exits']], ["b", "d"])
+		self.assertEqual([score['name'] for score in top['ejects']], ["b", "c"])
+		self.assertEqual([score['name'] for score in top['keys']], ["c", "b"])
+		self.assertEqual(leaderboard.get_count(), 4)
+
+	def test_leaderboard_rank(self):
+		"""
+		Test scores are ranked against every score added, with ties sharing a rank
+		"""
+		store = MemoryStore(leaderboard_size=1)
+		store.add_scores([dict(SCORE, name="divo", exits=2, ejects=1)])
+		ranks = store.add_scores([SCORE, dict(SCORE, name="evan", exits=0, keys=0)])
+		self.assertEqual(ranks[0], {"exits": 2, "ejects": 1, "keys": 1})
+		self.assertEqual(ranks[1], {"exits": 3, "ejects": 1, "keys": 3})
+
+		leaderboards, total = store.get_leaderboard()
+		self.assertEqual(total, 3)
+		self.assertEqual(leaderboards['exits'][0]['name'], "divo")
+		store.close()
+
+	def test_async_scores(self):
+		"""
+		Test scores added and leaderboards fetched from a coroutine match the blocking calls
+		"""
+		store = MemoryStore()
+		async def end_game():
+			ranks = await store.add_scores_async([SCORE])
+			return ranks, await store.get_leaderboard_async()
+
+		ranks, (leaderboards, total) = asyncio.run(end_game())
+		self.assertEqual(ranks, [{"exits": 1, "ejects": 1, "keys": 1}])
+		self.assertEqual(total, 1)
+		self.assertEqual((leaderboards, total), store.get_leaderboard())
+		store.close()
+
+	def test_leaderboard_reloaded(self):
+		"""
+		Test an SQLite store ranks the scores it already has when opened
+		"""
+		store = SQLiteStore(self._db_path)
+		store.add_scores([SCORE])
+		store.close()
+
+		store = SQLiteStore(self._db_path)
+		self.assertEqual(store.get_leaderboard(), ({"exits": [SCORE], "ejects": [SCORE], "keys": [SCORE]}, 1))
+		store.close()
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from src.Game.level import Level
+from src.Game.game_manager import GameManager
+from src.Game.tile_grid import TileGrid, SPACE, DOOR
+from src.Player.test_player import TestPlayer
+from src.utils import parse_levels
+
+class Test_TileGrid(unittest.TestCase):
+	def test_matches_nested_level(self):
+		"""
+		Test a compact level has the same tiles, objects and layout as a nested list level
+		"""
+		for level_json in parse_levels('resources/snarl.levels'):
+			level = Level(level_json)
+			compact = Level(level_json, compact=True)
+			self.assertIsInstance(compact.get_all_tiles(), TileGrid)
+			self.assertEqual(compact.get_JSON(), level.get_JSON())
+			self.assertEqual(compact.get_level_layout(compact.get_all_tiles()),
+				level.get_level_layout(level.get_all_tiles()))
+			self.assertEqual(compact.get_exit_position(), level.get_exit_position())
+			for tile in level.get_tiles():
+				row, col = tile.get_position()
+				self.assertEqual(compact.get_tile(row, col), tile)
+				room = level.tile_in_room(row, col)
+				compact_room = compact.tile_in_room(row, col)
+				if room is None:
+					self.assertIsNone(compact_room)
+				else:
+					self.assertEqual(compact_room.get_JSON(), room.get_JSON())
+			self.assertIsNone(compact.get_tile(len(level.get_all_tiles()), 0))
+
+	def test_views(self):
+		"""
+		Test views read the tile type from the grid
+		"""
+		grid = TileGrid(3, 4)
+		grid.set_type(1, 1, SPACE)
+		grid.set_type(1, 2, DOOR)
+		self.assertEqual(grid[1][2].get_type(), "door")
+		self.assertEqual(grid.get_tile(1, 1).get_type(), "space")
+		self.assertEqual(grid[-1][-1].get_type(), "wall")
+		self.assertEqual(grid[1][1], grid.get_tile(1, 1))
+		with self.assertRaises(IndexError):
+			grid[3]
+
+	def test_compact_game(self):
+		"""
+		Test a game played on compact levels matches the eject scenario of the nested list levels
+		"""
+		level_jsons = parse_levels('resources/snarl1.levels')
+		gm = GameManager(level_jsons, seed=160, local=True, compact=True)
+		p1 = TestPlayer("kyle", moves=[(2,3), (2,2)])
+		gm.register_player(p1)
+		gm._place_actors()
+		self.assertEqual(p1.get_position(), (1, 3))
+		gm._play_turn()
+		self.assertEqual(p1.get_position(), (2, 3))
+		gm._play_turn()
+		state = gm._current_level.build_state()
+		self.assertEqual(p1.is_ejected(), True)
+		self.assertEqual(state['adversaries'][0]['position'], (2, 2))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import socket
+import threading
+import unittest
+
+from src.Remote.transport import FramedSocket, encode_frame, read_frame
+
+class Test_Transport(unittest.TestCase):
+	def test_messages_not_merged(self):
+		"""
+		Test consecutive messages sent before reading are recieved separately
+		"""
+		a, b = socket.socketpair()
+		sender = FramedSocket(a)
+		reciever = FramedSocket(b)
+		sender.send(json.dumps("move"))
+		sender.send(json.dumps({"type": "move", "to": [1, 2]}))
+		sender.flush()
+
+		self.assertEqual(json.loads(reciever.receive()), "move")
+		self.assertEqual(json.loads(reciever.receive()), {"type": "move", "to": [1, 2]})
+		a.close()
+		b.close()
+
+	def test_large_message(self):
+		"""
+		Test a message larger than a single socket read is not truncated
+		"""
+		a, b = socket.socketpair()
+		sender = FramedSocket(a)
+		reciever = FramedSocket(b)
+		layout = [[1] * 300 for _ in range(300)]
+		msg = json.dumps({"type": "state", "layout": layout})
+		# Send from another thread, the message does not fit in the socket buffer
+		def send():
+			sender.send(msg)
+			sender.flush()
+		t = threading.Thread(target=send)
+		t.start()
+		self.assertEqual(reciever.receive(), msg)
+		t.join()
+		a.close()
+		b.close()
+
+	def test_sends_queued_until_flush(self):
+		"""
+		Test queued messages are not written until flushed, then arrive together
+		"""
+		a, b = socket.socketpair()
+		sender = FramedSocket(a)
+		sender.send(json.dumps("OK"))
+		sender.send(json.dumps({"type": "player-update"}))
+		b.setblocking(False)
+		with self.assertRaises(BlockingIOError):
+			b.recv(4096)
+
+		sender.flush()
+		data = b.recv(4096)
+		self.assertEqual(data, encode_frame('"OK"') + encode_frame('{"type": "player-update"}'))
+		a.close()
+		b.close()
+
+	def test_receive_flushes(self):
+		"""
+		Test recieving sends queued messages first, as the other end may be
+		waiting on them before it replies
+		"""
+		a, b = socket.socketpair()
+		client = FramedSocket(a)
+		server = FramedSocket(b)
+		server.send(json.dumps("move"))
+
+		def reply():
+			client.receive()
+			client.send(json.dumps({"type": "move", "to": [0, 0]}))
+			client.flush()
+		t = threading.Thread(target=reply)
+		t.start()
+		self.assertEqual(json.loads(server.receive())['to'], [0, 0])
+		t.join()
+		a.close()
+		b.close()
+
+	def test_closed_connection(self):
+		"""
+		Test recieving from a closed connection raises a connection error
+		"""
+		a, b = socket.socketpair()
+		reciever = FramedSocket(b)
+		a.close()
+		with self.assertRaises(ConnectionError):
+			reciever.receive()
+		b.close()
+
+	def test_read_frame(self):
+		"""
+		Test the asyncio reader splits a stream of frames into messages
+		"""
+		async def read_all():
+			reader = asyncio.StreamReader()
+			reader.feed_data(encode_frame('"a"') + encode_frame('"bc"'))
+			reader.feed_eof()
+			first = await read_frame(reader)
+			second = await read_frame(reader)
+			with self.assertRaises(ConnectionError):
+				await read_frame(reader)
+			return first, second
+
+		self.assertEqual(asyncio.run(read_all()), ('"a"', '"bc"'))
+
+if __name__ == '__main__':
+	unittest.main()